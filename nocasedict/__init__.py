@@ -5,5 +5,14 @@ nocasedict - A case-insensitive ordered dictionary for Python
 
 from ._version import __version__, __version_tuple__  # noqa: F401
 from ._nocasedict import *  # noqa: F403,F401
+from ._nocasekey import *  # noqa: F403,F401
 from ._hashable import *  # noqa: F403,F401
 from ._keyableby import *  # noqa: F403,F401
+from ._nocasedefaultdict import *  # noqa: F403,F401
+from ._nocasecounter import *  # noqa: F403,F401
+from ._nocaserecord import *  # noqa: F403,F401
+from ._casefoldcache import *  # noqa: F403,F401
+from ._keyintern import *  # noqa: F403,F401
+from ._nocaselrucache import *  # noqa: F403,F401
+from ._nocasettldict import *  # noqa: F403,F401
+from ._weakvaluenocasedict import *  # noqa: F403,F401
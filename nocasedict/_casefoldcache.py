@@ -0,0 +1,326 @@
+"""
+This module provides an opt-in, process-wide cache for the casefolded keys
+used by :class:`nocasedict.NocaseDict`.
+"""
+
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Union
+
+__all__ = ['enable_casefold_cache', 'disable_casefold_cache',
+           'casefold_cache_info', 'prewarm_casefold_cache',
+           'CasefoldCacheInfo']
+
+# The eviction policies supported by the casefold cache.
+CASEFOLD_CACHE_POLICIES = ('lru', 'fifo')
+
+# The casefold caches, by casefold function. `None` if the casefold cache is
+# disabled. There is one cache per distinct casefold function, so that
+# subclasses of NocaseDict that override __casefold__() get their own cache.
+# Casefold methods that are bound to an object are unwrapped to their
+# function, so that dictionaries of the same class share the cache and are
+# not kept alive by it.
+_CACHES: Optional[Dict[Callable, '_CasefoldCache']] = None
+
+# Parameters for creating new casefold caches, while the cache is enabled.
+_MAXSIZE = 0
+_POLICY = 'lru'
+
+
+class CasefoldCacheInfo(NamedTuple):
+    """
+    Statistics about the casefold cache for one casefold function, as returned
+    by :func:`~nocasedict.casefold_cache_info`.
+
+    Modeled after the ``CacheInfo`` tuple of :func:`py:functools.lru_cache`.
+    """
+
+    #: Number of lookups that found the key in the cache.
+    hits: int
+
+    #: Number of lookups that did not find the key in the cache.
+    misses: int
+
+    #: Number of keys that were removed from the cache to make room.
+    evictions: int
+
+    #: Maximum number of keys in the cache.
+    maxsize: int
+
+    #: Current number of keys in the cache.
+    currsize: int
+
+    #: Eviction policy of the cache ('lru' or 'fifo').
+    policy: str
+
+
+class _CasefoldCache:
+    """
+    A bounded memo of original key -> casefolded key for a single casefold
+    function.
+    """
+
+    def __init__(self, maxsize: int, policy: str) -> None:
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # The LRU policy needs move_to_end() on hits, the FIFO policy works
+        # with the insertion order of the standard dict.
+        self._data: Dict[Any, Any] = \
+            OrderedDict() if policy == 'lru' else {}
+
+    def lookup(self, key: Any, casefold: Callable) -> Any:
+        """
+        Return the casefolded key, from the cache if possible, or by calling
+        the casefold function.
+        """
+        data = self._data
+        try:
+            folded = data[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            if self.policy == 'lru':
+                try:
+                    data.move_to_end(key)  # type: ignore
+                except KeyError:
+                    pass  # Evicted by another thread in the meantime
+            return folded
+        self.misses += 1
+        folded = casefold(key)
+        self.add(key, folded)
+        return folded
+
+    def add(self, key: Any, folded: Any) -> None:
+        """
+        Add a key and its casefolded key to the cache, evicting the oldest
+        key if the cache is full.
+        """
+        data = self._data
+        data[key] = folded
+        while len(data) > self.maxsize:
+            try:
+                del data[next(iter(data))]
+            except (KeyError, StopIteration, RuntimeError):
+                break  # Modified by another thread in the meantime
+            self.evictions += 1
+
+    def info(self) -> CasefoldCacheInfo:
+        """
+        Return the statistics of the cache.
+        """
+        return CasefoldCacheInfo(self.hits, self.misses, self.evictions,
+                                 self.maxsize, len(self._data), self.policy)
+
+
+def cached_casefold(casefold: Callable, key: Any) -> Any:
+    """
+    Return the casefolded key using the cache for the casefold function.
+
+    Only keys of type :class:`py:str` and :class:`py:bytes` are cached; other
+    keys are casefolded without using the cache.
+
+    This function is used by :class:`~nocasedict.NocaseDict` and must only be
+    called while the casefold cache is enabled.
+    """
+    if key.__class__ is not str and key.__class__ is not bytes:
+        return casefold(key)
+    func = getattr(casefold, '__func__', casefold)
+    try:
+        cache = _CACHES[func]  # type: ignore
+    except KeyError:
+        cache = _CasefoldCache(_MAXSIZE, _POLICY)
+        _CACHES[func] = cache  # type: ignore
+    except TypeError:
+        # The cache has been disabled in the meantime
+        return casefold(key)
+    return cache.lookup(key, casefold)
+
+
+def enable_casefold_cache(maxsize: int = 4096, policy: str = 'lru') -> None:
+    """
+    Enable the process-wide cache for casefolded keys.
+
+    When enabled, :class:`~nocasedict.NocaseDict` objects look up the
+    casefolded form of :class:`py:str` and :class:`py:bytes` keys in a bounded
+    cache before calling the :meth:`~nocasedict.NocaseDict.__casefold__`
+    method. This pays off for workloads that use a limited vocabulary of keys
+    very often, and in particular for classes that override
+    :meth:`~nocasedict.NocaseDict.__casefold__` with an expensive method (e.g.
+    one that performs Unicode normalization).
+
+    There is one cache per distinct casefold method, so the casefolded keys
+    of :class:`~nocasedict.NocaseDict` subclasses that override
+    :meth:`~nocasedict.NocaseDict.__casefold__` are kept separately.
+
+    The casefold method must be deterministic, i.e. return the same result
+    every time for the same key. Otherwise, the cache must not be used.
+
+    If the cache is already enabled, it is reset and re-created with the new
+    parameters.
+
+    Parameters:
+
+      maxsize (int): Maximum number of keys in the cache for each casefold
+        method. Must be positive.
+
+      policy (str): Eviction policy that determines which key is removed when
+        the cache is full:
+
+        - 'lru': The least recently used key.
+        - 'fifo': The least recently added key. Hits are somewhat cheaper
+          than with 'lru'.
+
+    Raises:
+      ValueError: Invalid maxsize or policy.
+    """
+    global _CACHES, _MAXSIZE, _POLICY  # pylint: disable=global-statement
+    if maxsize <= 0:
+        raise ValueError(f"Invalid maxsize for casefold cache: {maxsize!r}")
+    if policy not in CASEFOLD_CACHE_POLICIES:
+        raise ValueError(f"Invalid policy for casefold cache: {policy!r}")
+    _MAXSIZE = maxsize
+    _POLICY = policy
+    _CACHES = {}
+    _update_inline_str_casefold()
+
+
+def disable_casefold_cache() -> None:
+    """
+    Disable the process-wide cache for casefolded keys, and discard all cached
+    keys and statistics.
+
+    Disabling a cache that is not enabled is not an error.
+    """
+    global _CACHES  # pylint: disable=global-statement
+    _CACHES = None
+    _update_inline_str_casefold()
+
+
+def casefold_cache_info(
+        dict_class: Optional[type] = None) -> Optional[CasefoldCacheInfo]:
+    """
+    Return the statistics of the casefold cache used by a dictionary class.
+
+    Parameters:
+
+      dict_class (type): :class:`~nocasedict.NocaseDict` or a subclass
+        thereof. Subclasses that do not override
+        :meth:`~nocasedict.NocaseDict.__casefold__` share the cache of their
+        base class. `None` means :class:`~nocasedict.NocaseDict`.
+
+    Returns:
+      CasefoldCacheInfo: The statistics of the cache, or `None` if the
+      casefold cache is not enabled. If the cache has not been used yet for
+      the casefold method of the class, all counters are 0.
+    """
+    if _CACHES is None:
+        return None
+    func = _casefold_func(_casefold_method(dict_class))
+    try:
+        return _CACHES[func].info()
+    except KeyError:
+        return CasefoldCacheInfo(0, 0, 0, _MAXSIZE, 0, _POLICY)
+
+
+def prewarm_casefold_cache(
+        keys: Union[str, Iterable[Any]],
+        dict_class: Optional[type] = None) -> int:
+    """
+    Add keys to the casefold cache used by a dictionary class, so that they
+    are already cached when used for the first time.
+
+    This is typically done at startup, using a vocabulary of the frequently
+    used keys.
+
+    The casefold cache must be enabled. If the cache becomes full, keys
+    are evicted according to its eviction policy.
+
+    Parameters:
+
+      keys (str or iterable): The keys to be added, as one of:
+
+        - an iterable of keys (:class:`py:str` or :class:`py:bytes`).
+
+        - a string that is the path name of a vocabulary file. The file is
+          read as UTF-8 and must contain one key per line. Leading and
+          trailing whitespace is removed, and empty lines and lines starting
+          with '#' are ignored.
+
+      dict_class (type): :class:`~nocasedict.NocaseDict` or a subclass
+        thereof, whose casefold method is used. `None` means
+        :class:`~nocasedict.NocaseDict`.
+
+    Returns:
+      int: Number of keys that have been added.
+
+    Raises:
+      RuntimeError: The casefold cache is not enabled.
+      OSError: Error reading the vocabulary file.
+    """
+    if _CACHES is None:
+        raise RuntimeError("The casefold cache is not enabled")
+    if isinstance(keys, str):
+        keys = _read_vocabulary(keys)
+    casefold = _casefold_method(dict_class)
+    func = _casefold_func(casefold)
+    count = 0
+    for key in keys:
+        if key.__class__ is str or key.__class__ is bytes:
+            # Not using lookup() so that the statistics are not affected.
+            try:
+                cache = _CACHES[func]
+            except KeyError:
+                cache = _CasefoldCache(_MAXSIZE, _POLICY)
+                _CACHES[func] = cache
+            cache.add(key, casefold(key))
+            count += 1
+    return count
+
+
+def _casefold_method(dict_class: Optional[type]) -> Callable:
+    """
+    Return the casefold method of a NocaseDict class.
+    """
+    if dict_class is None:
+        dict_class = _nocasedict_class()
+    return dict_class.__casefold__  # type: ignore
+
+
+def _casefold_func(casefold: Callable) -> Callable:
+    """
+    Return the function of a casefold method, as used as a key for the
+    casefold caches.
+    """
+    return getattr(casefold, '__func__', casefold)
+
+
+def _nocasedict_class() -> type:
+    """
+    Return the NocaseDict class. Imported late to avoid a cyclic import.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ._nocasedict import NocaseDict
+    return NocaseDict
+
+
+def _update_inline_str_casefold() -> None:
+    """
+    Update the NocaseDict class for the enabled state of the casefold cache.
+    Imported late to avoid a cyclic import.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ._nocasedict import update_inline_str_casefold
+    update_inline_str_casefold()
+
+
+def _read_vocabulary(filename: str) -> Iterable[str]:
+    """
+    Return the keys from a vocabulary file.
+    """
+    with open(filename, encoding='utf-8') as fp:
+        lines = [line.strip() for line in fp]
+    return [line for line in lines if line and not line.startswith('#')]
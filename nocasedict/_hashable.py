@@ -3,8 +3,8 @@ This module provides class HashableMixin.
 """
 
 
-from typing import Any
-from ._nocasedict import NocaseDict
+from typing import Any, Optional, Tuple
+from ._nocasedict import NocaseDict, Key, _OMITTED
 
 __all__ = ['HashableMixin']
 
@@ -34,6 +34,12 @@ class HashableMixin(NocaseDict):
     or updated, while the dictionary object is used as a key (in another
     dictionary) or as a set member.
 
+    The hash value is calculated when it is needed for the first time, and is
+    cached in the dictionary object until the dictionary is modified through
+    one of its methods. Values that are modified in place (e.g. a list value
+    that is appended to) do not cause the cached hash value to be
+    recalculated, but hashable values are usually immutable anyway.
+
     See `hashable <https://docs.python.org/3/glossary.html#term-hashable>`_
     for more details.
 
@@ -53,11 +59,93 @@ class HashableMixin(NocaseDict):
         # 'foo'
     """
 
+    # The cached hash value, or `None` if it needs to be calculated. The slot
+    # is not set in new objects.
+    __slots__ = ('_hash_value',)
+    _hash_value: Optional[int]
+
     def __hash__(self) -> Any:
         """
         Return a case-insensitive and order-insensitive hash value for the
         dictionary.
         """
-        fs = frozenset([(knc, self.__getitem__(knc))
-                        for knc in self.keys_nocase()])
-        return hash(fs)
+        try:
+            hash_value = self._hash_value
+        except AttributeError:
+            hash_value = None
+        if hash_value is None:
+            # The casefolded keys are used directly, without casefolding them
+            # again for looking up their values.
+            # pylint: disable=protected-access
+            fs = frozenset(self._data.items())
+            hash_value = hash(fs)
+            self._hash_value = hash_value
+        return hash_value
+
+    def __setstate__(self, state: Any) -> None:
+        """
+        Restore the state of the dictionary when unpickling or copying it.
+
+        The cached hash value is not restored, because the hash values of
+        strings differ between Python processes.
+        """
+        # The state is a dict with the attributes, or a tuple of that dict
+        # and a dict with the slots, as created by the default pickle
+        # protocol for objects.
+        slot_state = None
+        if isinstance(state, tuple):
+            state, slot_state = state
+        if state:
+            self.__dict__.update(state)
+        if slot_state:
+            for name, value in slot_state.items():
+                if name != '_hash_value':
+                    setattr(self, name, value)
+
+    # The methods that modify the dictionary invalidate the cached hash value.
+
+    # update() invalidates the hash value also when it adds items in bulk,
+    # bypassing __setitem__().
+    _bulk_setitem = True
+
+    def __setitem__(self, key: Key, value: Any) -> None:
+        self._hash_value = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Key) -> None:
+        self._hash_value = None
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs) -> None:
+        # pylint: disable=arguments-differ,signature-differs
+        self._hash_value = None
+        super().update(*args, **kwargs)
+
+    def pop(self, key: Key, default: Any = _OMITTED) -> Any:
+        self._hash_value = None
+        return super().pop(key, default)
+
+    def popitem(self) -> Tuple[Key, Any]:
+        self._hash_value = None
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._hash_value = None
+        super().clear()
+
+    def setdefault(self, key: Key, default: Any = None) -> Any:
+        self._hash_value = None
+        return super().setdefault(key, default)
+
+    def set_folded(self, k: Key, key: Key, value: Any) -> None:
+        self._hash_value = None
+        super().set_folded(k, key, value)
+
+    def del_folded(self, k: Key) -> None:
+        self._hash_value = None
+        super().del_folded(k)
+
+    def _modifying(self) -> None:
+        # Invoked by methods of subclasses that modify the items directly,
+        # e.g. the in-place operators of NocaseCounter.
+        self._hash_value = None
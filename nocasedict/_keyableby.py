@@ -42,4 +42,5 @@ def KeyableByMixin(key_attr: str) -> Type:
         #         'B': <__main__.Obj object at 0x10bc89af0>})
     """
     return type(f'KeyableByMixin_{key_attr}',
-                (), {'nocasedict_KeyableByMixin_key_attr': key_attr})
+                (), {'nocasedict_KeyableByMixin_key_attr': key_attr,
+                     '__slots__': ()})
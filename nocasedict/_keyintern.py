@@ -0,0 +1,181 @@
+"""
+This module provides opt-in, process-wide interning of the keys stored in
+:class:`nocasedict.NocaseDict` objects.
+"""
+
+
+import sys
+from typing import Any, NamedTuple, Optional, Tuple
+
+__all__ = ['enable_key_interning', 'disable_key_interning',
+           'key_interning_info', 'KeyInterningInfo']
+
+# The intern pool. `None` if key interning is disabled.
+_POOL: Optional['_InternPool'] = None
+
+
+class KeyInterningInfo(NamedTuple):
+    """
+    Statistics about key interning, as returned by
+    :func:`~nocasedict.key_interning_info`.
+    """
+
+    #: Number of keys that were found in the intern pool.
+    hits: int
+
+    #: Number of keys that were not found in the intern pool and were added.
+    misses: int
+
+    #: Number of keys that were removed from the intern pool to make room.
+    evictions: int
+
+    #: Maximum number of keys in the intern pool.
+    maxsize: int
+
+    #: Current number of keys in the intern pool.
+    currsize: int
+
+    #: Number of bytes of the key objects that were replaced with an equal
+    #: key object from the intern pool. This is an estimate of the memory
+    #: saved, that assumes the replaced key objects are not referenced
+    #: elsewhere.
+    saved_bytes: int
+
+
+class _InternPool:
+    """
+    A bounded pool of key objects, where the oldest key is removed when the
+    pool is full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_bytes = 0
+        self._data: dict = {}
+
+    def intern(self, key: Any) -> Any:
+        """
+        Return the key object from the pool that is equal to the key, adding
+        the key to the pool if it is not in the pool.
+
+        Only keys of type :class:`py:str` and :class:`py:bytes` are interned;
+        other keys are returned unchanged.
+        """
+        if key.__class__ is not str and key.__class__ is not bytes:
+            return key
+        data = self._data
+        pooled = data.get(key)
+        if pooled is not None:
+            self.hits += 1
+            if pooled is not key:
+                self.saved_bytes += sys.getsizeof(key)
+            return pooled
+        self.misses += 1
+        data[key] = key
+        while len(data) > self.maxsize:
+            try:
+                del data[next(iter(data))]
+            except (KeyError, StopIteration, RuntimeError):
+                break  # Modified by another thread in the meantime
+            self.evictions += 1
+        return key
+
+    def info(self) -> KeyInterningInfo:
+        """
+        Return the statistics of the pool.
+        """
+        return KeyInterningInfo(self.hits, self.misses, self.evictions,
+                                self.maxsize, len(self._data),
+                                self.saved_bytes)
+
+
+def interned_keys(key: Any, k: Any) -> Tuple[Any, Any]:
+    """
+    Return the interned forms of an original key and its casefolded key.
+
+    This function is used by :class:`~nocasedict.NocaseDict` when storing
+    keys.
+    """
+    pool = _POOL
+    if pool is None:
+        # Key interning has been disabled in the meantime
+        return key, k
+    key = pool.intern(key)
+    if k.__class__ is key.__class__ and k == key:
+        return key, key
+    return key, pool.intern(k)
+
+
+def enable_key_interning(maxsize: int = 65536) -> None:
+    """
+    Enable the process-wide interning of the keys stored in
+    :class:`~nocasedict.NocaseDict` objects.
+
+    When enabled, :class:`~nocasedict.NocaseDict` objects replace the original
+    keys and casefolded keys of type :class:`py:str` and :class:`py:bytes`
+    they store with an equal key object from a bounded intern pool, so that
+    equal keys in different dictionaries share one key object. This saves
+    memory when the same keys are created many times, e.g. when the keys
+    come from parsing JSON or XML documents.
+
+    Keys are interned when items are added with ``ncd[key] = value``,
+    :meth:`~nocasedict.NocaseDict.setdefault`, and when initializing or
+    updating dictionaries from objects that are not
+    :class:`~nocasedict.NocaseDict` objects. Keys that were stored before
+    interning was enabled are not interned.
+
+    If key interning is already enabled, the intern pool is reset and
+    re-created with the new parameters.
+
+    Parameters:
+
+      maxsize (int): Maximum number of keys in the intern pool. Must be
+        positive. When the pool is full, the least recently added key is
+        removed from the pool.
+
+    Raises:
+      ValueError: Invalid maxsize.
+    """
+    global _POOL  # pylint: disable=global-statement
+    if maxsize <= 0:
+        raise ValueError(f"Invalid maxsize for key interning: {maxsize!r}")
+    _POOL = _InternPool(maxsize)
+    _update_inline_str_casefold()
+
+
+def disable_key_interning() -> None:
+    """
+    Disable the process-wide interning of keys, and discard the intern pool
+    and its statistics. Keys that have already been interned remain shared.
+
+    Disabling key interning that is not enabled is not an error.
+    """
+    global _POOL  # pylint: disable=global-statement
+    _POOL = None
+    _update_inline_str_casefold()
+
+
+def key_interning_info() -> Optional[KeyInterningInfo]:
+    """
+    Return the statistics of key interning.
+
+    Returns:
+      KeyInterningInfo: The statistics of key interning, or `None` if key
+      interning is not enabled.
+    """
+    if _POOL is None:
+        return None
+    return _POOL.info()
+
+
+def _update_inline_str_casefold() -> None:
+    """
+    Update the NocaseDict class for the enabled state of key interning.
+    Imported late to avoid a cyclic import.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ._nocasedict import update_inline_str_casefold
+    update_inline_str_casefold()
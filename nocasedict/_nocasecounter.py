@@ -0,0 +1,511 @@
+"""
+This module provides class NocaseCounter, a case-insensitive dictionary for
+counting keys.
+"""
+
+
+import heapq
+from collections.abc import Mapping
+from itertools import chain, repeat, starmap
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._nocasedict import NocaseDict, Key, _OMITTED
+
+__all__ = ['NocaseCounter']
+
+
+class NocaseCounter(NocaseDict):
+    """
+    A case-insensitive and case-preserving ordered dictionary for counting
+    keys, like :class:`py:collections.Counter`.
+
+    The values of the dictionary are the counts of the keys. Looking up a key
+    that does not exist with ``ncc[key]`` returns 0 without adding an item.
+    Counts may be zero or negative.
+
+    Counting keys with :meth:`update` casefolds each key once, whereas the
+    ``ncd[key] = ncd.get(key, 0) + 1`` idiom on
+    :class:`~nocasedict.NocaseDict` casefolds each key twice. For keys that
+    are already counted, the key of the item is kept, so the keys of the
+    counter have the lexical case in which they were first counted.
+
+    Counting the items of another :class:`~nocasedict.NocaseDict` object
+    (including :class:`~nocasedict.NocaseCounter` objects) that uses the same
+    casefold method uses its casefolded keys without casefolding them again.
+    This applies to :meth:`update`, :meth:`subtract` and the arithmetic
+    operators.
+
+    The arithmetic operators ``+``, ``-``, ``|`` and ``&`` and their in-place
+    variants combine counters like for :class:`py:collections.Counter`. Their
+    results only have the items with positive counts. Note that ``|`` is the
+    maximum of the counts, not the union of dictionaries.
+
+    Example::
+
+        from nocasedict import NocaseCounter
+
+        counter = NocaseCounter(['Dog', 'Cat', 'DOG'])
+
+        print(counter['dog'])
+        # 2
+
+        print(counter.most_common(1))
+        # [('Dog', 2)]
+
+    Parameters:
+
+      iterable (iterable): The keys to be counted, or a mapping with counts
+        by key.
+
+      **kwargs: Counts by key.
+
+    Raises:
+      AttributeError: The key does not have the casefold method.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, iterable: Optional[Any] = None, /, **kwargs) -> None:
+        super().__init__()
+        self.update(iterable, **kwargs)
+
+    def __missing__(self, key: Key) -> int:
+        """
+        Return 0 for a key that does not exist, without adding an item.
+
+        This method is called by :meth:`~nocasedict.NocaseDict.__getitem__`
+        for keys that do not exist.
+        """
+        # pylint: disable=unused-argument
+        return 0
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Delete the item with the key (looked up case-insensitively), if it
+        exists. Unlike for :class:`~nocasedict.NocaseDict`, no exception is
+        raised if the key does not exist.
+
+        Invoked when using: ``del ncc[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        k = self._casefolded_key(key)
+        if k in self._data:
+            self.del_folded(k)
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None) -> 'NocaseCounter':
+        """
+        Not supported, like for :class:`py:collections.Counter`.
+
+        Raises:
+          NotImplementedError: Always.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__}.fromkeys() is undefined. Use "
+            f"{cls.__name__}(iterable) instead.")
+
+    def total(self) -> Any:
+        """
+        Return the sum of the counts.
+        """
+        return sum(self._data.values())
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Key, Any]]:
+        """
+        Return a list of the items with the highest counts, as tuples of key
+        and count, from the highest to the lowest count. Items with equal
+        counts are in dictionary iteration order.
+
+        If `n` is specified, at most `n` items are returned, using a heap of
+        `n` items instead of sorting all items. The original keys are only
+        looked up for the returned items.
+
+        Parameters:
+
+          n (int): Maximum number of items to be returned, or `None` for all
+            items.
+        """
+        if n is None:
+            items = sorted(self._data.items(), key=itemgetter(1),
+                           reverse=True)
+        else:
+            items = heapq.nlargest(n, self._data.items(), key=itemgetter(1))
+        keys = self._keys
+        return [(keys.get(k, k), count) for k, count in items]
+
+    def elements(self) -> Iterator[Key]:
+        """
+        Return an iterator over the keys, where each key is repeated as many
+        times as its count. Keys with a count less than one are skipped.
+        """
+        return chain.from_iterable(starmap(repeat, self.items()))
+
+    def update(self, iterable: Optional[Any] = None, /, **kwargs) -> None:
+        # pylint: disable=arguments-differ
+        """
+        Count the keys from an iterable, or add the counts from a mapping.
+
+        Unlike for :class:`~nocasedict.NocaseDict`, the counts are added to
+        the existing counts instead of replacing them, like for
+        :class:`py:collections.Counter`. Existing items keep their key.
+
+        Each key of an iterable is casefolded once. If the mapping is a
+        :class:`~nocasedict.NocaseDict` object that uses the same casefold
+        method, its casefolded keys are used directly.
+
+        Parameters:
+
+          iterable (iterable): The keys to be counted, or a mapping with counts
+            by key.
+
+          **kwargs: Counts by key, to be added after the iterable.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        if iterable is not None:
+            if isinstance(iterable, Mapping):
+                self._update_counts(iterable, 1)
+            else:
+                self._count_keys(iterable, 1)
+        if kwargs:
+            self._update_counts(kwargs, 1)
+
+    def subtract(self, iterable: Optional[Any] = None, /, **kwargs) -> None:
+        """
+        Subtract the counts of the keys from an iterable, or subtract the
+        counts from a mapping, like :meth:`py:collections.Counter.subtract`.
+
+        Counts may become zero or negative. Keys are casefolded like for
+        :meth:`update`.
+
+        Parameters:
+
+          iterable (iterable): The keys to be counted, or a mapping with counts
+            by key.
+
+          **kwargs: Counts by key, to be subtracted after the iterable.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        if iterable is not None:
+            if isinstance(iterable, Mapping):
+                self._update_counts(iterable, -1)
+            else:
+                self._count_keys(iterable, -1)
+        if kwargs:
+            self._update_counts(kwargs, -1)
+
+    def _count_keys(self, iterable: Iterable[Key], count: int) -> None:
+        """
+        Add a count to each key from an iterable, casefolding each key once.
+        """
+        self._modifying()
+        data = self._data
+        get = data.get
+        inline = self._inline_str_casefold
+        omitted = _OMITTED
+        for key in iterable:
+            if isinstance(key, str) and inline:
+                k: Key = key.casefold()
+            else:
+                k = self._casefolded_key(key)
+            current = get(k, omitted)
+            if current is omitted:
+                self._add_count(k, key, count)
+            else:
+                data[k] = current + count
+
+    def _add_count(self, k: Key, key: Key, count: Any) -> None:
+        """
+        Add an item with a casefolded key that does not exist, its original
+        key, and a count.
+        """
+        k, key = self._stored_key(key, k)
+        self._store_item(k, key, count)
+
+    def _update_counts(self, mapping: Mapping, sign: int) -> None:
+        """
+        Add (sign 1) or subtract (sign -1) the counts from a mapping.
+        """
+        if isinstance(mapping, NocaseDict) and \
+                mapping.__casefold__ is self.__casefold__:
+            self._update_folded(mapping, sign)
+            return
+        self._modifying()
+        data = self._data
+        for key, count in mapping.items():
+            if sign < 0:
+                count = -count
+            k = self._casefolded_key(key)
+            current = data.get(k, _OMITTED)
+            if current is _OMITTED:
+                self._add_count(k, key, count)
+            else:
+                data[k] = current + count
+
+    def _update_folded(self, other: NocaseDict, sign: int) -> None:
+        """
+        Add (sign 1) or subtract (sign -1) the counts from another NocaseDict
+        object with the same casefold method, using its casefolded keys.
+        """
+        # pylint: disable=protected-access
+        self._modifying()
+        data = self._data
+        other_data = other._data
+        if not data and sign > 0:
+            # The counter gets the same keys as the other dictionary, so their
+            # original keys can be shared.
+            data.update(other_data)
+            self._keys = other._share_keys()
+            return
+        other_keys = other._keys
+        keys = None
+        get = data.get
+        for k, count in other_data.items():
+            if sign < 0:
+                count = -count
+            current = get(k, _OMITTED)
+            if current is _OMITTED:
+                data[k] = count
+                key = other_keys.get(k, _OMITTED)
+                if key is not _OMITTED:
+                    if keys is None:
+                        keys = self._private_keys()
+                    keys[k] = key
+            else:
+                data[k] = current + count
+
+    def _same_casefold(self, other: 'NocaseCounter') -> 'NocaseCounter':
+        """
+        Return the other counter, or if it uses a different casefold method,
+        a counter of this class with its counts.
+        """
+        if other.__casefold__ is self.__casefold__:
+            return other
+        return self.__class__(other)
+
+    def _from_folded(self, data: Dict[Key, Any],
+                     other: Optional[NocaseDict] = None) -> 'NocaseCounter':
+        """
+        Return a new counter with the counts by casefolded key, whose original
+        keys are those of this counter, or for keys that are not in this
+        counter, those of the other counter.
+        """
+        # pylint: disable=protected-access
+        result = self.__class__()
+        if result._data_class is not dict:
+            data = result._data_class(data)
+        result._data = data
+        keys = {k: key for k, key in self._keys.items() if k in data}
+        if other is not None and other._keys:
+            self_data = self._data
+            keys.update((k, key) for k, key in other._keys.items()
+                        if k in data and k not in self_data)
+        if keys:
+            result._keys = keys
+        return result
+
+    def _keep_positive(self) -> 'NocaseCounter':
+        """
+        Remove the items with counts that are not positive, and return the
+        counter.
+        """
+        for k in [k for k, count in self._data.items() if not count > 0]:
+            self.del_folded(k)
+        return self
+
+    def __add__(self, other: Any) -> 'NocaseCounter':
+        """
+        Return a new counter with the sums of the counts, keeping the items
+        with positive counts.
+
+        Invoked when using e.g.: ``ncc + other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        other = self._same_casefold(other)
+        other_data = other._data  # pylint: disable=protected-access
+        self_data = self._data
+        get = other_data.get
+        data = {}
+        for k, count in self_data.items():
+            count = count + get(k, 0)
+            if count > 0:
+                data[k] = count
+        for k, count in other_data.items():
+            if k not in self_data and count > 0:
+                data[k] = count
+        return self._from_folded(data, other)
+
+    def __sub__(self, other: Any) -> 'NocaseCounter':
+        """
+        Return a new counter with the differences of the counts, keeping the
+        items with positive counts.
+
+        Invoked when using e.g.: ``ncc - other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        other = self._same_casefold(other)
+        other_data = other._data  # pylint: disable=protected-access
+        self_data = self._data
+        get = other_data.get
+        data = {}
+        for k, count in self_data.items():
+            count = count - get(k, 0)
+            if count > 0:
+                data[k] = count
+        for k, count in other_data.items():
+            if k not in self_data and count < 0:
+                data[k] = 0 - count
+        return self._from_folded(data, other)
+
+    def __or__(self, other: Any) -> 'NocaseCounter':
+        """
+        Return a new counter with the maximums of the counts, keeping the
+        items with positive counts.
+
+        Invoked when using e.g.: ``ncc | other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        other = self._same_casefold(other)
+        other_data = other._data  # pylint: disable=protected-access
+        self_data = self._data
+        get = other_data.get
+        data = {}
+        for k, count in self_data.items():
+            other_count = get(k, 0)
+            count = other_count if count < other_count else count
+            if count > 0:
+                data[k] = count
+        for k, count in other_data.items():
+            if k not in self_data and count > 0:
+                data[k] = count
+        return self._from_folded(data, other)
+
+    def __ror__(self, other: Any) -> Any:
+        # The dictionary union of NocaseDict does not apply to counters.
+        return NotImplemented
+
+    def __and__(self, other: Any) -> 'NocaseCounter':
+        """
+        Return a new counter with the minimums of the counts, keeping the
+        items with positive counts.
+
+        Invoked when using e.g.: ``ncc & other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        other = self._same_casefold(other)
+        get = other._data.get  # pylint: disable=protected-access
+        data = {}
+        for k, count in self._data.items():
+            other_count = get(k, 0)
+            count = count if count < other_count else other_count
+            if count > 0:
+                data[k] = count
+        return self._from_folded(data)
+
+    def __pos__(self) -> 'NocaseCounter':
+        """
+        Return a new counter with the items with positive counts.
+
+        Invoked when using: ``+ncc``
+        """
+        return self._from_folded(
+            {k: count for k, count in self._data.items() if count > 0})
+
+    def __neg__(self) -> 'NocaseCounter':
+        """
+        Return a new counter with the items with negative counts, with the
+        counts negated.
+
+        Invoked when using: ``-ncc``
+        """
+        return self._from_folded(
+            {k: 0 - count for k, count in self._data.items() if count < 0})
+
+    def __iadd__(self, other: Any) -> 'NocaseCounter':
+        """
+        Add the counts of the other counter, and keep the items with positive
+        counts.
+
+        Invoked when using: ``ncc += other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        self._update_folded(self._same_casefold(other), 1)
+        return self._keep_positive()
+
+    def __isub__(self, other: Any) -> 'NocaseCounter':
+        """
+        Subtract the counts of the other counter, and keep the items with
+        positive counts.
+
+        Invoked when using: ``ncc -= other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        self._update_folded(self._same_casefold(other), -1)
+        return self._keep_positive()
+
+    def __ior__(self, other: Any) -> 'NocaseCounter':
+        """
+        Update the counts to the maximums of the counts of both counters, and
+        keep the items with positive counts.
+
+        Invoked when using: ``ncc |= other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        other = self._same_casefold(other)
+        self._modifying()
+        # pylint: disable=protected-access
+        data = self._data
+        other_keys = other._keys
+        for k, count in other._data.items():
+            current = data.get(k, _OMITTED)
+            if current is _OMITTED:
+                self._add_count(k, other_keys.get(k, k), count)
+            elif current < count:
+                data[k] = count
+        return self._keep_positive()
+
+    def __iand__(self, other: Any) -> 'NocaseCounter':
+        """
+        Update the counts to the minimums of the counts of both counters, and
+        keep the items with positive counts.
+
+        Invoked when using: ``ncc &= other``
+        """
+        if not isinstance(other, NocaseCounter):
+            return NotImplemented
+        get = self._same_casefold(other)._data.get  # pylint: disable=W0212
+        self._modifying()
+        data = self._data
+        for k, count in data.items():
+            other_count = get(k, 0)
+            if other_count < count:
+                data[k] = other_count
+        return self._keep_positive()
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the counter that is suitable for
+        debugging.
+
+        The order of items is from the highest to the lowest count, like for
+        :class:`py:collections.Counter`, and the keys are in the original
+        lexical case.
+
+        Invoked when using e.g.: ``repr(ncc)``
+        """
+        items = [f"{key!r}: {count!r}" for key, count in self.most_common()]
+        items_str = ', '.join(items)
+        return f"{self.__class__.__name__}({{{items_str}}})"
@@ -0,0 +1,153 @@
+"""
+This module provides class NocaseDefaultDict, a case-insensitive dictionary
+that adds items with a default value for missing keys.
+"""
+
+
+from typing import Any, Callable, Optional
+
+from ._nocasedict import NocaseDict, Key
+from ._nocasekey import NocaseKey
+
+__all__ = ['NocaseDefaultDict']
+
+
+class NocaseDefaultDict(NocaseDict):
+    """
+    A case-insensitive and case-preserving ordered dictionary that adds an
+    item with a default value when a key that does not exist is looked up
+    with ``ncd[key]``, like :class:`py:collections.defaultdict`.
+
+    The default value is created by calling the default factory without
+    arguments. If the default factory is `None`, :exc:`py:KeyError` is raised
+    for keys that do not exist, like for :class:`~nocasedict.NocaseDict`.
+
+    Looking up a key that does not exist casefolds the key once and adds the
+    item once, whereas the ``ncd.setdefault(key, []).append(value)`` idiom
+    creates the default value also for keys that exist.
+
+    Only ``ncd[key]`` adds items. Other methods such as
+    :meth:`~nocasedict.NocaseDict.get`, ``key in ncd`` and comparisons do not
+    add items.
+
+    Since the class defines ``__slots__``, it cannot be combined with
+    :class:`~nocasedict.HashableMixin`.
+
+    Example::
+
+        from nocasedict import NocaseDefaultDict
+
+        classes_by_name = NocaseDefaultDict(list)
+        for cls in classes:
+            classes_by_name[cls.name].append(cls)
+
+    Parameters:
+
+      default_factory (callable): Function without parameters that returns
+        the default value, or `None`.
+
+      *args, **kwargs: The initial items, like for
+        :class:`~nocasedict.NocaseDict`.
+
+    Raises:
+      TypeError: The default factory is not callable or `None`.
+    """
+
+    __slots__ = ('default_factory',)
+
+    def __init__(self, default_factory: Optional[Callable[[], Any]] = None,
+                 *args, **kwargs) -> None:
+        # pylint: disable=keyword-arg-before-vararg
+        if default_factory is not None and not callable(default_factory):
+            raise TypeError(
+                "First argument must be callable or None, but is "
+                f"{type(default_factory)}")
+        #: Function without parameters that returns the default value for
+        #: keys that do not exist, or `None`.
+        self.default_factory = default_factory
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, key: Key) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively), or if the key does not exist, add an item with
+        the key and a default value from the default factory, and return that
+        value.
+
+        Invoked when using e.g.: ``value = ncd[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively) and the default
+            factory is `None`.
+        """
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        elif isinstance(key, NocaseKey) and self._inline_str_casefold:
+            k = key._folded  # pylint: disable=protected-access
+        else:
+            k = self._casefolded_key(key)
+        try:
+            return self._data[k]
+        except KeyError:
+            pass
+        if self.__class__.__missing__ is not NocaseDefaultDict.__missing__:
+            return self.__missing__(key)
+        # Adds the item without casefolding the key again
+        return self._add_default(k, key)
+
+    def __missing__(self, key: Key) -> Any:
+        """
+        Add an item with the key that does not exist and a default value from
+        the default factory, and return that value.
+
+        This method is called by :meth:`__getitem__` for keys that do not
+        exist.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: The default factory is `None`.
+        """
+        return self._add_default(self._casefolded_key(key), key)
+
+    def _add_default(self, k: Key, key: Key) -> Any:
+        """
+        Add an item with the casefolded key and original key that does not
+        exist and a default value from the default factory, and return that
+        value.
+        """
+        default_factory = self.default_factory
+        if default_factory is None:
+            raise KeyError(f"Key {key!r} not found")
+        value = default_factory()
+        k, key = self._stored_key(key, k)
+        self._store_item(k, key, value)
+        return value
+
+    def copy(self) -> 'NocaseDefaultDict':
+        """
+        Return a copy of the dictionary with the same default factory, like
+        :meth:`NocaseDict.copy`.
+        """
+        result = self.__class__(self.default_factory)
+        # pylint: disable=protected-access
+        result._data = self._data.copy()
+        result._keys = self._share_keys()
+        return result
+
+    def __ror__(self, other: Any) -> 'NocaseDefaultDict':
+        result = self.__class__(self.default_factory, other)
+        result.update(self)
+        return result
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the dictionary that is suitable for
+        debugging, including its default factory.
+
+        Invoked when using e.g.: ``repr(ncd)``
+        """
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        items_str = ', '.join(items)
+        return (f"{self.__class__.__name__}({self.default_factory!r}, "
+                f"{{{items_str}}})")
@@ -27,13 +27,23 @@
 #
 
 """
-The only class exposed by this package is :class:`nocasedict.NocaseDict`.
+This module provides class NocaseDict, a case-insensitive and case-preserving
+ordered dictionary. It is the base class of the other dictionary classes of
+this package.
 """
 
 
 import os
-from collections.abc import MutableMapping, KeysView, ValuesView, ItemsView
-from typing import Any, AnyStr, NoReturn, Optional, Iterator, Tuple, Dict
+from itertools import compress
+from operator import itemgetter, ne
+from collections.abc import Mapping, MutableMapping, KeysView, ValuesView, \
+    ItemsView, Collection
+from typing import Any, AnyStr, NoReturn, Optional, Iterator, Tuple, Dict, \
+    Callable, Iterable, List
+
+from . import _casefoldcache
+from . import _keyintern
+from ._nocasekey import NocaseKey
 
 __all__ = ['NocaseDict']
 
@@ -48,10 +58,129 @@ Key = Optional[AnyStr]
 # removed, so they appear in the docs.
 BUILDING_DOCS = os.environ.get('BUILDING_DOCS', False)
 
+# This env var enables the debug mode for the methods that take casefolded
+# keys (e.g. get_folded()), where these methods verify that the keys are
+# actually casefolded.
+CHECK_FOLDED_KEYS = os.environ.get('NOCASEDICT_CHECK_FOLDED_KEYS', False)
+
 # Used as default value for parameters to detect that they have not been
 # specified as an argument. Idea from CPython's datetime.timezone.
 _OMITTED = object()
 
+# The casefold functions used by the default casefold method, by key type.
+# Entries for other key types are added on first use of the type.
+_CASEFOLD_FUNCS: Dict[type, Callable] = {
+    str: str.casefold,
+    bytes: bytes.lower,
+}
+
+
+def _casefold_func(key_type: type) -> Callable:
+    """
+    Return the casefold function for a key type, and remember it for future
+    use.
+
+    The casefold function is the 'casefold' method of the type, or if that
+    does not exist (e.g. for byte strings), its 'lower' method.
+
+    Raises:
+      AttributeError: The key type has neither a 'casefold' nor a 'lower'
+        method.
+    """
+    func = getattr(key_type, 'casefold', None)
+    if func is None:
+        func = getattr(key_type, 'lower', None)
+        if func is None:
+            raise AttributeError(
+                f"{key_type.__name__!r} object has no attribute 'casefold' "
+                "or 'lower'")
+    _CASEFOLD_FUNCS[key_type] = func
+    return func
+
+
+def update_inline_str_casefold() -> None:
+    """
+    Update whether NocaseDict casefolds keys of type str inline, after the
+    casefold cache or key interning has been enabled or disabled.
+    """
+    # pylint: disable=protected-access
+    NocaseDict._inline_str_casefold = _casefoldcache._CACHES is None
+    NocaseDict._inline_str_casefold_setitem = \
+        _casefoldcache._CACHES is None and _keyintern._POOL is None
+
+
+def _slots_state(
+        obj: Any) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return the state of an object whose class defines __slots__, in the
+    format of the default pickle protocol for objects: A tuple of the
+    __dict__ of the object (or `None`), and a dict with the slots that are
+    set.
+
+    Pickle protocols 0 and 1 need this as the __getstate__() method of such
+    classes.
+    """
+    slot_state: Dict[str, Any] = {}
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__') or name in slot_state:
+                continue
+            try:
+                slot_state[name] = getattr(obj, name)
+            except AttributeError:
+                pass  # Slot is not set
+    return getattr(obj, '__dict__', None) or None, slot_state
+
+
+class _SharedKeysError(Exception):
+    """
+    Raised when a shared dictionary of original keys would be modified.
+    """
+    pass
+
+
+class _SharedKeys(dict):
+    """
+    Dictionary of original keys by casefolded key, that is shared between
+    NocaseDict objects with the same keys.
+
+    It must not be modified. A NocaseDict object replaces it with a private
+    copy before modifying it. Modifying methods that would change it raise
+    _SharedKeysError.
+    """
+
+    __slots__ = ()
+
+    def __setitem__(self, k, key):
+        # Setting an original key to the same object is not a modification.
+        # This happens when values are updated in the same lexical case.
+        if self.get(k, _OMITTED) is not key:
+            raise _SharedKeysError
+
+    @staticmethod
+    def _readonly(*args, **kwargs):
+        raise _SharedKeysError
+
+    __delitem__ = pop = popitem = setdefault = update = clear = __ior__ = \
+        _readonly
+
+    def __reduce__(self):
+        # The empty dictionary is a singleton that is pickled by reference.
+        if self is _NO_KEYS:
+            return '_NO_KEYS'
+        # The default reduction for dict subclasses sets the items with
+        # __setitem__() when unpickling.
+        return (self.__class__, (dict(self),))
+
+
+# Empty dictionary of original keys, that is shared by all NocaseDict objects
+# whose keys are all casefolded. This is the common case for small
+# dictionaries, and saves one dictionary per NocaseDict object.
+_NO_KEYS = _SharedKeys()
+
 
 class _DictView:
     # pylint: disable=too-few-public-methods
@@ -69,9 +198,6 @@ class _DictView:
         # pylint: disable=invalid-name
         return x in iter(self)
 
-    def __reversed__(self):
-        return reversed(list(iter(self)))
-
     def __repr__(self):
         return f"{self.__class__.__name__}({self._dict!r})"
 
@@ -79,14 +205,114 @@ class _DictView:
 class dict_keys(_DictView, KeysView):
     # pylint: disable=too-few-public-methods,invalid-name
     """
-    Dictionary values view.
+    Dictionary keys view.
+
+    Membership tests and set operations on the view are case-insensitive. The
+    set operations return a :class:`py:set` with the keys in their original
+    lexical case, whereby the lexical case of a key in the dictionary takes
+    precedence over the lexical case of the same key in the other operand.
     """
 
     def __iter__(self):
+        return iter(self._dict)
+
+    def __reversed__(self):
+        return reversed(self._dict)
+
+    def __contains__(self, key):
+        try:
+            return key in self._dict
+        except (AttributeError, TypeError):
+            # Keys that cannot be casefolded are not in the dictionary.
+            return False
+
+    def _other_folded(self, other):
+        """
+        Return a dict with the casefolded keys of the other iterable as keys
+        and the original keys as values.
+
+        Keys of the other iterable that cannot be casefolded are not in the
+        dictionary. They are returned with a key that does not match any
+        casefolded key.
+        """
+        dct = self._dict
+        # pylint: disable=protected-access
+        if isinstance(other, dict_keys):
+            other_dct = other._dict
+            if other_dct.__casefold__ is dct.__casefold__:
+                return dict(zip(other_dct._data, other_dct))
+        if not isinstance(other, Collection):
+            other = list(other)
+        casefolded_key = dct._casefolded_key
+        try:
+            if dct._inline_str_casefold:
+                return {key.casefold() if key.__class__ is str
+                        else casefolded_key(key): key for key in other}
+            return {casefolded_key(key): key for key in other}
+        except (AttributeError, TypeError):
+            pass
+        result = {}
+        for key in other:
+            try:
+                k = casefolded_key(key)
+            except (AttributeError, TypeError):
+                k = (_OMITTED, key)
+            result[k] = key
+        return result
+
+    def _originals(self, folded_keys):
+        """
+        Return a set with the original keys of the dictionary for a set of
+        casefolded keys.
+        """
+        keys = self._dict._keys  # pylint: disable=protected-access
+        return set(map(keys.get, folded_keys, folded_keys))
+
+    def __and__(self, other):
+        # pylint: disable=protected-access
+        other_folded = self._other_folded(other)
+        return self._originals(self._dict._data.keys() & other_folded.keys())
+
+    __rand__ = __and__
+
+    def __or__(self, other):
+        # pylint: disable=protected-access
+        data = self._dict._data
+        result = set(self._dict)
+        result.update(key for k, key in self._other_folded(other).items()
+                      if k not in data)
+        return result
+
+    __ror__ = __or__
+
+    def __sub__(self, other):
+        # pylint: disable=protected-access
+        other_folded = self._other_folded(other)
+        return self._originals(self._dict._data.keys() - other_folded.keys())
+
+    def __rsub__(self, other):
         # pylint: disable=protected-access
         data = self._dict._data
-        for k in data:
-            yield data[k][0]
+        return {key for k, key in self._other_folded(other).items()
+                if k not in data}
+
+    def __xor__(self, other):
+        # pylint: disable=protected-access
+        data = self._dict._data
+        other_folded = self._other_folded(other)
+        result = self._originals(data.keys() - other_folded.keys())
+        result.update(key for k, key in other_folded.items()
+                      if k not in data)
+        return result
+
+    __rxor__ = __xor__
+
+    def isdisjoint(self, other):
+        """
+        Return a boolean indicating whether the view and the other iterable
+        have no keys in common (looked up case-insensitively).
+        """
+        return not any(key in self for key in other)
 
 
 class dict_values(_DictView, ValuesView):
@@ -97,22 +323,52 @@ class dict_values(_DictView, ValuesView):
 
     def __iter__(self):
         # pylint: disable=protected-access
-        data = self._dict._data
-        for k in data:
-            yield data[k][1]
+        return iter(self._dict._data.values())
+
+    def __reversed__(self):
+        # pylint: disable=protected-access
+        return reversed(self._dict._data.values())
 
 
 class dict_items(_DictView, ItemsView):
     # pylint: disable=too-few-public-methods,invalid-name
     """
     Dictionary items view.
+
+    Membership tests on the view look up the key of the item
+    case-insensitively.
     """
 
     def __iter__(self):
         # pylint: disable=protected-access
-        data = self._dict._data
-        for k in data:
-            yield data[k]
+        dct = self._dict
+        if not dct._keys:
+            return iter(dct._data.items())
+        return zip(dct, dct._data.values())
+
+    def __reversed__(self):
+        # pylint: disable=protected-access
+        dct = self._dict
+        if not dct._keys:
+            return reversed(dct._data.items())
+        return zip(reversed(dct), reversed(dct._data.values()))
+
+    def __contains__(self, item):
+        try:
+            key, value = item
+        except (TypeError, ValueError):
+            return False
+        dct = self._dict
+        # pylint: disable=protected-access
+        try:
+            k = dct._casefolded_key(key)
+        except (AttributeError, TypeError):
+            # Keys that cannot be casefolded are not in the dictionary.
+            return False
+        data_value = dct._data.get(k, _OMITTED)
+        if data_value is _OMITTED:
+            return False
+        return data_value is value or data_value == value
 
 
 class NocaseDict(MutableMapping):
@@ -138,9 +394,12 @@ class NocaseDict(MutableMapping):
     The :class:`~nocasedict.NocaseDict` class is derived from the abstract base
     class :class:`py:collections.abc.MutableMapping` and not from the
     :class:`py:dict` class, because of the unique implementation of
-    :class:`~nocasedict.NocaseDict`, which maintains a single dictionary with
-    the casefolded keys, and values that are tuples (original key, value).
-    This supports key based lookup with a single dictionary lookup.
+    :class:`~nocasedict.NocaseDict`, which maintains a dictionary with the
+    casefolded keys and the values of the items, and a separate dictionary
+    with the original keys by casefolded key that has entries only for the
+    keys that differ from their casefolded keys (and may be shared with
+    copies of the dictionary). This supports key based lookup with a single
+    dictionary lookup.
     Users that need to test whether an object is a dictionary should do that
     with ``isinstance(obj, Mapping)`` or ``isinstance(obj, MutableMapping)``.
 
@@ -184,6 +443,49 @@ class NocaseDict(MutableMapping):
     # * __sizeof__(self): The method inherited from object is used.
     #   TODO(issue #37): Clarify the rules for implementing __sizeof__().
 
+    # The instances have no __dict__, to save memory. Subclasses that do not
+    # define __slots__ get a __dict__ as usual.
+    __slots__ = ('_data', '_keys', '__weakref__')
+
+    # Indicates that keys of type str can be casefolded inline by calling
+    # str.casefold() directly, saving the calls to _casefolded_key() and
+    # __casefold__(). That is only possible when __casefold__() is not
+    # overridden and the casefold cache is disabled, so this attribute is
+    # maintained by __init_subclass__() and by update_inline_str_casefold().
+    # Note that str.casefold() already has an internal fast path for ASCII
+    # strings.
+    _inline_str_casefold = True
+
+    # The same for __setitem__(), which in addition stores the keys and
+    # therefore requires that key interning is disabled as well.
+    _inline_str_casefold_setitem = True
+
+    # Indicates that update() may add the items of a NocaseDict object in bulk
+    # to the internal dictionaries, bypassing __setitem__(). Since an
+    # overridden __setitem__() may e.g. validate the items, that is only done
+    # if the class that defines the __setitem__() method of the class sets
+    # this attribute to True in its class body. This attribute is maintained
+    # by __init_subclass__().
+    _bulk_setitem = True
+
+    # The class of the internal dictionary with the casefolded keys and the
+    # values. Subclasses may set it to a subclass of dict that can be created
+    # from an iterable of items and whose copy() method returns an object of
+    # the same class (e.g. OrderedDict). All methods that create the internal
+    # dictionary create an object of this class.
+    _data_class: Callable[..., Dict[Key, Any]] = dict
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The casefold method may also be overridden by a mixin class that is
+        # not derived from NocaseDict, so the resolved method is checked.
+        if cls.__casefold__ is not NocaseDict.__casefold__:
+            cls._inline_str_casefold = False
+            cls._inline_str_casefold_setitem = False
+        setitem_cls = next(
+            c for c in cls.__mro__ if '__setitem__' in c.__dict__)
+        cls._bulk_setitem = setitem_cls.__dict__.get('_bulk_setitem', False)
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Parameters:
@@ -251,21 +553,153 @@ class NocaseDict(MutableMapping):
           ValueError: Cannot unpack positional argument item #{i}.
         """
 
-        # The internal dictionary, with casefolded keys. An item in this dict
-        # is the tuple (original key, value).
-        self._data: Dict[Key, Any] = {}
+        # The internal dictionary, with casefolded keys and the values. If the
+        # original key is already casefolded (and has the same type), the
+        # original key object is used as the key. This avoids storing
+        # a second object for the same key, which is the common case for keys
+        # in lower case. Its class is _data_class.
+        self._data: Dict[Key, Any] = self._data_class()
+
+        # The original keys that differ from their casefolded keys, by
+        # casefolded key. For all other keys in the internal dictionary, the
+        # key in the internal dictionary is the original key. This dictionary
+        # may be shared with other NocaseDict objects that have the same keys
+        # (see _share_keys()). If it would be empty, it is _NO_KEYS.
+        self._keys: Dict[Key, Key] = _NO_KEYS
 
         self.update(*args, **kwargs)
 
+    @property
+    def allow_unnamed_keys(self) -> bool:
+        """
+        Undocumented attribute that was used to allow unnamed keys (i.e.
+        `None`). Unnamed keys are always allowed, so setting this attribute
+        has no effect. It is kept as a property for compatibility, since the
+        instances cannot have arbitrary attributes.
+        """
+        return True
+
+    @allow_unnamed_keys.setter
+    def allow_unnamed_keys(self, value: bool) -> None:
+        pass
+
+    def _share_keys(self) -> Dict[Key, Key]:
+        """
+        Return the dictionary of original keys, for sharing it with another
+        NocaseDict object that has the same keys.
+
+        A shared dictionary of original keys is never modified. Methods that
+        need to modify it use _private_keys() to get a private copy.
+        """
+        keys = self._keys
+        if keys.__class__ is not _SharedKeys:
+            keys = self._keys = _SharedKeys(keys)
+        return keys
+
+    def _private_keys(self) -> Dict[Key, Key]:
+        """
+        Return the dictionary of original keys for modifying it, replacing
+        it with a private copy if it is shared.
+        """
+        keys = self._keys
+        if keys.__class__ is _SharedKeys:
+            keys = self._keys = dict(keys)
+        return keys
+
+    def _remove_key(self, k: Key) -> Key:
+        """
+        Remove the original key for a casefolded key from the dictionary of
+        original keys and return it. The casefolded key must be in that
+        dictionary.
+
+        If no original keys remain, the dictionary is replaced with _NO_KEYS.
+        """
+        keys = self._keys
+        if len(keys) == 1:
+            self._keys = _NO_KEYS
+            if keys.__class__ is _SharedKeys:
+                return keys[k]
+            # Iterators that use the private dictionary see the removal.
+            return keys.pop(k)
+        return self._private_keys().pop(k)
+
     def _casefolded_key(self, key: Key) -> Key:
         """
         This method returns the casefolded key and handles the case of key
         being `None`.
+
+        If the key is a :class:`~nocasedict.NocaseKey` object, its casefolded
+        key for the casefold method of the class is used.
+
+        If the casefold cache is enabled (see
+        :func:`~nocasedict.enable_casefold_cache`), it is used.
         """
+        if isinstance(key, str) and self._inline_str_casefold:
+            return key.casefold()
+        if isinstance(key, NocaseKey) and self._inline_str_casefold:
+            return key._folded  # pylint: disable=protected-access
         if key is None:
             return None
+        if isinstance(key, NocaseKey):
+            return key.casefolded(self.__casefold__)
+        # pylint: disable=protected-access
+        if _casefoldcache._CACHES is not None:
+            return _casefoldcache.cached_casefold(self.__casefold__, key)
         return self.__casefold__(key)
 
+    def _stored_key(self, key: Key, k: Any = _OMITTED) -> Tuple[Key, Key]:
+        """
+        Return the casefolded key and the original key to be stored for a key
+        that is added or updated, as a tuple (k, key).
+
+        The key is casefolded, unless its casefolded key is specified. A
+        :class:`~nocasedict.NocaseKey` object is replaced with its original
+        key. If key interning is enabled (see
+        :func:`~nocasedict.enable_key_interning`), the interned keys are
+        returned.
+        """
+        if k is _OMITTED:
+            if isinstance(key, str) and self._inline_str_casefold_setitem:
+                return key.casefold(), key
+            k = self._casefolded_key(key)
+        if isinstance(key, NocaseKey):
+            key = key.key
+        # pylint: disable=protected-access
+        if _keyintern._POOL is not None:
+            key, k = _keyintern.interned_keys(key, k)
+        return k, key
+
+    def _store_item(self, k: Key, key: Key, value: Any) -> None:
+        """
+        Store an item with its casefolded key and its original key to be
+        stored, as returned by _stored_key().
+
+        A key that is equal to its casefolded key and has the same type is
+        used directly as the key of the item, and any original key recorded
+        for it is removed. Otherwise, the original key is recorded.
+        """
+        if k.__class__ is key.__class__ and k == key:
+            self._data[key] = value
+            if k in self._keys:
+                self._remove_key(k)
+        else:
+            self._data[k] = value
+            try:
+                self._keys[k] = key
+            except _SharedKeysError:
+                self._private_keys()[k] = key
+
+    def _modifying(self) -> None:
+        """
+        Called before the internal dictionaries are modified directly, by
+        methods of subclasses that do not modify them via the public methods
+        or set_folded()/del_folded().
+
+        Mixin classes that cache state derived from the items (e.g. the hash
+        value of :class:`~nocasedict.HashableMixin`) override this method to
+        invalidate that state.
+        """
+
     @staticmethod
     def __casefold__(key: AnyStr) -> AnyStr:
         """
@@ -279,6 +713,10 @@ class NocaseDict(MutableMapping):
         byte string), :meth:`py:bytes.lower` is called, for compatibility with
         earlier versions of the package.
 
+        The casefold method to be called is determined once per key type
+        and then looked up by the type of the key, so that e.g. byte string
+        keys do not cause an exception to be raised and handled internally.
+
         This method can be overridden by users in order to change the
         case-insensitive behavior of the class.
         See :ref:`Overriding the default casefold method` for details.
@@ -292,11 +730,12 @@ class NocaseDict(MutableMapping):
         Raises:
           AttributeError: The key does not have the casefold method.
         """
+        key_type = type(key)
         try:
-            return key.casefold()  # type: ignore
-        except AttributeError:
-            # Probably a byte string, fall back to lower()
-            return key.lower()
+            func = _CASEFOLD_FUNCS[key_type]
+        except KeyError:
+            func = _casefold_func(key_type)
+        return func(key)
 
     # Basic accessor and setter methods
 
@@ -305,19 +744,32 @@ class NocaseDict(MutableMapping):
         Return the value of the item with an existing key (looked up
         case-insensitively).
 
+        If the key does not exist and a subclass defines a ``__missing__()``
+        method, it is called with the key and its result is returned, like
+        for :class:`py:dict`.
+
         Invoked when using e.g.: ``value = ncd[key]``
 
         Raises:
           AttributeError: The key does not have the casefold method.
           KeyError: Key does not exist (case-insensitively).
         """
-        k = self._casefolded_key(key)
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        elif isinstance(key, NocaseKey) and self._inline_str_casefold:
+            k = key._folded  # pylint: disable=protected-access
+        else:
+            k = self._casefolded_key(key)
         try:
-            return self._data[k][1]
+            return self._data[k]
         except KeyError:
-            key_error = KeyError(f"Key {key!r} not found")
-            key_error.__cause__ = None  # Suppress 'During handling..'
-            raise key_error  # pylint: disable=raise-missing-from
+            pass
+        # Outside of the except clause, so that exceptions raised by
+        # __missing__() are not chained to the KeyError.
+        missing = getattr(self.__class__, '__missing__', None)
+        if missing is not None:
+            return missing(self, key)
+        raise KeyError(f"Key {key!r} not found")
 
     def __setitem__(self, key: Key, value: Any) -> None:
         """
@@ -330,8 +782,11 @@ class NocaseDict(MutableMapping):
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        k = self._casefolded_key(key)
-        self._data[k] = (key, value)
+        if isinstance(key, str) and self._inline_str_casefold_setitem:
+            k: Key = key.casefold()
+        else:
+            k, key = self._stored_key(key)
+        self._store_item(k, key, value)
 
     def __delitem__(self, key: Key) -> None:
         """
@@ -343,13 +798,18 @@ class NocaseDict(MutableMapping):
           AttributeError: The key does not have the casefold method.
           KeyError: Key does not exist (case-insensitively).
         """
-        k = self._casefolded_key(key)
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
         try:
             del self._data[k]
         except KeyError:
             key_error = KeyError(f"Key {key!r} not found")
             key_error.__cause__ = None  # Suppress 'During handling..'
             raise key_error  # pylint: disable=raise-missing-from
+        if k in self._keys:
+            self._remove_key(k)
 
     def __len__(self) -> int:
         """
@@ -369,7 +829,12 @@ class NocaseDict(MutableMapping):
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        k = self._casefolded_key(key)
+        if key.__class__ is str and self._inline_str_casefold:
+            k = key.casefold()
+        elif key.__class__ is NocaseKey and self._inline_str_casefold:
+            k = key._folded  # pylint: disable=protected-access
+        else:
+            k = self._casefolded_key(key)
         return k in self._data
 
     def __reversed__(self) -> Iterator[Any]:
@@ -382,7 +847,12 @@ class NocaseDict(MutableMapping):
         # reversed() to using len() and __getitem__() (the sequence protocol")
         # requires that the object is a sequence, and relying on the fallback
         # for dicts results in TypeError.
-        return reversed(self.keys())
+        data = self._data
+        keys = self._keys
+        if not keys:
+            return reversed(data)
+        # Using keys.get() as in __iter__()
+        return map(keys.get, reversed(data), reversed(data))
 
     @classmethod
     def fromkeys(cls, iterable, value=None) -> 'NocaseDict':
@@ -390,23 +860,199 @@ class NocaseDict(MutableMapping):
         Return a new :class:`NocaseDict` object with keys from the specified
         iterable of keys, and values all set to the specified value.
 
+        The new dictionary is created without arguments and then updated, so
+        that this also works for subclasses whose constructor has other
+        positional parameters (e.g. :class:`~nocasedict.NocaseDefaultDict`).
+
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        return cls([(key, value) for key in iterable])
+        result = cls()
+        result.update((key, value) for key in iterable)
+        return result
+
+    @classmethod
+    def fromvalues(cls, template: 'NocaseDict',
+                   values: Iterable[Any]) -> 'NocaseDict':
+        """
+        Return a new :class:`NocaseDict` object with the keys of the template
+        dictionary, and values from the specified iterable of values, in
+        dictionary iteration order of the template dictionary.
+
+        This is intended for creating many dictionaries with the same keys
+        (e.g. one for each row of a table). If the template dictionary uses
+        the same casefold method, the keys are not casefolded again, and the
+        new dictionary shares the internal table of original keys with the
+        template dictionary until keys are added, removed or changed in their
+        lexical case, which saves memory.
+
+        Raises:
+          TypeError: The template is not a NocaseDict object.
+          ValueError: The number of values differs from the number of keys
+            in the template dictionary.
+        """
+        if not isinstance(template, NocaseDict):
+            raise TypeError(
+                "The template must be a NocaseDict object, but is a "
+                f"{type(template)}")
+        values = list(values)
+        if len(values) != len(template):
+            raise ValueError(
+                f"Expected {len(template)} values, got {len(values)}")
+        if template.__casefold__ is not cls.__casefold__ or \
+                not cls._bulk_setitem:
+            # The keys need to be casefolded again, or an overridden
+            # __setitem__() requires adding the items one by one.
+            result = cls()
+            result.update(zip(template, values))
+            return result
+        result = cls()
+        # pylint: disable=protected-access
+        result._data = cls._data_class(zip(template._data, values))
+        result._keys = template._share_keys()
+        return result
+
+    @classmethod
+    def from_pairs(cls, iterable: Iterable[Tuple[Key, Any]], *,
+                   unique: bool = True) -> 'NocaseDict':
+        """
+        Return a new :class:`NocaseDict` object with the items from the
+        specified iterable of key, value pairs.
+
+        This is intended for loading large numbers of items. Compared to
+        initializing the dictionary with the pairs, the internal dictionaries
+        are built in bulk instead of adding the items one by one, and the
+        items are not checked for the special cases supported by
+        :meth:`update` (such as keyable objects of
+        :func:`~nocasedict.KeyableByMixin`). For subclasses that override
+        :meth:`__setitem__`, the items are added one by one with
+        :meth:`update`.
+
+        Parameters:
+
+          iterable (iterable of tuple(key, value)): The key, value pairs.
+            Lists and tuples are used directly; other iterables are
+            converted to a list first.
+
+          unique (bool): Indicates that the keys are unique
+            (case-insensitively), which is verified. If `False`, keys may
+            occur multiple times, and the last value and the last lexical
+            case of a key are used, like with :meth:`update`.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          TypeError: An item is not iterable.
+          ValueError: An item is not a key, value pair, or unique is `True`
+            and the keys are not unique (case-insensitively).
+        """
+        if not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
+        result = cls()
+        # pylint: disable=protected-access
+        if _keyintern._POOL is not None or not cls._bulk_setitem:
+            # Interning the keys, or an overridden __setitem__(), requires
+            # adding the items one by one
+            result.update(iterable)
+            if unique and len(result) != len(iterable):
+                raise ValueError("The keys are not unique (case-insensitively)")
+            return result
+        keys = [key for key, _ in iterable]
+        result._bulk_set(keys, map(itemgetter(1), iterable), unique)
+        return result
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping) -> 'NocaseDict':
+        """
+        Return a new :class:`NocaseDict` object with the items from the
+        specified mapping.
+
+        Like :meth:`from_pairs`, this is intended for loading large numbers
+        of items. If keys in the mapping are equal case-insensitively, the
+        last value and the last lexical case of a key are used, like with
+        :meth:`update`.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        result = cls()
+        # pylint: disable=protected-access
+        if isinstance(mapping, NocaseDict) or _keyintern._POOL is not None \
+                or not cls._bulk_setitem:
+            # A NocaseDict is already added in bulk if possible, and interning
+            # the keys, or an overridden __setitem__(), requires adding the
+            # items one by one.
+            result.update(mapping)
+            return result
+        result._bulk_set(list(mapping), mapping.values(), False)
+        return result
+
+    def _bulk_set(self, keys: list, values: Iterable[Any],
+                  unique: bool) -> None:
+        """
+        Set the internal dictionaries of an empty dictionary from a list of
+        keys and an iterable of the corresponding values.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          ValueError: unique is `True` and the keys are not unique
+            (case-insensitively).
+        """
+        folded: List[Key]
+        data: Dict[Key, Any]
+        originals: Dict[Key, Key]
+        if self._inline_str_casefold and set(map(type, keys)) <= {str}:
+            # The casefolded keys are str objects, so keys that are equal
+            # to their casefolded keys have the same type.
+            folded = list(map(str.casefold, keys))
+            data = dict(zip(folded, values))
+            if len(data) == len(folded):
+                originals = dict(compress(zip(folded, keys),
+                                          map(ne, folded, keys)))
+            else:
+                if unique:
+                    raise ValueError(
+                        "The keys are not unique (case-insensitively)")
+                originals = dict(zip(folded, keys))
+                originals = {k: key for k, key in originals.items()
+                             if k != key}
+        else:
+            folded = list(map(self._casefolded_key, keys))
+            keys = [key.key if isinstance(key, NocaseKey) else key
+                    for key in keys]
+            # Keys that are equal to their casefolded keys and have the same
+            # type are used directly, as in __setitem__().
+            data = dict(zip(
+                [key if k.__class__ is key.__class__ and k == key else k
+                 for k, key in zip(folded, keys)],
+                values))
+            if len(data) != len(folded) and unique:
+                raise ValueError(
+                    "The keys are not unique (case-insensitively)")
+            originals = dict(zip(folded, keys))
+            originals = {k: key for k, key in originals.items()
+                         if k.__class__ is not key.__class__ or k != key}
+        if self._data_class is not dict:
+            data = self._data_class(data)
+        self._data = data
+        self._keys = originals or _NO_KEYS
 
     def get(self, key: Key, default=None) -> Any:
         """
         Return the value of the item with an existing key (looked up
         case-insensitively), or if the key does not exist, a default value.
 
+        If the key does not exist, no exception is raised internally.
+
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        elif isinstance(key, NocaseKey) and self._inline_str_casefold:
+            k = key._folded  # pylint: disable=protected-access
+        else:
+            k = self._casefolded_key(key)
+        return self._data.get(k, default)
 
     def pop(self, key: Key, default=_OMITTED) -> Any:
         """
@@ -414,19 +1060,28 @@ class NocaseDict(MutableMapping):
         case-insensitively), and return its value.
 
         If an item with the key does not exist, the default value is returned
-        if specified, otherwise :exc:`py:KeyError` is raised.
+        if specified (without raising an exception internally), otherwise
+        :exc:`py:KeyError` is raised.
 
         Raises:
+          AttributeError: The key does not have the casefold method.
           KeyError: Key does not exist (case-insensitively) and no default was
             specified.
         """
-        k = self._casefolded_key(key)
-        try:
-            return self._data.pop(k)[1]
-        except KeyError:
-            if default is not _OMITTED:
-                return default
-            raise
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        elif isinstance(key, NocaseKey) and self._inline_str_casefold:
+            k = key._folded  # pylint: disable=protected-access
+        else:
+            k = self._casefolded_key(key)
+        value = self._data.pop(k, _OMITTED)
+        if value is _OMITTED:
+            if default is _OMITTED:
+                raise KeyError(f"Key {key!r} not found")
+            return default
+        if k in self._keys:
+            self._remove_key(k)
+        return value
 
     def popitem(self) -> Tuple[Key, Any]:
         """
@@ -439,7 +1094,10 @@ class NocaseDict(MutableMapping):
         Raises:
           KeyError: Dictionary is empty.
         """
-        return self._data.popitem()[1]
+        k, value = self._data.popitem()
+        if k in self._keys:
+            return self._remove_key(k), value
+        return k, value
 
     def setdefault(self, key: Key, default=None) -> Any:
         """
@@ -447,12 +1105,118 @@ class NocaseDict(MutableMapping):
         add an item with that key and the specified default value, and return
         the value of the item with the key.
 
+        If the key does not exist, no exception is raised internally.
+
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        if key not in self:
-            self[key] = default
-        return self[key]
+        if isinstance(key, str) and self._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        value = self._data.get(k, _OMITTED)
+        if value is _OMITTED:
+            k, key = self._stored_key(key, k)
+            self._store_item(k, key, default)
+            return default
+        return value
+
+    # Methods for casefolded keys
+
+    def _check_folded(self, k: Key, key: Key) -> None:
+        """
+        Check that a key that was specified as a casefolded key is the
+        casefolded key of the original key.
+
+        Raises:
+          ValueError: The key is not the casefolded key.
+        """
+        if self._casefolded_key(key) != k:
+            raise ValueError(
+                f"Key {k!r} is not the casefolded key of key {key!r}")
+
+    def get_folded(self, k: Key, default=None) -> Any:
+        """
+        Return the value of the item with an existing casefolded key, or if
+        the key does not exist, a default value.
+
+        This is a low-level method for callers that already have the
+        casefolded key (e.g. from :meth:`keys_nocase` or because their keys
+        are in lower case), that saves casefolding the key again. The key must
+        be the casefolded key as returned by the
+        :meth:`~nocasedict.NocaseDict.__casefold__` method of the class;
+        otherwise the item is not found.
+
+        If the environment variable ``NOCASEDICT_CHECK_FOLDED_KEYS`` is set
+        when importing the package, this method verifies that the key is
+        casefolded.
+
+        Raises:
+          ValueError: The key is not casefolded (only verified in debug mode).
+        """
+        if CHECK_FOLDED_KEYS:
+            self._check_folded(k, k)
+        return self._data.get(k, default)
+
+    def set_folded(self, k: Key, key: Key, value: Any) -> None:
+        """
+        Update the value of the item with an existing casefolded key, or if
+        an item with the key does not exist, add an item with the specified
+        original key and value.
+
+        The original key replaces the original key of an existing item, like
+        for ``ncd[key] = value``.
+
+        Like :meth:`get_folded`, this is a low-level method that does not
+        casefold the key. The key must be the casefolded key of the original
+        key; otherwise the dictionary becomes inconsistent. In debug mode,
+        this is verified. Keys are not interned by this method (see
+        :func:`~nocasedict.enable_key_interning`).
+
+        Raises:
+          ValueError: The key is not the casefolded key of the original key
+            (only verified in debug mode).
+        """
+        if CHECK_FOLDED_KEYS:
+            self._check_folded(k, key)
+        self._store_item(k, key, value)
+
+    def del_folded(self, k: Key) -> None:
+        """
+        Delete the item with an existing casefolded key.
+
+        Like :meth:`get_folded`, this is a low-level method that does not
+        casefold the key, with the same requirements and debug mode.
+
+        Raises:
+          KeyError: Key does not exist.
+          ValueError: The key is not casefolded (only verified in debug mode).
+        """
+        if CHECK_FOLDED_KEYS:
+            self._check_folded(k, k)
+        try:
+            del self._data[k]
+        except KeyError:
+            key_error = KeyError(f"Key {k!r} not found")
+            key_error.__cause__ = None  # Suppress 'During handling..'
+            raise key_error  # pylint: disable=raise-missing-from
+        if k in self._keys:
+            self._remove_key(k)
+
+    def contains_folded(self, k: Key) -> bool:
+        """
+        Return a boolean indicating whether the dictionary contains an item
+        with the casefolded key.
+
+        Like :meth:`get_folded`, this is a low-level method that does not
+        casefold the key, with the same requirements and debug mode.
+
+        Raises:
+          ValueError: The key is not casefolded (only verified in debug mode).
+        """
+        if CHECK_FOLDED_KEYS:
+            self._check_folded(k, k)
+        return k in self._data
 
     # Iteration methods
 
@@ -509,10 +1273,30 @@ class NocaseDict(MutableMapping):
         Return an iterator through the dictionary keys (in the original lexical
         case) in dictionary iteration order.
 
+        Like for dict, existing items may be updated during the iteration.
+        If that changes the lexical case of a key that has not been returned
+        yet, the iterator may return the key in its previous lexical case.
+        This happens when the dictionary had no original keys that differ
+        from their casefolded keys, or shared them with a copy of it, when
+        the iteration started. The iteration does not look up the current
+        original keys for each key, so that it runs at the speed of
+        iterating through a dict. This also applies to :meth:`__reversed__`
+        and to the iteration through the keys and items views.
+
         Invoked when using: ``for key in ncd``
         """
-        for k in self._data:
-            yield self._data[k][0]
+        data = self._data
+        keys = self._keys
+        if not keys:
+            # All keys are already casefolded, so the keys of the internal
+            # dictionary are the original keys.
+            return iter(data)
+        # Keys that are not in the dictionary of original keys are already
+        # casefolded. That also applies to original keys that are removed
+        # from it when the item is updated during the iteration. An update
+        # that replaces a shared dictionary of original keys (see
+        # _private_keys()) is not seen by the iterator.
+        return map(keys.get, data, data)
 
     # Other stuff
 
@@ -548,6 +1332,10 @@ class NocaseDict(MutableMapping):
         dictionary without being copied, consistent with the built-in
         :class:`py:dict` class.
 
+        If the positional argument is a :class:`NocaseDict` object that uses
+        the same casefold method, its items are added in bulk without
+        casefolding their keys again.
+
         Parameters:
 
           *args : An optional single positional argument representing key-value
@@ -589,43 +1377,90 @@ class NocaseDict(MutableMapping):
                 raise TypeError(
                     f"Expected at most 1 positional argument, got {len(args)}")
             other = args[0]
-            try:
-                # Try mapping / dictionary
-                for key in other.keys():
+            other_keys = getattr(other, 'keys', None)
+            if isinstance(other, NocaseDict):
+                # pylint: disable=protected-access
+                if other.__casefold__ is self.__casefold__ and \
+                        self._bulk_setitem:
+                    # Same casefold method, so its casefolded keys can be
+                    # used directly and the items can be added in bulk.
+                    other_data = other._data
+                    if not self._data:
+                        # The dictionary gets the same keys as the other
+                        # dictionary, so their original keys can be shared.
+                        self._data.update(other_data)
+                        self._keys = other._share_keys()
+                    else:
+                        self._update_keys(other)
+                        self._data.update(other_data)
+                else:
+                    # Its items provide the original keys without
+                    # casefolding them in the other dictionary.
+                    for key, value in other.items():
+                        self[key] = value
+            elif other_keys is not None:
+                # Mapping / dictionary
+                for key in other_keys():
                     self[key] = other[key]
-            except AttributeError:
+            else:
                 # Expecting an iterable
 
-                # Try whether KeyableByMixin() was used
+                # Check whether KeyableByMixin() was used
                 key_attr = getattr(
                     self, 'nocasedict_KeyableByMixin_key_attr', None)
                 # The following raises TypeError if not iterable:
                 for i, item in enumerate(other):
-                    if key_attr and hasattr(item, key_attr):
-                        # Is a keyable object
-                        key = getattr(item, key_attr)
-                        value = item
-                    else:
-                        # Expecting key, value pair
-                        try:
-                            key, value = item
-                        except ValueError as exc:
-                            value_error = ValueError(
-                                f"Cannot unpack positional argument item #{i} "
-                                f"of type {type(item)} into key, value: {exc}")
-                            value_error.__cause__ = None  # Suppress 'During..'
-                            # pylint: disable=raise-missing-from
-                            raise value_error
+                    if key_attr:
+                        # Using a single getattr() with default in order not
+                        # to raise AttributeError internally for items that are
+                        # not keyable objects.
+                        key = getattr(item, key_attr, _OMITTED)
+                        if key is not _OMITTED:
+                            # Is a keyable object
+                            self[key] = item
+                            continue
+                    # Expecting key, value pair
+                    try:
+                        key, value = item
+                    except ValueError as exc:
+                        value_error = ValueError(
+                            f"Cannot unpack positional argument item #{i} "
+                            f"of type {type(item)} into key, value: {exc}")
+                        value_error.__cause__ = None  # Suppress 'During..'
+                        # pylint: disable=raise-missing-from
+                        raise value_error
                     self[key] = value
 
         for key, val in kwargs.items():
             self[key] = val
 
+    def _update_keys(self, other: 'NocaseDict') -> None:
+        """
+        Update the original keys for updating the dictionary from another
+        NocaseDict object with the same casefold method.
+        """
+        # pylint: disable=protected-access
+        keys = self._keys
+        other_keys = other._keys
+        if other_keys is keys:
+            return
+        # Original keys that are replaced by keys that are already casefolded
+        stale = (keys.keys() & other._data.keys()) - other_keys.keys() \
+            if keys else ()
+        if stale or other_keys:
+            keys = self._private_keys()
+            for k in stale:
+                del keys[k]
+            keys.update(other_keys)
+            if not keys:
+                self._keys = _NO_KEYS
+
     def clear(self) -> None:
         """
         Remove all items from the dictionary.
         """
         self._data.clear()
+        self._keys = _NO_KEYS
 
     def copy(self) -> 'NocaseDict':
         """
@@ -639,11 +1474,27 @@ class NocaseDict(MutableMapping):
         Note that the Python functions :func:`py:copy.copy` and
         :func:`py:copy.deepcopy` can be used to create completely shallow or
         completely deep copies of objects of this class.
+
+        The copy has the same class as the original dictionary. Consistent
+        with :meth:`py:collections.OrderedDict.copy`, the class must
+        support being created without arguments.
         """
-        result = NocaseDict()
-        result._data = self._data.copy()  # pylint: disable=protected-access
+        result = self.__class__()
+        # pylint: disable=protected-access
+        result._data = self._data.copy()
+        result._keys = self._share_keys()
         return result
 
+    def __getstate__(self) -> Any:
+        """
+        Return the state of the dictionary for pickling and copying it.
+
+        The state has the format of the default pickle protocol for objects,
+        so that the dictionary can be pickled with all pickle protocols,
+        including protocols 0 and 1.
+        """
+        return _slots_state(self)
+
     def __eq__(self, other: Any) -> bool:
         """
         Return a boolean indicating whether the dictionary and the other
@@ -655,22 +1506,66 @@ class NocaseDict(MutableMapping):
         mapping. In all cases, the matching of keys takes place
         case-insensitively.
 
+        If the other dictionary is a :class:`NocaseDict` object that uses the
+        same casefold method, the casefolded keys of both dictionaries are
+        compared directly. The keys of any other mapping are casefolded once.
+
         Invoked when using e.g.: ``ncd == other``
 
         Raises:
           AttributeError: The key does not have the casefold method.
         """
         # Issue #1062: Could compare hash values for better performance
+        if isinstance(other, NocaseDict) and \
+                other.__casefold__ is self.__casefold__:
+            # Same casefold method, so the casefolded keys of the internal
+            # dictionaries can be compared directly.
+            other_data = other._data  # pylint: disable=protected-access
+        elif isinstance(other, Mapping):
+            # Casefold the keys of the other mapping once, into a temporary
+            # dictionary in the same format as the internal dictionary.
+            try:
+                other_data = {self._casefolded_key(key): value
+                              for key, value in other.items()}
+            except (AttributeError, TypeError):
+                # The other mapping has keys that cannot be casefolded, so
+                # they cannot be equal to any keys of the dictionary.
+                return False
+            if len(other_data) != len(other):
+                # The other mapping has keys that differ only in lexical case
+                return False
+        else:
+            return self._generic_eq(other)
+        try:
+            return self._data == other_data
+        except TypeError:
+            return False  # not comparable -> considered not equal
+
+    def _generic_eq(self, other: Any) -> bool:
+        """
+        Return a boolean indicating whether the dictionary and the other
+        object are equal, for other objects that are not mappings.
+
+        Objects that have no length or cannot be subscripted with the keys of
+        the dictionary (e.g. strings and lists) are not equal.
+        """
+        try:
+            if len(self) != len(other):
+                return False
+        except TypeError:
+            return False
         for key, self_value in self.items():
-            if key not in other:
+            # Each key is looked up only once in the other object
+            try:
+                other_value = other[key]
+            except (KeyError, IndexError, TypeError):
                 return False
-            other_value = other[key]
             try:
                 if not self_value == other_value:
                     return False
             except TypeError:
                 return False  # not comparable -> considered not equal
-        return len(self) == len(other)
+        return True
 
     def __ne__(self, other: Any) -> bool:
         """
@@ -728,12 +1623,12 @@ class NocaseDict(MutableMapping):
         Raises:
           AttributeError: The key does not have the casefold method.
         """
-        result = NocaseDict(self)
+        result = self.copy()
         result.update(other)
         return result
 
     def __ror__(self, other: Any) -> 'NocaseDict':
-        result = NocaseDict(other)
+        result = self.__class__(other)
         result.update(self)
         return result
 
@@ -0,0 +1,129 @@
+"""
+This module provides class NocaseKey, a key with a precomputed casefolded
+form for repeated case-insensitive lookups.
+"""
+
+
+from typing import Any, Callable, Optional, Tuple
+
+__all__ = ['NocaseKey']
+
+# The default casefold method of NocaseDict, once it has been imported.
+_DEFAULT_CASEFOLD: Optional[Callable] = None
+
+
+class NocaseKey:
+    """
+    A key for :class:`~nocasedict.NocaseDict` objects, that carries the
+    original key together with its casefolded key and the hash value of the
+    casefolded key.
+
+    Creating a :class:`NocaseKey` object once and using it for many lookups
+    saves casefolding the key again on each lookup. This pays off in loops
+    that look up the same key in many dictionaries::
+
+        from nocasedict import NocaseKey
+
+        INSTANCE_ID = NocaseKey('InstanceID')
+
+        ids = [ncd[INSTANCE_ID] for ncd in dicts]
+
+    :class:`~nocasedict.NocaseDict` objects accept :class:`NocaseKey`
+    objects wherever they accept keys, and treat them like the original key.
+    In particular, ``ncd[nkey] = value`` stores the original key, not the
+    :class:`NocaseKey` object. The precomputed casefolded key is used by
+    :class:`~nocasedict.NocaseDict` itself and by subclasses that do not
+    override :meth:`~nocasedict.NocaseDict.__casefold__`. For subclasses that
+    override it, the original key is casefolded with their casefold method
+    (once per casefold method and key object).
+
+    :class:`NocaseKey` objects are immutable and hashable. They are equal to
+    other :class:`NocaseKey` objects whose casefolded keys are equal, so they
+    can also be used as case-insensitive keys in the standard
+    :class:`py:dict` and :class:`py:set`. They are not equal to strings.
+
+    Parameters:
+
+      key (str or bytes): The original key. `None` is also allowed.
+
+    Raises:
+      AttributeError: The key does not have the casefold method.
+    """
+
+    __slots__ = ('_key', '_folded', '_hash', '_other')
+
+    def __init__(self, key: Any) -> None:
+        self._key = key
+        self._folded = None if key is None else _default_casefold()(key)
+        self._hash = hash(self._folded)
+        # Casefold method and casefolded key for the last casefold method
+        # other than the default casefold method that was used, as one tuple
+        # so that it is replaced atomically.
+        self._other: Optional[Tuple[Callable, Any]] = None
+
+    @property
+    def key(self) -> Any:
+        """
+        The original key.
+        """
+        return self._key
+
+    @property
+    def folded(self) -> Any:
+        """
+        The casefolded key, using the default casefold method of
+        :class:`~nocasedict.NocaseDict`.
+        """
+        return self._folded
+
+    def casefolded(self, casefold: Callable) -> Any:
+        """
+        Return the casefolded key for a casefold method.
+
+        This method is used by :class:`~nocasedict.NocaseDict`.
+
+        Parameters:
+
+          casefold (callable): The casefold method, i.e. the
+            :meth:`~nocasedict.NocaseDict.__casefold__` method of a
+            :class:`~nocasedict.NocaseDict` class.
+        """
+        if self._key is None:
+            return None
+        if casefold is _default_casefold():
+            return self._folded
+        other = self._other
+        if other is not None and other[0] is casefold:
+            return other[1]
+        folded = casefold(self._key)
+        self._other = (casefold, folded)
+        return folded
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, NocaseKey):
+            return self._folded == other._folded
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._key!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The hash value is not pickled, because the hash values of strings
+        # differ between Python processes.
+        return (self.__class__, (self._key,))
+
+
+def _default_casefold() -> Callable:
+    """
+    Return the default casefold method of NocaseDict. Imported late to avoid
+    a cyclic import.
+    """
+    global _DEFAULT_CASEFOLD  # pylint: disable=global-statement
+    if _DEFAULT_CASEFOLD is None:
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ._nocasedict import NocaseDict
+        _DEFAULT_CASEFOLD = NocaseDict.__casefold__
+    return _DEFAULT_CASEFOLD
@@ -0,0 +1,472 @@
+"""
+This module provides class NocaseLRUCache, a bounded case-insensitive cache.
+"""
+
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from ._nocasedict import NocaseDict, Key, _OMITTED, dict_keys, dict_values, \
+    dict_items
+
+__all__ = ['NocaseLRUCache', 'NocaseCacheInfo']
+
+# The eviction policies supported by NocaseLRUCache.
+CACHE_POLICIES = ('lru', 'lfu')
+
+
+class _OrderedNocaseDict(NocaseDict):
+    """
+    NocaseDict whose internal dictionary is an OrderedDict, so that its first
+    item can be found and removed in constant time (in a dict, that takes
+    time proportional to the number of items that have been removed before).
+    """
+
+    __slots__ = ()
+
+    _data_class = OrderedDict
+
+
+class NocaseCacheInfo(NamedTuple):
+    """
+    Statistics about a :class:`~nocasedict.NocaseLRUCache` object, as
+    returned by its :meth:`~nocasedict.NocaseLRUCache.cache_info` method.
+
+    Modeled after the ``CacheInfo`` tuple of :func:`py:functools.lru_cache`.
+    """
+
+    #: Number of lookups that found the key in the cache.
+    hits: int
+
+    #: Number of lookups that did not find the key in the cache.
+    misses: int
+
+    #: Number of items that were removed from the cache to make room.
+    evictions: int
+
+    #: Maximum number of items in the cache, or `None` for no limit.
+    maxsize: Optional[int]
+
+    #: Current number of items in the cache.
+    currsize: int
+
+    #: Eviction policy of the cache ('lru' or 'lfu').
+    policy: str
+
+
+class NocaseLRUCache(MutableMapping):
+    """
+    A case-insensitive and case-preserving cache with a maximum number of
+    items.
+
+    The cache is a mutable mapping that stores its items in a
+    :class:`~nocasedict.NocaseDict` object, so that its keys are looked up
+    case-insensitively like for :class:`~nocasedict.NocaseDict`. When an item
+    is added to a full cache, an item is removed according to the eviction
+    policy of the cache:
+
+    - 'lru': The least recently used item.
+    - 'lfu': The least frequently used item, and from the items with the same
+      number of uses the least recently used one.
+
+    Using an item means looking it up with ``cache[key]`` or
+    :meth:`get`, or setting it with ``cache[key] = value``. Promoting the
+    item on use and evicting an item take constant time for both policies.
+    Testing for the key with ``key in cache``, and iterating through the
+    cache do not count as uses.
+
+    The cache iterates through its items in the order of their last use for
+    the 'lru' policy, and in the order of their addition for the 'lfu'
+    policy.
+
+    Objects of this class are not thread-safe.
+
+    Example::
+
+        from nocasedict import NocaseLRUCache
+
+        cache = NocaseLRUCache(maxsize=2)
+        cache['CIM_Foo'] = 'foo'
+        cache['CIM_Bar'] = 'bar'
+
+        print(cache['cim_foo'])  # Uses 'CIM_Foo'
+        # foo
+
+        cache['CIM_Baz'] = 'baz'  # Evicts 'CIM_Bar'
+
+        print(list(cache))
+        # ['CIM_Foo', 'CIM_Baz']
+    """
+
+    __slots__ = ('_dict', '_data', '_maxsize', '_policy', '_lfu', '_on_evict',
+                 '_hits', '_misses', '_evictions', '_counts', '_buckets',
+                 '_min_count', '__weakref__')
+
+    def __init__(self, maxsize: Optional[int] = 128, policy: str = 'lru',
+                 on_evict: Optional[Callable[[Key, Any], None]] = None) \
+            -> None:
+        """
+        Parameters:
+
+          maxsize (int): Maximum number of items in the cache. Must be
+            positive. `None` means that the number of items is not limited.
+
+          policy (str): Eviction policy ('lru' or 'lfu').
+
+          on_evict (callable): A function that is called with the key (in the
+            original lexical case) and value of each item that has been
+            removed from the cache to make room, or `None`. It is not called
+            for items that are removed explicitly.
+
+        Raises:
+          ValueError: Invalid maxsize or policy.
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError(f"Invalid maxsize for cache: {maxsize!r}")
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Invalid policy for cache: {policy!r}")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._lfu = policy == 'lfu'
+        self._on_evict = on_evict
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # The items of the cache. The cache accesses the internal dictionary
+        # of the NocaseDict object directly, using the casefolded keys. The
+        # methods of NocaseDict that are used here never replace it.
+        self._dict = _OrderedNocaseDict()
+        # pylint: disable=protected-access
+        self._data: OrderedDict = self._dict._data  # type: ignore
+
+        # For the 'lfu' policy: The number of uses by casefolded key, the
+        # casefolded keys by number of uses (as OrderedDicts ordered by last
+        # use), and the smallest number of uses. The smallest number of uses
+        # may be too small after items have been deleted explicitly.
+        self._counts: Dict[Key, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_count = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """
+        Maximum number of items in the cache, or `None` for no limit.
+        """
+        return self._maxsize
+
+    @property
+    def policy(self) -> str:
+        """
+        Eviction policy of the cache ('lru' or 'lfu').
+        """
+        return self._policy
+
+    def cache_info(self) -> NocaseCacheInfo:
+        """
+        Return the statistics of the cache.
+        """
+        return NocaseCacheInfo(self._hits, self._misses, self._evictions,
+                               self._maxsize, len(self._data), self._policy)
+
+    def _casefolded_key(self, key: Key) -> Key:
+        """
+        Return the casefolded key, like NocaseDict does.
+        """
+        # pylint: disable=protected-access
+        return self._dict._casefolded_key(key)
+
+    def _use_lfu(self, k: Key) -> None:
+        """
+        Count a use of the item with the casefolded key for the 'lfu' policy.
+        """
+        counts = self._counts
+        count = counts[k]
+        counts[k] = count + 1
+        buckets = self._buckets
+        bucket = buckets[count]
+        del bucket[k]
+        next_bucket = buckets.get(count + 1)
+        if not bucket:
+            del buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+            if next_bucket is None:
+                # Reuse the empty bucket
+                buckets[count + 1] = bucket
+                next_bucket = bucket
+        elif next_bucket is None:
+            next_bucket = buckets[count + 1] = OrderedDict()
+        next_bucket[k] = None
+
+    def _forget(self, k: Key) -> None:
+        """
+        Remove the casefolded key from the use counts of the 'lfu' policy.
+        """
+        if self._lfu:
+            count = self._counts.pop(k)
+            bucket = self._buckets[count]
+            del bucket[k]
+            if not bucket:
+                del self._buckets[count]
+
+    def _evict(self) -> None:
+        """
+        Remove one item according to the eviction policy.
+        """
+        key, value = self.popitem()
+        self._evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __getitem__(self, key: Key) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively), and use the item.
+
+        Invoked when using e.g.: ``value = cache[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively).
+        """
+        # Inlined _casefolded_key() and the 'lru' policy for performance
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        data = self._data
+        try:
+            value = data[k]
+        except KeyError:
+            self._misses += 1
+            key_error = KeyError(f"Key {key!r} not found")
+            key_error.__cause__ = None  # Suppress 'During handling..'
+            raise key_error  # pylint: disable=raise-missing-from
+        self._hits += 1
+        if self._lfu:
+            self._use_lfu(k)
+        else:
+            data.move_to_end(k)
+        return value
+
+    def get(self, key: Key, default: Any = None) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively) and use the item, or if the key does not exist,
+        return a default value.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        # Inlined like in __getitem__()
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        data = self._data
+        value = data.get(k, _OMITTED)
+        if value is _OMITTED:
+            self._misses += 1
+            return default
+        self._hits += 1
+        if self._lfu:
+            self._use_lfu(k)
+        else:
+            data.move_to_end(k)
+        return value
+
+    def __setitem__(self, key: Key, value: Any) -> None:
+        """
+        Update the value of the item with an existing key (looked up
+        case-insensitively) and use the item, or if an item with the key does
+        not exist, add an item with the specified key and value, removing an
+        item according to the eviction policy if the cache is full.
+
+        Invoked when using e.g.: ``cache[key] = value``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        k, key = self._dict._stored_key(key)  # pylint: disable=W0212
+        data = self._data
+        if k in data:
+            if self._lfu:
+                self._use_lfu(k)
+            else:
+                data.move_to_end(k)
+        else:
+            maxsize = self._maxsize
+            if maxsize is not None and len(data) >= maxsize:
+                self._evict()
+            if self._lfu:
+                self._counts[k] = 1
+                bucket = self._buckets.get(1)
+                if bucket is None:
+                    self._buckets[1] = OrderedDict({k: None})
+                else:
+                    bucket[k] = None
+                self._min_count = 1
+        self._dict.set_folded(k, key, value)
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Delete the item with an existing key (looked up case-insensitively).
+
+        Invoked when using: ``del cache[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively).
+        """
+        k = self._casefolded_key(key)
+        if k not in self._data:
+            raise KeyError(f"Key {key!r} not found")
+        self._forget(k)
+        self._dict.del_folded(k)
+
+    def pop(self, key: Key, default: Any = _OMITTED) -> Any:
+        """
+        Remove the item with the specified key if it exists (looked up
+        case-insensitively), and return its value.
+
+        If an item with the key does not exist, the default value is returned
+        if specified, otherwise :exc:`py:KeyError` is raised. The item is not
+        used, and the statistics are not updated.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively) and no default was
+            specified.
+        """
+        k = self._casefolded_key(key)
+        value = self._data.get(k, _OMITTED)
+        if value is _OMITTED:
+            if default is _OMITTED:
+                raise KeyError(f"Key {key!r} not found")
+            return default
+        self._forget(k)
+        self._dict.del_folded(k)
+        return value
+
+    def popitem(self) -> Tuple[Key, Any]:
+        """
+        Remove the item that would be removed next according to the eviction
+        policy, and return it as a tuple (key, value). The eviction callback
+        is not called.
+
+        Raises:
+          KeyError: The cache is empty.
+        """
+        if not self._data:
+            raise KeyError("popitem(): cache is empty")
+        if self._lfu:
+            buckets = self._buckets
+            if self._min_count not in buckets:
+                self._min_count = min(buckets)
+            k = next(iter(buckets[self._min_count]))
+        else:
+            k = next(iter(self._data))
+        # pylint: disable=protected-access
+        key = self._dict._keys.get(k, k)
+        value = self._data[k]
+        self._forget(k)
+        self._dict.del_folded(k)
+        return key, value
+
+    def clear(self) -> None:
+        """
+        Remove all items from the cache. The statistics are not reset.
+        """
+        self._dict.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Return a boolean indicating whether the cache contains an item with
+        the key (looked up case-insensitively). The item is not used, and the
+        statistics are not updated.
+
+        Invoked when using: ``key in cache``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        return self._casefolded_key(key) in self._data
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the cache.
+
+        Invoked when using: ``len(cache)``
+        """
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Key]:
+        """
+        Return an iterator through the keys of the cache (in the original
+        lexical case). The items are not used.
+
+        Invoked when using: ``for key in cache``
+        """
+        return iter(self._dict)
+
+    def keys(self) -> dict_keys:
+        """
+        Return a view on the keys of the cache (in the original lexical case).
+        The items are not used.
+        """
+        return self._dict.keys()
+
+    def values(self) -> dict_values:
+        """
+        Return a view on the values of the cache. The items are not used.
+        """
+        return self._dict.values()
+
+    def items(self) -> dict_items:
+        """
+        Return a view on the items of the cache, where each item is a tuple of
+        its key (in the original lexical case) and its value. The items are
+        not used.
+        """
+        return self._dict.items()
+
+    def as_nocasedict(self) -> NocaseDict:
+        """
+        Return a new :class:`~nocasedict.NocaseDict` object with the items of
+        the cache.
+        """
+        return NocaseDict(self._dict)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return a boolean indicating whether the items of the cache and the
+        items of the other cache or mapping are equal, with the keys compared
+        case-insensitively, like for :class:`~nocasedict.NocaseDict`.
+
+        Invoked when using e.g.: ``cache == other``
+        """
+        if isinstance(other, NocaseLRUCache):
+            # Two OrderedDicts would be compared including their order
+            other = other.as_nocasedict()
+        return self._dict == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the cache that is suitable for
+        debugging.
+
+        Invoked when using e.g.: ``repr(cache)``
+        """
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        items_str = ', '.join(items)
+        return (f"{self.__class__.__name__}({{{items_str}}}, "
+                f"maxsize={self._maxsize!r}, policy={self._policy!r})")
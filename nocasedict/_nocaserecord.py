@@ -0,0 +1,407 @@
+"""
+This module provides function NocaseRecord() returning a record class with a
+fixed set of case-insensitive field names.
+"""
+
+
+import sys
+from collections.abc import Mapping, ItemsView, ValuesView
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Type
+
+from ._nocasedict import NocaseDict, Key
+from ._nocasekey import NocaseKey
+
+__all__ = ['NocaseRecord']
+
+
+def _casefolded_key(key: Key) -> Key:
+    """
+    Return the casefolded key, using the casefold method of NocaseDict.
+    """
+    if isinstance(key, str):
+        return key.casefold()
+    if key is None:
+        return None
+    if isinstance(key, NocaseKey):
+        return key.folded
+    return NocaseDict.__casefold__(key)
+
+
+class _RecordValuesView(ValuesView):
+    # pylint: disable=too-few-public-methods
+    """
+    Values view of a record, iterating through the slots directly.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Any]:
+        # pylint: disable=protected-access
+        return iter(self._mapping._astuple())  # type: ignore
+
+
+class _RecordItemsView(ItemsView):
+    # pylint: disable=too-few-public-methods
+    """
+    Items view of a record, iterating through the slots directly.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        # pylint: disable=protected-access
+        record = self._mapping  # type: ignore
+        return zip(record._fields, record._astuple())
+
+
+class _NocaseRecordBase(Mapping):
+    """
+    Base class for the record classes returned by :func:`NocaseRecord`.
+    """
+
+    __slots__ = ()
+
+    # The following class attributes are set on each generated class:
+
+    # Field names in their original lexical case, in field order.
+    _fields: Tuple[str, ...] = ()
+
+    # Names of the slots of the fields, by casefolded field name.
+    _slot_names: Dict[Key, str] = {}
+
+    # NocaseDict with the field names as keys, for as_nocasedict().
+    _template: NocaseDict
+
+    # The generated classes also have an __init__() method that sets the slots
+    # from the positional arguments and keyword arguments, and the following
+    # methods:
+
+    # Return the values of the slots as a tuple, in field order.
+    _astuple: Callable[..., Tuple[Any, ...]]
+
+    # Set the slots from the positional arguments, in field order.
+    _setvalues: Callable[..., None]
+
+    def _slot_name(self, key: Key) -> str:
+        """
+        Return the name of the slot of the field with the key (looked up
+        case-insensitively).
+        """
+        try:
+            return self._slot_names[
+                key.casefold() if isinstance(key, str)
+                else _casefolded_key(key)]
+        except KeyError:
+            key_error = KeyError(f"Key {key!r} not found")
+            key_error.__cause__ = None  # Suppress 'During handling..'
+            raise key_error  # pylint: disable=raise-missing-from
+
+    def __getitem__(self, key: Key) -> Any:
+        """
+        Return the value of the field with the key (looked up
+        case-insensitively).
+
+        Invoked when using e.g.: ``value = rec[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: The record has no field with the key
+            (case-insensitively).
+        """
+        # Inlined _slot_name() for performance
+        if isinstance(key, str):
+            k: Key = key.casefold()
+        else:
+            k = _casefolded_key(key)
+        try:
+            return getattr(self, self._slot_names[k])
+        except KeyError:
+            key_error = KeyError(f"Key {key!r} not found")
+            key_error.__cause__ = None  # Suppress 'During handling..'
+            raise key_error  # pylint: disable=raise-missing-from
+
+    def __setitem__(self, key: Key, value: Any) -> None:
+        """
+        Update the value of the field with the key (looked up
+        case-insensitively).
+
+        Invoked when using e.g.: ``rec[key] = value``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: The record has no field with the key
+            (case-insensitively).
+        """
+        setattr(self, self._slot_name(key), value)
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Fields of a record cannot be deleted.
+
+        Invoked when using: ``del rec[key]``
+
+        Raises:
+          TypeError: Fields of a record cannot be deleted.
+        """
+        raise TypeError(
+            f"Fields of {self.__class__.__name__} objects cannot be deleted")
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Return a boolean indicating whether the record has a field with the key
+        (looked up case-insensitively).
+
+        Invoked when using: ``key in rec``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        return _casefolded_key(key) in self._slot_names
+
+    def get(self, key: Key, default: Any = None) -> Any:
+        """
+        Return the value of the field with the key (looked up
+        case-insensitively), or if the record has no field with the key, a
+        default value.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        slot_name = self._slot_names.get(_casefolded_key(key))
+        if slot_name is None:
+            return default
+        return getattr(self, slot_name)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Return an iterator through the field names (in the original lexical
+        case) in field order.
+
+        Invoked when using: ``for key in rec``
+        """
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        """
+        Return the number of fields of the record.
+
+        Invoked when using: ``len(rec)``
+        """
+        return len(self._fields)
+
+    def values(self) -> ValuesView:
+        """
+        Return a view on the values of the record in field order.
+        """
+        return _RecordValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+        Return a view on the items of the record in field order, where each
+        item is a tuple of its field name (in the original lexical case) and
+        its value.
+        """
+        return _RecordItemsView(self)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Update the values of fields of the record from key/value pairs.
+
+        The arguments are the same as for :meth:`NocaseDict.update`. The keys
+        are looked up case-insensitively and must be field names of the
+        record.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: The record has no field with the key
+            (case-insensitively).
+          TypeError: Expected at most 1 positional argument, got {n}.
+          ValueError: Cannot unpack positional argument item #{i}.
+        """
+        if args:
+            if len(args) > 1:
+                raise TypeError(
+                    f"Expected at most 1 positional argument, got {len(args)}")
+            other = args[0]
+            if other.__class__ is self.__class__:
+                # Same fields, so the values can be copied in field order
+                # pylint: disable=protected-access
+                self._setvalues(*other._astuple())
+            elif hasattr(other, 'keys'):
+                # Mapping / dictionary
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                # Expecting an iterable of key, value pairs
+                for i, item in enumerate(other):
+                    try:
+                        key, value = item
+                    except ValueError as exc:
+                        value_error = ValueError(
+                            f"Cannot unpack positional argument item #{i} "
+                            f"of type {type(item)} into key, value: {exc}")
+                        value_error.__cause__ = None  # Suppress 'During..'
+                        # pylint: disable=raise-missing-from
+                        raise value_error
+                    self[key] = value
+
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def copy(self) -> '_NocaseRecordBase':
+        """
+        Return a copy of the record, that references the same values.
+        """
+        return self.__class__(*self._astuple())  # type: ignore
+
+    def as_nocasedict(self) -> NocaseDict:
+        """
+        Return a new :class:`NocaseDict` object with the items of the record.
+
+        The field names are not casefolded again, and the new dictionary shares
+        the internal table of field names with the other dictionaries created
+        by this method for records of the same class.
+        """
+        # pylint: disable=protected-access
+        return NocaseDict.fromvalues(self._template, self._astuple())
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return a boolean indicating whether the record and the other record
+        or dictionary are equal, by matching items (case-insensitively) based
+        on their keys, and then comparing the values of matching items for
+        equality.
+
+        Invoked when using e.g.: ``rec == other``
+        """
+        if other.__class__ is self.__class__:
+            return self._astuple() == other._astuple()
+        if isinstance(other, NocaseDict):
+            return other == self
+        if isinstance(other, Mapping):
+            return self.as_nocasedict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the record that is suitable for
+        debugging.
+
+        Invoked when using e.g.: ``repr(rec)``
+        """
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        items_str = ', '.join(items)
+        return f"{self.__class__.__name__}({{{items_str}}})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, self._astuple())
+
+
+def NocaseRecord(field_names: Iterable[str],
+                 class_name: str = 'NocaseRecord') -> Type:
+    # pylint: disable=invalid-name
+    """
+    A generator function returning a record class with a fixed set of
+    case-insensitive and case-preserving field names.
+
+    The objects of the returned class are mappings of the field names to the
+    values of the fields. Looking up fields is case-insensitive, like for
+    :class:`~nocasedict.NocaseDict`, but the objects store their values in
+    slots and resolve the casefolded field names with a lookup table that is
+    shared by all objects of the class. This makes the objects much smaller
+    and faster to create than :class:`~nocasedict.NocaseDict` objects, for
+    large numbers of objects with the same keys (e.g. rows of a table).
+
+    The objects always contain all fields: The values of fields can be
+    updated, but fields cannot be added or removed.
+
+    The class is initialized with the values of the fields as positional
+    arguments in field order, and optionally with keyword arguments whose
+    names are looked up case-insensitively. Fields that are not initialized
+    have the value `None`.
+
+    Besides the methods of :class:`py:collections.abc.Mapping`, the objects
+    support ``rec[key] = value``, ``update()``, ``copy()`` and
+    ``as_nocasedict()``. They compare equal to
+    :class:`~nocasedict.NocaseDict` objects and other mappings with the same
+    items (case-insensitively).
+
+    Example::
+
+        from nocasedict import NocaseDict, NocaseRecord
+
+        Row = NocaseRecord(['InstanceID', 'ElementName'], 'Row')
+
+        row = Row('id1', 'Fan 1')
+
+        print(row['ELEMENTNAME'])  # Lookup by key is case-insensitive
+        # Fan 1
+
+        print(row == NocaseDict(instanceid='id1', elementname='Fan 1'))
+        # True
+
+    Parameters:
+
+      field_names (iterable of str): The field names in their original
+        lexical case, in field order.
+
+      class_name (str): Name of the returned class.
+
+    Raises:
+      TypeError: A field name is not a string.
+      ValueError: Field names are duplicates (case-insensitively).
+    """
+    fields = tuple(field_names)
+    folded_fields = []
+    for name in fields:
+        if not isinstance(name, str):
+            raise TypeError(
+                f"Field names must be strings, but {name!r} is a {type(name)}")
+        folded_fields.append(_casefolded_key(name))
+    if len(set(folded_fields)) != len(fields):
+        raise ValueError(
+            f"Field names must be unique (case-insensitively): {fields!r}")
+
+    # The slot names are generated, so that the generated code does not
+    # depend on the field names.
+    slot_names = [f'_f{i}' for i in range(len(fields))]
+    params = ''.join(f'{slot}=None, ' for slot in slot_names)
+    init_body = ''.join(f'    self.{slot} = {slot}\n' for slot in slot_names)
+    astuple_values = ''.join(f'self.{slot}, ' for slot in slot_names)
+    setvalues_params = ', '.join(slot_names)
+    code = (
+        f"def __init__(self, {params}/, **kwargs):\n"
+        f"{init_body}"
+        "    if kwargs:\n"
+        "        self.update(kwargs)\n"
+        "\n"
+        "def _astuple(self):\n"
+        f"    return ({astuple_values})\n"
+        "\n"
+        f"def _setvalues(self, {setvalues_params}):\n"
+        f"{init_body or '    pass'}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(code, namespace)  # pylint: disable=exec-used
+
+    cls = type(class_name, (_NocaseRecordBase,), {
+        '__slots__': tuple(slot_names),
+        '__init__': namespace['__init__'],
+        '_astuple': namespace['_astuple'],
+        '_setvalues': namespace['_setvalues'],
+        '_fields': fields,
+        '_slot_names': dict(zip(folded_fields, slot_names)),
+        '_template': NocaseDict.fromkeys(fields),
+    })
+
+    # Allow pickling, if the class is defined at the module level of the
+    # caller (like collections.namedtuple() does).
+    try:
+        # pylint: disable=protected-access
+        cls.__module__ = sys._getframe(1).f_globals.get('__name__', '__main__')
+    except (AttributeError, ValueError):
+        pass
+
+    return cls
@@ -0,0 +1,417 @@
+"""
+This module provides class NocaseTTLDict, a case-insensitive dictionary whose
+items expire.
+"""
+
+
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from heapq import heappush, heappop, heapify
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ._nocasedict import NocaseDict, Key, _OMITTED, dict_keys, dict_values, \
+    dict_items
+
+__all__ = ['NocaseTTLDict']
+
+
+class NocaseTTLDict(MutableMapping):
+    """
+    A case-insensitive and case-preserving dictionary whose items expire a
+    time-to-live (TTL) after they have been set.
+
+    The dictionary is a mutable mapping that stores its items in a
+    :class:`~nocasedict.NocaseDict` object, so that its keys are looked up
+    case-insensitively like for :class:`~nocasedict.NocaseDict`. Each item
+    expires after the default TTL of the dictionary, or after the TTL that
+    was specified when setting it with :meth:`set`. Setting an item again
+    restarts its TTL.
+
+    Expired items are removed lazily: Looking up an expired item finds no
+    item and removes it, and setting an item, iterating through the
+    dictionary, and getting its length remove all expired items (see
+    :meth:`purge`). Expired items are found in the order of their expiry
+    time, so purging does not scan the items that have not expired. For the
+    items with the default TTL, this takes constant time per item, and for
+    items with another TTL, logarithmic time per item.
+
+    The times are determined with a clock function that returns the current
+    time in seconds, and that must not go backwards. It can be replaced for
+    testing.
+
+    Objects of this class are not thread-safe.
+
+    Example::
+
+        from nocasedict import NocaseTTLDict
+
+        capabilities = NocaseTTLDict(ttl=60)
+        capabilities['Indications'] = True  # Expires after 60 s
+        capabilities.set('Pull', False, ttl=5)  # Expires after 5 s
+
+        print(capabilities.get('INDICATIONS'))
+        # True
+    """
+
+    __slots__ = ('_dict', '_data', '_ttl', '_clock', '_expires', '_queue',
+                 '_heap', '_counter', '__weakref__')
+
+    def __init__(self, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Parameters:
+
+          ttl (float): Default time-to-live of the items in seconds. Must be
+            positive. `None` means that items set without a TTL do not
+            expire.
+
+          clock (callable): Function without parameters that returns the
+            current time in seconds as a number, and that does not go
+            backwards.
+
+        Raises:
+          ValueError: Invalid ttl.
+        """
+        _check_ttl(ttl)
+        self._ttl = ttl
+        self._clock = clock
+
+        # The items of the dictionary. The dictionary accesses the internal
+        # dictionary of the NocaseDict object directly, using the casefolded
+        # keys.
+        self._dict = NocaseDict()
+        self._data = self._dict._data  # pylint: disable=protected-access
+
+        # The expiry times by casefolded key. Items that do not expire have
+        # no entry.
+        self._expires: Dict[Key, float] = {}
+
+        # The casefolded keys of the items with the default TTL, in the order
+        # of their expiry times (which is the order in which they were set).
+        self._queue: OrderedDict = OrderedDict()
+
+        # Heap of tuples (expiry time, sequence number, casefolded key) for
+        # the items with another TTL. Entries for items that have been set
+        # again or deleted are removed when they are popped from the heap.
+        # The sequence number prevents comparing the keys.
+        self._heap: List[Tuple[float, int, Key]] = []
+        self._counter = count()
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """
+        Default time-to-live of the items in seconds, or `None` if items set
+        without a TTL do not expire.
+        """
+        return self._ttl
+
+    def _casefolded_key(self, key: Key) -> Key:
+        """
+        Return the casefolded key, like NocaseDict does.
+        """
+        # pylint: disable=protected-access
+        return self._dict._casefolded_key(key)
+
+    def _remove(self, k: Key) -> None:
+        """
+        Remove the item with the casefolded key.
+        """
+        self._expires.pop(k, None)
+        self._queue.pop(k, None)
+        self._dict.del_folded(k)
+
+    def _purge(self, now: float) -> int:
+        """
+        Remove the items that have expired at the time, and return their
+        number.
+        """
+        removed = 0
+        expires = self._expires
+        queue = self._queue
+        while queue:
+            k = next(iter(queue))
+            if expires[k] > now:
+                break
+            self._remove(k)
+            removed += 1
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expiry, _, k = heappop(heap)
+            if k not in queue and expires.get(k) == expiry:
+                self._remove(k)
+                removed += 1
+        return removed
+
+    def purge(self) -> int:
+        """
+        Remove all items that have expired.
+
+        Returns:
+          int: The number of removed items.
+        """
+        return self._purge(self._clock())
+
+    def _check_expired(self, k: Key) -> bool:
+        """
+        Return a boolean indicating whether the item with the casefolded key
+        has expired, and remove it if so.
+        """
+        expiry = self._expires.get(k)
+        if expiry is not None and expiry <= self._clock():
+            self._remove(k)
+            return True
+        return False
+
+    def __getitem__(self, key: Key) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively) that has not expired.
+
+        Invoked when using e.g.: ``value = ttld[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively) or has expired.
+        """
+        # Inlined _casefolded_key() and _check_expired() for performance
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        value = self._data.get(k, _OMITTED)
+        if value is not _OMITTED:
+            expiry = self._expires.get(k)
+            if expiry is None or expiry > self._clock():
+                return value
+            self._remove(k)
+        raise KeyError(f"Key {key!r} not found")
+
+    def get(self, key: Key, default: Any = None) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively) that has not expired, or otherwise a default
+        value.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        # Inlined like in __getitem__()
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        value = self._data.get(k, _OMITTED)
+        if value is not _OMITTED:
+            expiry = self._expires.get(k)
+            if expiry is None or expiry > self._clock():
+                return value
+            self._remove(k)
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Return a boolean indicating whether the dictionary contains an item
+        with the key (looked up case-insensitively) that has not expired.
+
+        Invoked when using: ``key in ttld``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        k = self._casefolded_key(key)
+        return k in self._data and not self._check_expired(k)
+
+    def set(self, key: Key, value: Any, ttl: Any = _OMITTED) -> None:
+        """
+        Update the value of the item with an existing key (looked up
+        case-insensitively), or if an item with the key does not exist, add
+        an item with the specified key and value. The item expires after
+        the specified TTL.
+
+        Before that, the items that have expired are removed.
+
+        Parameters:
+
+          key (str or bytes): The key of the item.
+
+          value (object): The value of the item.
+
+          ttl (float): Time-to-live of the item in seconds. Must be positive.
+            `None` means that the item does not expire. If omitted, the
+            default TTL of the dictionary is used.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          ValueError: Invalid ttl.
+        """
+        if ttl is _OMITTED:
+            ttl = self._ttl
+        else:
+            _check_ttl(ttl)
+        now = self._clock()
+        self._purge(now)
+
+        k, key = self._dict._stored_key(key)  # pylint: disable=W0212
+        self._dict.set_folded(k, key, value)
+
+        queue = self._queue
+        queue.pop(k, None)
+        if ttl is None:
+            self._expires.pop(k, None)
+            return
+        expiry = now + ttl
+        self._expires[k] = expiry
+        if ttl == self._ttl:
+            # The clock does not go backwards, so the queue remains ordered
+            queue[k] = None
+        else:
+            heap = self._heap
+            heappush(heap, (expiry, next(self._counter), k))
+            if len(heap) > 2 * len(self._expires) + 64:
+                self._compact_heap()
+
+    def _compact_heap(self) -> None:
+        """
+        Remove the heap entries for items that have been set again or
+        deleted.
+        """
+        queue = self._queue
+        expires = self._expires
+        heap = [entry for entry in self._heap
+                if entry[2] not in queue and expires.get(entry[2]) == entry[0]]
+        heapify(heap)
+        self._heap = heap
+
+    def __setitem__(self, key: Key, value: Any) -> None:
+        """
+        Update the value of the item with an existing key (looked up
+        case-insensitively), or if an item with the key does not exist, add
+        an item with the specified key and value. The item expires after
+        the default TTL of the dictionary.
+
+        Invoked when using e.g.: ``ttld[key] = value``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        self.set(key, value)
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Delete the item with an existing key (looked up case-insensitively)
+        that has not expired.
+
+        Invoked when using: ``del ttld[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively) or has expired.
+        """
+        k = self._casefolded_key(key)
+        if k not in self._data or self._check_expired(k):
+            raise KeyError(f"Key {key!r} not found")
+        self._remove(k)
+
+    def clear(self) -> None:
+        """
+        Remove all items from the dictionary.
+        """
+        self._dict.clear()
+        self._expires.clear()
+        self._queue.clear()
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the dictionary, after removing the
+        items that have expired.
+
+        Invoked when using: ``len(ttld)``
+        """
+        self.purge()
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Key]:
+        """
+        Return an iterator through the keys of the dictionary (in the original
+        lexical case), after removing the items that have expired.
+
+        Invoked when using: ``for key in ttld``
+        """
+        self.purge()
+        return iter(self._dict)
+
+    def keys(self) -> dict_keys:
+        """
+        Return a view on the keys of the dictionary (in the original lexical
+        case), after removing the items that have expired.
+        """
+        self.purge()
+        return self._dict.keys()
+
+    def values(self) -> dict_values:
+        """
+        Return a view on the values of the dictionary, after removing the
+        items that have expired.
+        """
+        self.purge()
+        return self._dict.values()
+
+    def items(self) -> dict_items:
+        """
+        Return a view on the items of the dictionary, where each item is a
+        tuple of its key (in the original lexical case) and its value, after
+        removing the items that have expired.
+        """
+        self.purge()
+        return self._dict.items()
+
+    def as_nocasedict(self) -> NocaseDict:
+        """
+        Return a new :class:`~nocasedict.NocaseDict` object with the items of
+        the dictionary that have not expired.
+        """
+        self.purge()
+        return self._dict.copy()
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return a boolean indicating whether the items of the dictionary that
+        have not expired and the items of the other mapping are equal, with
+        the keys compared case-insensitively, like for
+        :class:`~nocasedict.NocaseDict`.
+
+        Invoked when using e.g.: ``ttld == other``
+        """
+        if isinstance(other, NocaseTTLDict):
+            other = other.as_nocasedict()
+        return self.as_nocasedict() == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the dictionary that is suitable for
+        debugging.
+
+        Invoked when using e.g.: ``repr(ttld)``
+        """
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        items_str = ', '.join(items)
+        return (f"{self.__class__.__name__}({{{items_str}}}, "
+                f"ttl={self._ttl!r})")
+
+
+def _check_ttl(ttl: Optional[float]) -> None:
+    """
+    Check a time-to-live.
+
+    Raises:
+      ValueError: Invalid ttl.
+    """
+    if ttl is not None and ttl <= 0:
+        raise ValueError(f"Invalid ttl: {ttl!r}")
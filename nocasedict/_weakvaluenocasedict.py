@@ -0,0 +1,396 @@
+"""
+This module provides class WeakValueNocaseDict, a case-insensitive dictionary
+that references its values weakly.
+"""
+
+
+from collections.abc import MutableMapping, ItemsView, ValuesView
+from typing import Any, Iterator, List, Tuple
+from weakref import ref
+
+from ._nocasedict import NocaseDict, Key, _OMITTED
+
+__all__ = ['WeakValueNocaseDict']
+
+# Number of items whose values have been garbage collected, at which the
+# modifying methods remove these items.
+REMOVAL_BATCH_SIZE = 64
+
+
+class _KeyedRef(ref):
+    # pylint: disable=too-few-public-methods
+    """
+    Weak reference to a value that also has the casefolded key of its item.
+
+    Unlike :class:`py:weakref.KeyedRef`, the key is set after creating the
+    weak reference, which avoids the Python-level initialization methods of
+    that class.
+    """
+
+    __slots__ = ('key',)
+
+    #: The casefolded key of the item.
+    key: Any
+
+
+class _WeakValuesView(ValuesView):
+    # pylint: disable=too-few-public-methods
+    """
+    Values view of a WeakValueNocaseDict, iterating through the values that
+    are alive.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Any]:
+        # pylint: disable=protected-access
+        for _, value in self._mapping._iter_items():  # type: ignore
+            yield value
+
+
+class _WeakItemsView(ItemsView):
+    # pylint: disable=too-few-public-methods
+    """
+    Items view of a WeakValueNocaseDict, iterating through the items whose
+    values are alive.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Tuple[Key, Any]]:
+        # pylint: disable=protected-access
+        return self._mapping._iter_items()  # type: ignore
+
+
+class WeakValueNocaseDict(MutableMapping):
+    """
+    A case-insensitive and case-preserving dictionary that references its
+    values weakly, like :class:`py:weakref.WeakValueDictionary`.
+
+    The dictionary is a mutable mapping that stores weak references to its
+    values in a :class:`~nocasedict.NocaseDict` object, so that its keys are
+    looked up case-insensitively and iterated in the order of their addition
+    like for :class:`~nocasedict.NocaseDict`. An item disappears from the
+    dictionary when its value is garbage collected. The values must support
+    weak references.
+
+    When a value is garbage collected, the casefolded key of its item is only
+    recorded. The items of the recorded keys are removed together when
+    enough of them have been recorded and the dictionary is modified, or when
+    getting its length. Until then, they are skipped when looking up keys and
+    when iterating. Values that are garbage collected during an iteration
+    therefore do not change the dictionary that is being iterated.
+
+    Objects of this class are not thread-safe, except that values may be
+    garbage collected in other threads.
+
+    Example::
+
+        from nocasedict import WeakValueNocaseDict
+
+        instances = WeakValueNocaseDict()
+        instances[path] = instance  # instance is e.g. a parsed CIM instance
+
+        print(instances.get(path.upper()) is instance)
+        # True
+
+        del instance  # Removes the item when it was the last reference
+    """
+
+    __slots__ = ('_dict', '_data', '_pending_removals', '_iterating',
+                 '_remove', '__weakref__')
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Parameters:
+
+          *args: An optional single positional argument with the initial
+            items, like for :class:`~nocasedict.NocaseDict`.
+
+          **kwargs: Optional keyword arguments with additional initial
+            items, like for :class:`~nocasedict.NocaseDict`.
+
+        Raises:
+          TypeError: Expected at most 1 positional argument, got {n}.
+          TypeError: A value does not support weak references.
+        """
+
+        # The items of the dictionary, with weak references to the values
+        # whose key is the casefolded key. The dictionary accesses the
+        # internal dictionary of the NocaseDict object directly, using the
+        # casefolded keys.
+        self._dict = NocaseDict()
+        self._data = self._dict._data  # pylint: disable=protected-access
+
+        # Casefolded keys of the items whose values have been garbage
+        # collected, and that have not been removed yet.
+        self._pending_removals: List[Key] = []
+
+        # Number of active iterations, during which the items whose values
+        # have been garbage collected are not removed.
+        self._iterating = 0
+
+        def remove(wr: _KeyedRef, selfref: ref = ref(self)) -> None:
+            # Weak reference callback. It only records the key, so that it
+            # does not modify the dictionary at an arbitrary point in time.
+            # The dictionary is referenced weakly to avoid a reference cycle.
+            self = selfref()  # pylint: disable=redefined-outer-name
+            if self is not None:
+                self._pending_removals.append(wr.key)
+
+        self._remove = remove
+        self.update(*args, **kwargs)
+
+    def _casefolded_key(self, key: Key) -> Key:
+        """
+        Return the casefolded key, like NocaseDict does.
+        """
+        # pylint: disable=protected-access
+        return self._dict._casefolded_key(key)
+
+    def _commit_removals(self) -> None:
+        """
+        Remove the items whose values have been garbage collected, unless
+        the dictionary is being iterated.
+        """
+        if self._iterating:
+            return
+        pending = self._pending_removals
+        data = self._data
+        while pending:
+            k = pending.pop()
+            wr = data.get(k)
+            # The item may have been set again in the meantime
+            if wr is not None and wr() is None:
+                self._dict.del_folded(k)
+
+    def __getitem__(self, key: Key) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively) whose value is alive.
+
+        Invoked when using e.g.: ``value = wvd[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively).
+        """
+        # Inlined _casefolded_key() for performance
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        wr = self._data.get(k)
+        if wr is not None:
+            value = wr()
+            if value is not None:
+                return value
+        raise KeyError(f"Key {key!r} not found")
+
+    def get(self, key: Key, default: Any = None) -> Any:
+        """
+        Return the value of the item with an existing key (looked up
+        case-insensitively) whose value is alive, or otherwise a default
+        value.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        # Inlined like in __getitem__()
+        # pylint: disable=protected-access
+        if isinstance(key, str) and NocaseDict._inline_str_casefold:
+            k: Key = key.casefold()
+        else:
+            k = self._casefolded_key(key)
+        wr = self._data.get(k)
+        if wr is not None:
+            value = wr()
+            if value is not None:
+                return value
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Return a boolean indicating whether the dictionary contains an item
+        with the key (looked up case-insensitively) whose value is alive.
+
+        Invoked when using: ``key in wvd``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+        """
+        wr = self._data.get(self._casefolded_key(key))
+        return wr is not None and wr() is not None
+
+    def __setitem__(self, key: Key, value: Any) -> None:
+        """
+        Update the value of the item with an existing key (looked up
+        case-insensitively), or if an item with the key does not exist, add
+        an item with the specified key and value.
+
+        Invoked when using e.g.: ``wvd[key] = value``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          TypeError: The value does not support weak references.
+        """
+        if len(self._pending_removals) >= REMOVAL_BATCH_SIZE:
+            self._commit_removals()
+        k, key = self._dict._stored_key(key)  # pylint: disable=W0212
+        wr = _KeyedRef(value, self._remove)
+        wr.key = k
+        self._dict.set_folded(k, key, wr)
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Delete the item with an existing key (looked up case-insensitively)
+        whose value is alive.
+
+        Invoked when using: ``del wvd[key]``
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively).
+        """
+        if len(self._pending_removals) >= REMOVAL_BATCH_SIZE:
+            self._commit_removals()
+        k = self._casefolded_key(key)
+        wr = self._data.get(k)
+        if wr is None or wr() is None:
+            raise KeyError(f"Key {key!r} not found")
+        self._dict.del_folded(k)
+
+    def pop(self, key: Key, default: Any = _OMITTED) -> Any:
+        """
+        Remove the item with the specified key if it exists (looked up
+        case-insensitively) and its value is alive, and return its value.
+
+        If there is no such item, the default value is returned if specified,
+        otherwise :exc:`py:KeyError` is raised.
+
+        Raises:
+          AttributeError: The key does not have the casefold method.
+          KeyError: Key does not exist (case-insensitively) and no default was
+            specified.
+        """
+        if len(self._pending_removals) >= REMOVAL_BATCH_SIZE:
+            self._commit_removals()
+        k = self._casefolded_key(key)
+        wr = self._data.get(k)
+        value = None if wr is None else wr()
+        if value is None:
+            if default is _OMITTED:
+                raise KeyError(f"Key {key!r} not found")
+            return default
+        self._dict.del_folded(k)
+        return value
+
+    def popitem(self) -> Tuple[Key, Any]:
+        """
+        Remove the last added item whose value is alive, and return it as a
+        tuple (key, value).
+
+        Raises:
+          KeyError: The dictionary has no items whose values are alive.
+        """
+        if len(self._pending_removals) >= REMOVAL_BATCH_SIZE:
+            self._commit_removals()
+        while True:
+            key, wr = self._dict.popitem()
+            value = wr()
+            if value is not None:
+                return key, value
+
+    def clear(self) -> None:
+        """
+        Remove all items from the dictionary.
+        """
+        self._dict.clear()
+        del self._pending_removals[:]
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the dictionary whose values are alive.
+
+        Invoked when using: ``len(wvd)``
+        """
+        if self._pending_removals:
+            self._commit_removals()
+            if self._pending_removals:
+                # The items cannot be removed during an iteration
+                return sum(1 for wr in self._data.values()
+                           if wr() is not None)
+        return len(self._data)
+
+    def _iter_items(self) -> Iterator[Tuple[Key, Any]]:
+        """
+        Return an iterator through the items whose values are alive, with
+        the keys in the original lexical case.
+        """
+        self._iterating += 1
+        try:
+            for key, wr in self._dict.items():
+                value = wr()
+                if value is not None:
+                    yield key, value
+        finally:
+            self._iterating -= 1
+
+    def __iter__(self) -> Iterator[Key]:
+        """
+        Return an iterator through the keys of the items whose values are
+        alive (in the original lexical case).
+
+        Invoked when using: ``for key in wvd``
+        """
+        for key, _ in self._iter_items():
+            yield key
+
+    def values(self) -> ValuesView:
+        """
+        Return a view on the values of the dictionary that are alive.
+        """
+        return _WeakValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+        Return a view on the items of the dictionary whose values are alive,
+        where each item is a tuple of its key (in the original lexical case)
+        and its value.
+        """
+        return _WeakItemsView(self)
+
+    def as_nocasedict(self) -> NocaseDict:
+        """
+        Return a new :class:`~nocasedict.NocaseDict` object with the items of
+        the dictionary whose values are alive, that references the values
+        strongly.
+        """
+        return NocaseDict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return a boolean indicating whether the items of the dictionary whose
+        values are alive and the items of the other mapping are equal, with
+        the keys compared case-insensitively, like for
+        :class:`~nocasedict.NocaseDict`.
+
+        Invoked when using e.g.: ``wvd == other``
+        """
+        if isinstance(other, WeakValueNocaseDict):
+            other = other.as_nocasedict()
+        return self.as_nocasedict() == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the dictionary that is suitable for
+        debugging.
+
+        Invoked when using e.g.: ``repr(wvd)``
+        """
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        items_str = ', '.join(items)
+        return f"{self.__class__.__name__}({{{items_str}}})"
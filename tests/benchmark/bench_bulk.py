@@ -0,0 +1,61 @@
+"""
+Benchmark for creating NocaseDict objects in bulk.
+
+Creates dictionaries with 1 million items with mixed case keys and with lower
+case keys, and compares the time for:
+
+* NocaseDict initialized from a list of pairs, which adds the items one by one
+* NocaseDict.from_pairs() from a list of pairs
+* NocaseDict.from_mapping() from a standard dict
+* The standard dict initialized from a list of pairs, as a baseline
+"""
+
+
+import gc
+import time
+
+from nocasedict import NocaseDict
+
+from .benchutils import print_table
+
+NUM_ITEMS = 1000000
+
+
+def time_ms(func, arg, repeat=3):
+    """
+    Return the best time in ms for calling a function with an argument.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(arg)
+        end = time.perf_counter()
+        del result
+        times.append(end - start)
+    return min(times) * 1000
+
+
+def main():
+    """Run the benchmark"""
+
+    rows = []
+    for desc, key_case in (('mixed', str.title), ('lower', str.lower)):
+        pairs = [(key_case(f'property_name_{i}'), i) for i in range(NUM_ITEMS)]
+        mapping = dict(pairs)
+        rows.append([
+            desc,
+            time_ms(NocaseDict, pairs),
+            time_ms(NocaseDict.from_pairs, pairs),
+            time_ms(NocaseDict.from_mapping, mapping),
+            time_ms(dict, pairs),
+        ])
+    print_table(
+        f"Time for creating a dictionary with {NUM_ITEMS} items",
+        ['Keys', 'NocaseDict(pairs) (ms)', 'from_pairs() (ms)',
+         'from_mapping() (ms)', 'dict(pairs) (ms)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark for NocaseDict objects with byte string keys.
+
+Compares the per-operation latency of common operations for:
+
+* NocaseDict, which looks up the casefold function by the type of the key
+* A subclass with the previous casefold method, which tried str.casefold()
+  and fell back to bytes.lower() when AttributeError was raised
+* NocaseDict with the equivalent unicode string keys
+* The standard dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class TryExceptNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict with the previous casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        try:
+            return key.casefold()
+        except AttributeError:
+            return key.lower()
+
+
+NUM_KEYS = 20
+
+OPERATIONS = [
+    ('getitem', 'obj[key]'),
+    ('setitem', 'obj[key] = 2'),
+    ('contains', 'key in obj'),
+    ('get', 'obj.get(key)'),
+]
+
+
+def main():
+    """Run the benchmark"""
+
+    rows = []
+    for cls_desc, cls, key_type in (
+            ('NocaseDict', NocaseDict, bytes),
+            ('try/except casefold', TryExceptNocaseDict, bytes),
+            ('NocaseDict', NocaseDict, str),
+            ('dict', dict, bytes)):
+        keys = [f'CIM_Property{i}' for i in range(NUM_KEYS)]
+        if key_type is bytes:
+            keys = [k.encode('utf-8') for k in keys]
+        obj = cls([(k, 1) for k in keys])
+        ns = {'obj': obj, 'key': keys[NUM_KEYS // 2]}
+        row = [cls_desc, key_type.__name__]
+        row.extend(time_per_op(stmt, globals=ns) for _, stmt in OPERATIONS)
+        rows.append(row)
+    print_table(
+        "Time per operation in ns",
+        ['Class', 'Keys'] + [op for op, _ in OPERATIONS], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark for the casefolding of keys in NocaseDict lookups and updates.
+
+Compares the per-operation latency of __getitem__() and __setitem__() for:
+
+* NocaseDict, where str keys are casefolded inline
+* A subclass that overrides __casefold__() with the default implementation,
+  i.e. the code path without inline casefolding
+* The standard dict, as a baseline
+
+It also shows why NocaseDict does not check str.isascii() before casefolding:
+str.casefold() already has an internal fast path for ASCII strings.
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class OverridingNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict with an overriding casefold method that does the same as the
+    default casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return NocaseDict.__casefold__(key)
+
+
+KEYS = {
+    'ASCII': 'InstanceID',
+    'non-ASCII': 'Straße',
+}
+
+
+def main():
+    """Run the benchmark"""
+
+    rows = []
+    for key_desc, key in KEYS.items():
+        for cls_desc, cls in (('NocaseDict', NocaseDict),
+                              ('overriding __casefold__',
+                               OverridingNocaseDict),
+                              ('dict', dict)):
+            obj = cls([(key, 1)])
+            ns = {'obj': obj, 'key': key}
+            rows.append([
+                key_desc, cls_desc,
+                time_per_op('obj[key]', globals=ns),
+                time_per_op('obj[key] = 2', globals=ns),
+            ])
+    print_table(
+        "Time per operation in ns",
+        ['Key', 'Class', 'getitem', 'setitem'], rows)
+
+    rows = []
+    for key_desc, key in KEYS.items():
+        ns = {'key': key}
+        rows.append([
+            key_desc,
+            time_per_op('key.casefold()', globals=ns),
+            time_per_op('key.lower() if key.isascii() else key.casefold()',
+                        globals=ns),
+        ])
+    print_table(
+        "Time per casefold in ns",
+        ['Key', 'casefold()', 'isascii() + lower()'], rows)
+
+
+if __name__ == '__main__':
+    main()
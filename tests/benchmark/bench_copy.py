@@ -0,0 +1,61 @@
+"""
+Benchmark for copying and merging NocaseDict objects.
+
+Compares the time for copying and merging dictionaries with 10000 items for:
+
+* NocaseDict from NocaseDict, where the internal dictionaries are merged in
+  bulk because both use the same casefold method
+* NocaseDict from a NocaseDict subclass with a different casefold method,
+  where each key needs to be casefolded in a Python loop
+* The standard dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class OtherNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict with a different (but equivalent) casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.casefold()
+
+
+NUM_ITEMS = 10000
+
+OPERATIONS = [
+    ('copy()', 'src.copy()'),
+    ('init', 'cls(src)'),
+    ('update()', 'cls().update(src)'),
+    ('|', 'dst | src'),
+]
+
+
+def main():
+    """Run the benchmark"""
+
+    items = [(f'CIM_Property{i}', i) for i in range(NUM_ITEMS)]
+
+    rows = []
+    for desc, cls, src_cls in (
+            ('NocaseDict from NocaseDict', NocaseDict, NocaseDict),
+            ('NocaseDict from other casefold', NocaseDict, OtherNocaseDict),
+            ('dict from dict', dict, dict)):
+        ns = {'cls': cls, 'src': src_cls(items), 'dst': cls(items[:10])}
+        row = [desc]
+        row.extend(time_per_op(stmt, globals=ns, number=20) / 1000
+                   for _, stmt in OPERATIONS)
+        rows.append(row)
+    print_table(
+        f"Time per operation in us, for {NUM_ITEMS} items",
+        ['Operation'] + [op for op, _ in OPERATIONS], rows)
+
+
+if __name__ == '__main__':
+    main()
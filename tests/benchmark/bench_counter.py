@@ -0,0 +1,83 @@
+"""
+Benchmark for NocaseCounter.
+
+Compares counting 100000 keys in mixed lexical case with 1000 distinct keys
+with NocaseCounter, with the ``ncd[key] = ncd.get(key, 0) + 1`` idiom on
+NocaseDict, and with collections.Counter on input that is lowercased in
+advance, and on input that is lowercased while counting. Also compares
+merging counters and getting the most common keys.
+"""
+
+
+import random
+from collections import Counter
+
+from nocasedict import NocaseDict, NocaseCounter
+
+from .benchutils import time_per_op, print_table
+
+NUM_RECORDS = 100000
+NUM_KEYS = 1000
+NUM_MOST_COMMON = 10
+
+
+def count_nocasedict(keys):
+    """Count the keys with the get() idiom on NocaseDict"""
+    dct = NocaseDict()
+    for key in keys:
+        dct[key] = dct.get(key, 0) + 1
+    return dct
+
+
+def main():
+    """Run the benchmark"""
+
+    rnd = random.Random(1)
+    names = [f'CIM_ComputerSystem{i}' for i in range(NUM_KEYS)]
+    keys = [rnd.choice(names) for _ in range(NUM_RECORDS)]
+    keys = [key.upper() if i % 3 == 0 else key for i, key in enumerate(keys)]
+    lower_keys = [key.lower() for key in keys]
+    namespace = {
+        'keys': keys, 'lower_keys': lower_keys,
+        'count_nocasedict': count_nocasedict,
+        'NocaseCounter': NocaseCounter, 'Counter': Counter,
+        'ncc': NocaseCounter(keys), 'ncc2': NocaseCounter(keys),
+        'cc': Counter(lower_keys), 'cc2': Counter(lower_keys),
+        'n': NUM_MOST_COMMON,
+    }
+
+    rows = []
+    for desc, stmt in (
+            ('NocaseDict get() idiom', 'count_nocasedict(keys)'),
+            ('NocaseCounter', 'NocaseCounter(keys)'),
+            ('Counter (lowercased input)', 'Counter(lower_keys)'),
+            ('Counter (lowercased while counting)',
+             'Counter(map(str.lower, keys))')):
+        rows.append([
+            desc,
+            time_per_op(stmt, globals=namespace, repeat=3) / NUM_RECORDS,
+        ])
+    print_table(
+        f"Time per counted key, {NUM_RECORDS} keys, {NUM_KEYS} distinct",
+        ['Counting', 'Time (ns)'],
+        rows)
+
+    rows = []
+    for desc, merge, most_common in (
+            ('NocaseCounter', 'ncc.copy().update(ncc2)',
+             'ncc.most_common(n)'),
+            ('Counter', 'cc.copy().update(cc2)', 'cc.most_common(n)')):
+        rows.append([
+            desc,
+            time_per_op(merge, globals=namespace, repeat=3) / 1000,
+            time_per_op(most_common, globals=namespace, repeat=3) / 1000,
+        ])
+    print_table(
+        f"Time per operation on counters with {NUM_KEYS} keys",
+        ['Counter', 'Copy and update (us)',
+         f'most_common({NUM_MOST_COMMON}) (us)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
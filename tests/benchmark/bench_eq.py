@@ -0,0 +1,71 @@
+"""
+Benchmark for comparing NocaseDict objects for equality.
+
+Compares the time for equal and unequal comparisons (the last value differs)
+at different sizes for:
+
+* NocaseDict == NocaseDict, comparing the casefolded keys directly
+* NocaseDict == dict, casefolding the keys of the dict once
+* The previous implementation, that looked up each key with 'in' and
+  subscription in the other dictionary
+* dict == dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class GenericEqNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict with the previous implementation of __eq__().
+    """
+
+    def __eq__(self, other):
+        for key, self_value in self.items():
+            if key not in other:
+                return False
+            if not self_value == other[key]:
+                return False
+        return len(self) == len(other)
+
+    __hash__ = None
+
+
+SIZES = [10, 1000, 100000]
+
+
+def main():
+    """Run the benchmark"""
+
+    rows = []
+    for size in SIZES:
+        items = [(f'CIM_Property{i}', i) for i in range(size)]
+        upper_items = [(k.upper(), v) for k, v in items]
+        number = max(1, 100000 // size)
+        for desc, cls, other_cls in (
+                ('NocaseDict == NocaseDict', NocaseDict, NocaseDict),
+                ('NocaseDict == dict', NocaseDict, dict),
+                ('previous, NocaseDict', GenericEqNocaseDict, NocaseDict),
+                ('dict == dict', dict, dict)):
+            other_items = items if cls is dict else upper_items
+            other_unequal = other_items[:-1] + [(other_items[-1][0], -1)]
+            ns = {'obj': cls(items), 'other': other_cls(other_items),
+                  'unequal': other_cls(other_unequal)}
+            assert ns['obj'] == ns['other']
+            assert ns['obj'] != ns['unequal']
+            rows.append([
+                size, desc,
+                time_per_op('obj == other', globals=ns, number=number) / 1000,
+                time_per_op('obj == unequal', globals=ns,
+                            number=number) / 1000,
+            ])
+    print_table(
+        "Time per comparison in us",
+        ['Size', 'Comparison', 'equal', 'unequal'], rows)
+
+
+if __name__ == '__main__':
+    main()
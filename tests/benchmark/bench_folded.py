@@ -0,0 +1,48 @@
+"""
+Benchmark for the NocaseDict methods that take casefolded keys.
+
+Compares the time per operation on a NocaseDict with 20 mixed case keys, for
+the methods that casefold the key and the corresponding methods that take
+the casefolded key, for a key that is found and a key that is not found.
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+NUM_KEYS = 20
+
+
+def main():
+    """Run the benchmark"""
+
+    names = [f'PropertyName{i}' for i in range(NUM_KEYS)]
+    obj = NocaseDict.fromkeys(names, 0)
+    operations = [
+        ('get', 'obj.get(key)', 'obj.get_folded(k)'),
+        ('contains', 'key in obj', 'obj.contains_folded(k)'),
+        ('set', 'obj[key] = 1', 'obj.set_folded(k, key, 1)'),
+    ]
+
+    rows = []
+    for found in (True, False):
+        key = 'PropertyName10' if found else 'PropertyName99'
+        namespace = {'obj': obj, 'key': key, 'k': key.casefold()}
+        for desc, stmt, folded_stmt in operations:
+            if desc == 'set' and not found:
+                continue
+            rows.append([
+                desc,
+                'found' if found else 'not found',
+                time_per_op(stmt, globals=namespace),
+                time_per_op(folded_stmt, globals=namespace),
+            ])
+    print_table(
+        f"Time per operation on a NocaseDict with {NUM_KEYS} keys",
+        ['Operation', 'Key', 'key (ns)', 'casefolded key (ns)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
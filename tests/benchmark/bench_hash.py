@@ -0,0 +1,65 @@
+"""
+Benchmark for hashing NocaseDict objects with HashableMixin.
+
+Compares the time for repeated hash() calls on an unmodified dictionary, and
+for deduplicating a list of dictionaries with a set, for:
+
+* HashableMixin, which caches the hash value
+* The previous implementation, which calculated the hash value on every call
+"""
+
+
+from nocasedict import NocaseDict, HashableMixin
+
+from .benchutils import time_per_op, print_table
+
+
+class CachedHashNocaseDict(HashableMixin, NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    Hashable NocaseDict.
+    """
+
+
+class UncachedHashNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    Hashable NocaseDict with the previous implementation of __hash__().
+    """
+
+    def __hash__(self):
+        fs = frozenset([(knc, self.__getitem__(knc))
+                        for knc in self.keys_nocase()])
+        return hash(fs)
+
+
+SIZES = [10, 100, 1000]
+NUM_DICTS = 1000
+
+
+def main():
+    """Run the benchmark"""
+
+    rows = []
+    for size in SIZES:
+        items = [(f'CIM_Property{i}', i) for i in range(size)]
+        for desc, cls in (('cached', CachedHashNocaseDict),
+                          ('uncached', UncachedHashNocaseDict)):
+            obj = cls(items)
+            # Half of the dicts are duplicates
+            objs = [cls(items[:-1] + [('Key', i // 2)])
+                    for i in range(NUM_DICTS)]
+            ns = {'obj': obj, 'objs': objs}
+            rows.append([
+                size, desc,
+                time_per_op('hash(obj)', globals=ns) / 1000,
+                time_per_op('set(objs)', globals=ns, number=3) / 1000,
+            ])
+    print_table(
+        "Time in us for hash(obj), and for set() of "
+        f"{NUM_DICTS} dicts with duplicates",
+        ['Size', 'Hash', 'hash(obj)', 'set(objs)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark for key interning.
+
+Creates 10000 NocaseDict objects from JSON lines with 20 mixed case keys each,
+where each line is parsed separately so that the keys are new string objects
+for each line, and compares with key interning disabled and enabled:
+
+* create: Time per object for parsing the line and creating the object, in us
+* memory: Bytes allocated per object that remain allocated, including the
+  keys but not the values
+* lookup: Time for looking up a key in a different lexical case, in ns
+"""
+
+
+import json
+import time
+import tracemalloc
+
+from nocasedict import NocaseDict, enable_key_interning, \
+    disable_key_interning, key_interning_info
+
+from .benchutils import time_per_op, print_table
+
+NUM_OBJECTS = 10000
+NUM_KEYS = 20
+
+
+def create(lines, interning):
+    """
+    Return the NocaseDict objects created from the JSON lines, the time per
+    object in us and the memory per object in bytes.
+    """
+    if interning:
+        enable_key_interning()
+    start = time.perf_counter()
+    objects = [NocaseDict(json.loads(line)) for line in lines]
+    end = time.perf_counter()
+    del objects
+    if interning:
+        # Start over with an empty intern pool for measuring the memory
+        enable_key_interning()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [NocaseDict(json.loads(line)) for line in lines]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (objects, (end - start) / len(lines) * 1e6,
+            (after - before) / len(lines))
+
+
+def main():
+    """Run the benchmark"""
+
+    names = [f'PropertyName{i}' for i in range(NUM_KEYS)]
+    # The values are small integers, which are cached by Python, so that
+    # they do not contribute to the memory.
+    lines = [json.dumps(dict.fromkeys(names, i % 100))
+             for i in range(NUM_OBJECTS)]
+
+    rows = []
+    for desc, interning in (('disabled', False), ('enabled', True)):
+        try:
+            objects, create_us, memory = create(lines, interning)
+            lookup_ns = time_per_op(
+                'obj[key]',
+                globals={'obj': objects[-1], 'key': 'PROPERTYNAME10'})
+            info = key_interning_info()
+        finally:
+            disable_key_interning()
+        rows.append([desc, create_us, memory, lookup_ns,
+                     info.saved_bytes / NUM_OBJECTS if info else 0.0])
+        del objects
+
+    print_table(
+        f"Time and memory per NocaseDict object, for {NUM_OBJECTS} objects "
+        f"with {NUM_KEYS} keys",
+        ['Key interning', 'create (us)', 'memory (bytes)', 'lookup (ns)',
+         'saved (bytes)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
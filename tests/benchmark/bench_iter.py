@@ -0,0 +1,67 @@
+"""
+Benchmark for iterating through NocaseDict objects.
+
+Compares the time per iterated item of a dictionary with 1000 items with
+mixed case keys and with lower case keys for:
+
+* NocaseDict, whose iterators are C-level iterators over the underlying
+  dictionary
+* A subclass with a generator based iterator, which looks up the original
+  key of each item in a separate step
+* The standard dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class GeneratorNocaseDict(NocaseDict):
+    """
+    NocaseDict with a generator based iterator.
+    """
+
+    def __iter__(self):
+        keys = self._keys
+        for k in self._data:
+            yield keys.get(k, k)
+
+
+NUM_ITEMS = 1000
+
+OPERATIONS = [
+    ('for key in obj', 'for _ in obj: pass'),
+    ('keys()', 'for _ in obj.keys(): pass'),
+    ('values()', 'for _ in obj.values(): pass'),
+    ('items()', 'for _ in obj.items(): pass'),
+    ('list(obj)', 'list(obj)'),
+]
+
+
+def main():
+    """Run the benchmark"""
+
+    for keys_desc, items in (
+            ('mixed case keys',
+             [(f'Property{i}', i) for i in range(NUM_ITEMS)]),
+            ('lower case keys',
+             [(f'property{i}', i) for i in range(NUM_ITEMS)])):
+        rows = []
+        for cls_desc, cls in (('NocaseDict', NocaseDict),
+                              ('generator __iter__', GeneratorNocaseDict),
+                              ('dict', dict)):
+            obj = cls(items)
+            ns = {'obj': obj}
+            row = [cls_desc]
+            for _, stmt in OPERATIONS:
+                row.append(time_per_op(stmt, globals=ns) / NUM_ITEMS)
+            rows.append(row)
+        print_table(
+            f"Time per iterated item in ns, for {NUM_ITEMS} items with "
+            f"{keys_desc}",
+            ['Class'] + [op for op, _ in OPERATIONS], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark for the storage layout of large NocaseDict objects.
+
+Compares, for dictionaries with 1 million entries:
+
+* the time per __setitem__() when filling the dictionary,
+* the pause time of a full garbage collection with gc.collect() while the
+  dictionary exists,
+
+for:
+
+* NocaseDict, which stores the values directly in its internal dictionary,
+  and the original keys only if they differ from the casefolded keys
+* TupleLayoutDict, a minimal dictionary class with the storage layout
+  NocaseDict had before, which allocated an (original key, value) tuple per
+  entry
+* The standard dict, as a baseline
+
+The values are lists, so that they are tracked by the garbage collector (as
+are most objects used as values in practice). The tuples of the previous
+layout are tracked as well, because they reference such values.
+
+The memory used per entry is measured by the bench_memory benchmark.
+"""
+
+
+import gc
+import time
+
+from nocasedict import NocaseDict
+
+from .benchutils import print_table
+
+
+class TupleLayoutDict:
+    # pylint: disable=too-few-public-methods
+    """
+    Minimal case-insensitive dictionary with the previous storage layout.
+    """
+
+    def __init__(self):
+        self._data = {}
+
+    def __setitem__(self, key, value):
+        self._data[key.casefold()] = (key, value)
+
+
+NUM_ENTRIES = 1000000
+NUM_COLLECTS = 3
+
+
+def setitem_time(cls, keys, values):
+    """
+    Return a new dictionary filled with the keys and values, and the time per
+    __setitem__() in ns.
+    """
+    obj = cls()
+    start = time.perf_counter()
+    for key, value in zip(keys, values):
+        obj[key] = value
+    end = time.perf_counter()
+    return obj, (end - start) / len(keys) * 1e9
+
+
+def collect_time():
+    """
+    Return the best pause time of a full garbage collection in ms.
+    """
+    times = []
+    for _ in range(NUM_COLLECTS):
+        start = time.perf_counter()
+        gc.collect()
+        end = time.perf_counter()
+        times.append(end - start)
+    return min(times) * 1e3
+
+
+def main():
+    """Run the benchmark"""
+
+    values = [[i] for i in range(NUM_ENTRIES)]
+    for keys_desc, keys in (
+            ('mixed case keys',
+             [f'Property{i}' for i in range(NUM_ENTRIES)]),
+            ('lower case keys',
+             [f'property{i}' for i in range(NUM_ENTRIES)])):
+        rows = []
+        for cls_desc, cls in (('NocaseDict', NocaseDict),
+                              ('TupleLayoutDict', TupleLayoutDict),
+                              ('dict', dict)):
+            gc.collect()
+            obj, setitem_ns = setitem_time(cls, keys, values)
+            rows.append([cls_desc, setitem_ns, collect_time()])
+            del obj
+        print_table(
+            f"Times for {NUM_ENTRIES} entries with {keys_desc}",
+            ['Class', 'setitem (ns)', 'gc.collect() (ms)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for NocaseLRUCache.
+
+Looks up a stream of string keys that differ only in lexical case from a set
+of 200 names in caches with a maxsize of 100, computing and caching the value
+on a miss. Compares the time per lookup and the hit rate of NocaseLRUCache
+with both policies and of functools.lru_cache, on the keys as they are and on
+casefolded keys.
+"""
+
+
+import random
+from functools import lru_cache
+
+from nocasedict import NocaseLRUCache
+
+from .benchutils import time_per_op, print_table
+
+NUM_NAMES = 200
+NUM_LOOKUPS = 10000
+MAXSIZE = 100
+
+
+def compute(key):
+    """The function whose values are cached"""
+    return key.upper()
+
+
+def nocase_lookups(cache, keys):
+    """Look up the keys in a NocaseLRUCache, computing values on a miss"""
+    for key in keys:
+        value = cache.get(key)
+        if value is None:
+            cache[key] = compute(key)
+
+
+def random_case(name, rnd):
+    """Return the name with random lexical case"""
+    return ''.join(c.upper() if rnd.random() < 0.5 else c.lower()
+                   for c in name)
+
+
+def main():
+    """Run the benchmark"""
+
+    rnd = random.Random(42)
+    names = [f'PropertyName{i}' for i in range(NUM_NAMES)]
+    # Skewed access pattern, so that some names are used more often
+    keys = [random_case(rnd.choice(names[:rnd.randint(1, NUM_NAMES)]), rnd)
+            for _ in range(NUM_LOOKUPS)]
+
+    rows = []
+    for policy in ('lru', 'lfu'):
+        namespace = {'nocase_lookups': nocase_lookups, 'keys': keys,
+                     'NocaseLRUCache': NocaseLRUCache, 'policy': policy,
+                     'MAXSIZE': MAXSIZE}
+        cache = NocaseLRUCache(maxsize=MAXSIZE, policy=policy)
+        nocase_lookups(cache, keys)
+        info = cache.cache_info()
+        rows.append([
+            f'NocaseLRUCache({policy})',
+            time_per_op(
+                'nocase_lookups(NocaseLRUCache(MAXSIZE, policy), keys)',
+                globals=namespace, repeat=3) / NUM_LOOKUPS,
+            100 * info.hits / (info.hits + info.misses),
+        ])
+
+    for desc, stmt in (
+            ('lru_cache', '[cached(key) for key in keys]'),
+            ('lru_cache(casefold)',
+             '[cached(key.casefold()) for key in keys]')):
+        namespace = {'lru_cache': lru_cache, 'compute': compute,
+                     'keys': keys, 'MAXSIZE': MAXSIZE}
+        setup = 'cached = lru_cache(MAXSIZE)(compute)'
+        exec(setup, namespace)  # pylint: disable=exec-used
+        exec(stmt, namespace)  # pylint: disable=exec-used
+        info = namespace['cached'].cache_info()
+        rows.append([
+            desc,
+            time_per_op(stmt, setup, globals=namespace,
+                        repeat=3) / NUM_LOOKUPS,
+            100 * info.hits / (info.hits + info.misses),
+        ])
+
+    print_table(
+        f"Time per lookup of {NUM_LOOKUPS} keys of {NUM_NAMES} names in "
+        f"random case, with maxsize={MAXSIZE}",
+        ['Cache', 'Lookup (ns)', 'Hit rate (%)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark for the memory used by NocaseDict objects.
+
+Measures the memory allocated per dictionary object with tracemalloc, for
+empty dictionaries and dictionaries with 10 items, and compares:
+
+* NocaseDict, whose objects have no __dict__ because it defines __slots__
+* A subclass without __slots__, whose objects have a __dict__ (as NocaseDict
+  objects had before)
+* The standard dict, as a baseline
+
+The memory for the keys and values themselves is not included, because they
+are shared by all dictionary objects.
+
+In addition, measures the memory allocated per entry of a dictionary with
+1 million entries with lower case keys and with mixed case keys, for
+NocaseDict, a standard dict with (original key, value) tuples as values and
+casefolded keys (the storage layout NocaseDict had before), and the standard
+dict. The memory for the original keys and the values is not included.
+"""
+
+
+import tracemalloc
+
+from nocasedict import NocaseDict
+
+from .benchutils import print_table
+
+
+class DictNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict subclass whose objects have a __dict__.
+    """
+    pass
+
+
+NUM_OBJECTS = 10000
+NUM_ENTRIES = 1000000
+
+
+def bytes_per_object(cls, items):
+    """
+    Return the number of bytes allocated per object of a dictionary class
+    that is initialized with the specified items.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [cls(items) for _ in range(NUM_OBJECTS)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (after - before) / NUM_OBJECTS
+
+
+def tuple_layout(items):
+    """
+    Return a standard dict with the storage layout NocaseDict had before.
+    """
+    return {key.casefold(): (key, value) for key, value in items}
+
+
+def bytes_per_entry(func, items):
+    """
+    Return the number of bytes allocated per entry of the dictionary
+    returned by a function that is called with the specified items.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        obj = func(items)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    return (after - before) / len(items)
+
+
+def main():
+    """Run the benchmark"""
+
+    items10 = [(f'Property{i}', i) for i in range(10)]
+
+    rows = []
+    for cls_desc, cls in (('NocaseDict', NocaseDict),
+                          ('with __dict__', DictNocaseDict),
+                          ('dict', dict)):
+        rows.append([cls_desc,
+                     bytes_per_object(cls, []),
+                     bytes_per_object(cls, items10)])
+    print_table(
+        f"Bytes per object, averaged over {NUM_OBJECTS} objects",
+        ['Class', 'empty', '10 items'], rows)
+
+    lower_items = [(f'property{i}', i) for i in range(NUM_ENTRIES)]
+    mixed_items = [(f'Property{i}', i) for i in range(NUM_ENTRIES)]
+
+    rows = []
+    for func_desc, func in (('NocaseDict', NocaseDict),
+                            ('tuple layout', tuple_layout),
+                            ('dict', dict)):
+        rows.append([func_desc,
+                     bytes_per_entry(func, lower_items),
+                     bytes_per_entry(func, mixed_items)])
+    print_table(
+        f"Bytes per entry, for {NUM_ENTRIES} entries",
+        ['Storage', 'lower case keys', 'mixed case keys'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark for NocaseDict lookups with a high miss rate.
+
+Looks up 10 keys of which 7 do not exist in the dictionary, and compares the
+average per-lookup latency for:
+
+* NocaseDict, whose get() and pop() with default do not raise exceptions
+  internally for missing keys
+* A subclass with the previous implementations of get() and pop(), which
+  raised and handled KeyError for missing keys
+* The standard dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+
+class ExceptionNocaseDict(NocaseDict):
+    """
+    NocaseDict with the previous implementations of get() and pop().
+    """
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=None):
+        # pylint: disable=arguments-differ
+        k = self._casefolded_key(key)
+        try:
+            value = self._data.pop(k)
+        except KeyError:
+            return default
+        self._keys.pop(k, None)
+        return value
+
+
+NUM_PROBES = 10
+NUM_MISSES = 7
+
+OPERATIONS = [
+    ('get', 'for key in probes: obj.get(key)'),
+    ('pop (misses only)', 'for key in misses: obj.pop(key, None)'),
+    ('contains', 'for key in probes: key in obj'),
+]
+
+
+def main():
+    """Run the benchmark"""
+
+    present = [f'Qualifier{i}' for i in range(NUM_PROBES - NUM_MISSES)]
+    misses = [f'Missing{i}' for i in range(NUM_MISSES)]
+    probes = [k.upper() for k in present] + misses
+
+    rows = []
+    for cls_desc, cls in (('NocaseDict', NocaseDict),
+                          ('raising KeyError', ExceptionNocaseDict),
+                          ('dict', dict)):
+        obj = cls([(k.upper() if cls is dict else k, 1) for k in present])
+        ns = {'obj': obj, 'probes': probes, 'misses': misses}
+        row = [cls_desc]
+        for _, stmt in OPERATIONS:
+            num = len(misses) if 'misses' in stmt else len(probes)
+            row.append(time_per_op(stmt, globals=ns) / num)
+        rows.append(row)
+    print_table(
+        f"Time per lookup in ns, with {NUM_MISSES} of {NUM_PROBES} lookups "
+        "missing",
+        ['Class'] + [op for op, _ in OPERATIONS], rows)
+
+
+if __name__ == '__main__':
+    main()
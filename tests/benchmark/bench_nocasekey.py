@@ -0,0 +1,54 @@
+"""
+Benchmark for lookups with NocaseKey objects.
+
+Looks up the same key in 10000 NocaseDict objects with 20 keys, and compares
+the time per lookup for a string key and for a NocaseKey object, for
+NocaseDict and for a subclass that overrides the casefold method.
+"""
+
+
+from nocasedict import NocaseDict, NocaseKey
+
+from .benchutils import time_per_op, print_table
+
+NUM_OBJECTS = 10000
+NUM_KEYS = 20
+
+
+class OverridingNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict subclass that overrides the casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.casefold()
+
+
+def main():
+    """Run the benchmark"""
+
+    names = [f'PropertyName{i}' for i in range(NUM_KEYS)]
+    rows = []
+    for cls in (NocaseDict, OverridingNocaseDict):
+        dicts = [cls.fromkeys(names, i) for i in range(NUM_OBJECTS)]
+        for desc, key in (('str', 'PROPERTYNAME10'),
+                          ('NocaseKey', NocaseKey('PROPERTYNAME10'))):
+            namespace = {'dicts': dicts, 'key': key}
+            rows.append([
+                cls.__name__,
+                desc,
+                time_per_op('[d[key] for d in dicts]', globals=namespace,
+                            repeat=3) / NUM_OBJECTS,
+                time_per_op('[key in d for d in dicts]', globals=namespace,
+                            repeat=3) / NUM_OBJECTS,
+            ])
+    print_table(
+        f"Time per lookup of the same key in {NUM_OBJECTS} dictionaries",
+        ['Class', 'Key', 'd[key] (ns)', 'key in d (ns)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
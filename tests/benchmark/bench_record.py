@@ -0,0 +1,87 @@
+"""
+Benchmark for records created with NocaseRecord().
+
+Creates 10000 rows with the same 20 fields with mixed case names, and
+compares the time and the memory per row, and the time per lookup of a field
+by a name in a different lexical case, for:
+
+* A record class created with NocaseRecord()
+* NocaseDict.fromvalues(), which shares the table of field names
+* NocaseDict created from key/value pairs
+* The standard dict, as a baseline (the lookup uses the original name)
+"""
+
+
+import time
+import tracemalloc
+
+from nocasedict import NocaseDict, NocaseRecord
+
+from .benchutils import time_per_op, print_table
+
+NUM_OBJECTS = 10000
+NUM_FIELDS = 20
+
+
+def create_time(func, rows):
+    """
+    Return the time in us per row, for creating one object for each row of
+    values with a function.
+    """
+    start = time.perf_counter()
+    objects = [func(row) for row in rows]
+    end = time.perf_counter()
+    del objects
+    return (end - start) / len(rows) * 1e6
+
+
+def create_memory(func, rows):
+    """
+    Return the memory in bytes per row, and the objects, for creating one
+    object for each row of values with a function.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [func(row) for row in rows]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(rows), objects
+
+
+def main():
+    """Run the benchmark"""
+
+    names = [f'PropertyName{i}' for i in range(NUM_FIELDS)]
+    rows = [list(range(i, i + NUM_FIELDS)) for i in range(NUM_OBJECTS)]
+    Row = NocaseRecord(names, 'Row')  # pylint: disable=invalid-name
+    template = NocaseDict.fromkeys(names)
+
+    funcs = [
+        ('NocaseRecord', lambda row: Row(*row), 'PROPERTYNAME10'),
+        ('NocaseDict.fromvalues()',
+         lambda row: NocaseDict.fromvalues(template, row), 'PROPERTYNAME10'),
+        ('NocaseDict(pairs)', lambda row: NocaseDict(zip(names, row)),
+         'PROPERTYNAME10'),
+        ('dict(pairs)', lambda row: dict(zip(names, row)), 'PropertyName10'),
+    ]
+
+    table_rows = []
+    for func_desc, func, key in funcs:
+        memory, objects = create_memory(func, rows)
+        table_rows.append([
+            func_desc,
+            min(create_time(func, rows) for _ in range(3)),
+            memory,
+            time_per_op('obj[key]', globals={'obj': objects[0], 'key': key}),
+        ])
+    print_table(
+        f"Time and memory per row, for {NUM_OBJECTS} rows with {NUM_FIELDS} "
+        "fields",
+        ['Class', 'create (us)', 'memory (bytes)', 'lookup (ns)'],
+        table_rows)
+
+
+if __name__ == '__main__':
+    main()
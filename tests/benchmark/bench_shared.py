@@ -0,0 +1,81 @@
+"""
+Benchmark for creating many NocaseDict objects with the same keys.
+
+Creates 10000 dictionaries with the same 20 keys in mixed case (e.g. one
+dictionary per CIM instance of a CIM class), and compares the time and the
+memory per dictionary for:
+
+* NocaseDict.fromvalues(), which does not casefold the keys again and shares
+  the table of original keys with the template dictionary
+* NocaseDict created from key/value pairs
+* The standard dict, as a baseline
+"""
+
+
+import time
+import tracemalloc
+
+from nocasedict import NocaseDict
+
+from .benchutils import print_table
+
+NUM_OBJECTS = 10000
+NUM_KEYS = 20
+
+
+def create_time(func, rows):
+    """
+    Return the time in us per dictionary, for creating one dictionary for
+    each row of values with a function.
+    """
+    start = time.perf_counter()
+    objects = [func(row) for row in rows]
+    end = time.perf_counter()
+    del objects
+    return (end - start) / len(rows) * 1e6
+
+
+def create_memory(func, rows):
+    """
+    Return the memory in bytes per dictionary, for creating one dictionary
+    for each row of values with a function.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [func(row) for row in rows]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (after - before) / len(rows)
+
+
+def main():
+    """Run the benchmark"""
+
+    names = [f'PropertyName{i}' for i in range(NUM_KEYS)]
+    rows = [list(range(i, i + NUM_KEYS)) for i in range(NUM_OBJECTS)]
+    template = NocaseDict.fromkeys(names)
+
+    funcs = [
+        ('NocaseDict.fromvalues()',
+         lambda row: NocaseDict.fromvalues(template, row)),
+        ('NocaseDict(pairs)', lambda row: NocaseDict(zip(names, row))),
+        ('dict(pairs)', lambda row: dict(zip(names, row))),
+    ]
+
+    table_rows = []
+    for func_desc, func in funcs:
+        # Best of 3 runs for the time
+        table_rows.append([func_desc,
+                           min(create_time(func, rows) for _ in range(3)),
+                           create_memory(func, rows)])
+    print_table(
+        f"Time and memory per dictionary, for {NUM_OBJECTS} dictionaries "
+        f"with the same {NUM_KEYS} keys",
+        ['Creation', 'time (us)', 'memory (bytes)'], table_rows)
+
+
+if __name__ == '__main__':
+    main()
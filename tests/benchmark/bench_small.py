@@ -0,0 +1,80 @@
+"""
+Benchmark for small NocaseDict objects.
+
+Sweeps the number of items from 0 to 32 and measures, for NocaseDict with
+lower case keys, NocaseDict with mixed case keys and the standard dict with
+mixed case keys as a baseline:
+
+* construction: Creating the dictionary from a list of items, in us
+* lookup: Looking up an existing key in a different lexical case, in ns
+  (the standard dict uses the original key)
+* iteration: Iterating through the items, in us
+* memory: Bytes allocated per dictionary object, excluding the keys and
+  values themselves
+
+NocaseDict objects whose keys are all casefolded share an empty table of
+original keys, so their memory overhead over the standard dict is the object
+itself and the internal dictionary.
+"""
+
+
+import tracemalloc
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+SIZES = [0, 1, 2, 3, 4, 5, 6, 8, 12, 16, 24, 32]
+NUM_OBJECTS = 10000
+
+
+def bytes_per_object(cls, items):
+    """
+    Return the number of bytes allocated per object of a dictionary class
+    that is initialized with the specified items.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [cls(items) for _ in range(NUM_OBJECTS)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (after - before) / NUM_OBJECTS
+
+
+def main():
+    """Run the benchmark"""
+
+    variants = [
+        ('NocaseDict (lower)', NocaseDict, str.lower, str.upper),
+        ('NocaseDict (mixed)', NocaseDict, str.title, str.upper),
+        ('dict (mixed)', dict, str.title, str.title),
+    ]
+
+    for desc, cls, key_case, lookup_case in variants:
+        rows = []
+        for size in SIZES:
+            items = [(key_case(f'key{i}'), i) for i in range(size)]
+            obj = cls(items)
+            lookup_key = lookup_case(f'key{size - 1}') if size else 'key'
+            namespace = {'cls': cls, 'items': items, 'obj': obj,
+                         'key': lookup_key}
+            rows.append([
+                size,
+                time_per_op('cls(items)', globals=namespace, repeat=3) / 1000,
+                time_per_op('obj.get(key)', globals=namespace, repeat=3),
+                time_per_op('for _ in obj.items(): pass',
+                            globals=namespace, repeat=3) / 1000,
+                bytes_per_object(cls, items),
+            ])
+        print_table(
+            f"{desc}: time and memory by number of items",
+            ['items', 'construction (us)', 'lookup (ns)', 'iteration (us)',
+             'memory (bytes)'],
+            rows)
+
+
+if __name__ == '__main__':
+    main()
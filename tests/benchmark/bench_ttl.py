@@ -0,0 +1,107 @@
+"""
+Benchmark for NocaseTTLDict.
+
+Runs a workload of 90% lookups and 10% sets of 1000 keys in random lexical
+case, and compares the throughput of NocaseTTLDict with the default TTL and
+with per-item TTLs, of a NocaseDict wrapper that scans all items to purge
+the expired items on each set, and of NocaseDict without expiry.
+
+The clock advances by one unit on each call, so that items expire during the
+workload.
+"""
+
+
+import random
+from itertools import count
+
+from nocasedict import NocaseDict, NocaseTTLDict
+
+from .benchutils import time_per_op, print_table
+
+NUM_KEYS = 1000
+NUM_OPS = 100000
+TTL = 2000
+
+
+class ScanningTTLDict:
+    """
+    NocaseDict wrapper with expiring items that scans all items to purge the
+    expired items on each set.
+    """
+
+    def __init__(self, ttl, clock):
+        self.ttl = ttl
+        self.clock = clock
+        self.dct = NocaseDict()
+
+    def get(self, key, default=None):
+        """Return the value of an item that has not expired"""
+        item = self.dct.get(key)
+        if item is None or item[1] <= self.clock():
+            return default
+        return item[0]
+
+    def __setitem__(self, key, value):
+        now = self.clock()
+        for k in [k for k, item in self.dct.items() if item[1] <= now]:
+            del self.dct[k]
+        self.dct[key] = (value, now + self.ttl)
+
+
+def run(dct, ops):
+    """Run the workload"""
+    for key, value in ops:
+        if value is None:
+            dct.get(key)
+        else:
+            dct[key] = value
+
+
+def run_per_item_ttl(dct, ops, ttls):
+    """Run the workload, setting the items with per-item TTLs"""
+    for (key, value), ttl in zip(ops, ttls):
+        if value is None:
+            dct.get(key)
+        else:
+            dct.set(key, value, ttl)
+
+
+def main():
+    """Run the benchmark"""
+
+    rnd = random.Random(42)
+    names = [f'PropertyName{i}' for i in range(NUM_KEYS)]
+    ops = []
+    for _ in range(NUM_OPS):
+        key = ''.join(c.upper() if rnd.random() < 0.5 else c
+                      for c in rnd.choice(names))
+        ops.append((key, 1 if rnd.random() < 0.1 else None))
+    ttls = [rnd.randint(TTL // 2, TTL * 2) for _ in range(NUM_OPS)]
+
+    namespace = {
+        'run': run, 'run_per_item_ttl': run_per_item_ttl, 'ops': ops,
+        'ttls': ttls, 'count': count, 'NocaseDict': NocaseDict,
+        'NocaseTTLDict': NocaseTTLDict, 'ScanningTTLDict': ScanningTTLDict,
+        'TTL': TTL}
+    rows = []
+    for desc, stmt in (
+            ('NocaseDict (no expiry)', 'run(NocaseDict(), ops)'),
+            ('NocaseTTLDict, default TTL',
+             'run(NocaseTTLDict(TTL, count().__next__), ops)'),
+            ('NocaseTTLDict, per-item TTL',
+             'run_per_item_ttl(NocaseTTLDict(None, count().__next__), ops, '
+             'ttls)'),
+            ('NocaseDict, scan on set',
+             'run(ScanningTTLDict(TTL, count().__next__), ops)')):
+        time_ns = time_per_op(stmt, globals=namespace, number=1, repeat=3)
+        rows.append([desc, time_ns / NUM_OPS, NUM_OPS / time_ns * 1e3])
+
+    print_table(
+        f"Throughput for {NUM_OPS} operations (90% get / 10% set) on "
+        f"{NUM_KEYS} keys, TTL={TTL} clock units",
+        ['Dictionary', 'Time per op (ns)', 'Throughput (Mops/s)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark for membership tests and set operations on NocaseDict views.
+
+Compares the time per operation on the views of a dictionary with 1000 items
+for:
+
+* NocaseDict, whose keys and items views look up keys in the underlying
+  dictionary and whose keys view performs set operations on casefolded keys
+* The standard dict, as a baseline
+"""
+
+
+from nocasedict import NocaseDict
+
+from .benchutils import time_per_op, print_table
+
+NUM_ITEMS = 1000
+
+OPERATIONS = [
+    ('key in keys()', "'Property999' in keys"),
+    ('item in items()', "('Property999', 999) in items"),
+    ('keys() & set', 'keys & other'),
+    ('keys() - set', 'keys - other'),
+    ('reversed(keys())', 'for _ in reversed(keys): pass'),
+]
+
+
+def main():
+    """Run the benchmark"""
+
+    items = [(f'Property{i}', i) for i in range(NUM_ITEMS)]
+    other = {f'Property{i}' for i in range(0, 2 * NUM_ITEMS, 2)}
+
+    rows = []
+    for cls_desc, cls in (('NocaseDict', NocaseDict),
+                          ('dict', dict)):
+        obj = cls(items)
+        ns = {'keys': obj.keys(), 'items': obj.items(), 'other': other}
+        row = [cls_desc]
+        for _, stmt in OPERATIONS:
+            row.append(time_per_op(stmt, globals=ns))
+        rows.append(row)
+    print_table(
+        f"Time per operation in ns, for {NUM_ITEMS} items",
+        ['Class'] + [op for op, _ in OPERATIONS], rows)
+
+
+if __name__ == '__main__':
+    main()
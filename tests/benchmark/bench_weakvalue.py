@@ -0,0 +1,61 @@
+"""
+Benchmark for WeakValueNocaseDict.
+
+Compares WeakValueNocaseDict with NocaseDict and with
+weakref.WeakValueDictionary on casefolded keys, for lookups of 1000 items
+whose values are alive, and for the churn of setting items whose values are
+garbage collected right away.
+"""
+
+
+from weakref import WeakValueDictionary
+
+from nocasedict import NocaseDict, WeakValueNocaseDict
+
+from .benchutils import time_per_op, print_table
+
+NUM_KEYS = 1000
+
+
+class Obj:
+    # pylint: disable=too-few-public-methods
+    """Value that supports weak references"""
+
+
+def main():
+    """Run the benchmark"""
+
+    keys = [f'CIM_Instance.Name="{i}"' for i in range(NUM_KEYS)]
+    lookup_keys = [key.upper() for key in keys]
+    values = [Obj() for _ in keys]
+
+    rows = []
+    for desc, cls, fold in (
+            ('NocaseDict', NocaseDict, False),
+            ('WeakValueNocaseDict', WeakValueNocaseDict, False),
+            ('WeakValueDictionary (casefold)', WeakValueDictionary, True)):
+        dct = cls()
+        for key, value in zip(keys, values):
+            dct[key.casefold() if fold else key] = value
+        namespace = {'dct': dct, 'keys': keys, 'lookup_keys': lookup_keys,
+                     'Obj': Obj, 'cls': cls}
+        if fold:
+            lookup = '[dct[key.casefold()] for key in lookup_keys]'
+            churn = 'for key in keys: dct[key.casefold()] = Obj()'
+        else:
+            lookup = '[dct[key] for key in lookup_keys]'
+            churn = 'for key in keys: dct[key] = Obj()'
+        rows.append([
+            desc,
+            time_per_op(lookup, globals=namespace, repeat=3) / NUM_KEYS,
+            time_per_op(churn, 'dct = cls()', globals=namespace,
+                        repeat=3) / NUM_KEYS,
+        ])
+    print_table(
+        f"Time per operation on {NUM_KEYS} items",
+        ['Dictionary', 'Lookup (ns)', 'Set with collected value (ns)'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Utility functions for the benchmarks.
+
+The benchmarks are standalone scripts that are run from the main directory of
+the repository, e.g.::
+
+    python -m tests.benchmark.bench_casefold
+"""
+
+
+import timeit
+from typing import Any, Dict, List, Optional, Sequence
+
+__all__ = ['time_per_op', 'print_table']
+
+
+def time_per_op(stmt: str, setup: str = 'pass',
+                globals: Optional[Dict[str, Any]] = None,
+                number: Optional[int] = None, repeat: int = 5) -> float:
+    # pylint: disable=redefined-builtin
+    """
+    Return the best time for one execution of a statement, in nanoseconds.
+
+    Parameters:
+      stmt (str): Statement to be timed.
+      setup (str): Statement to be executed once before each repetition.
+      globals (dict): Namespace in which the statements are executed.
+      number (int): Number of executions per repetition. `None` determines
+        the number automatically so that a repetition takes at least 0.2 s.
+      repeat (int): Number of repetitions. The best repetition is used.
+    """
+    timer = timeit.Timer(stmt, setup, globals=globals)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def print_table(title: str, headers: Sequence[str],
+                rows: List[Sequence[Any]]) -> None:
+    """
+    Print a table with a title, where float values are shown with one
+    decimal place.
+    """
+    str_rows = [[f"{v:.1f}" if isinstance(v, float) else str(v) for v in row]
+                for row in rows]
+    widths = [max(len(r[i]) for r in str_rows + [list(headers)])
+              for i in range(len(headers))]
+    print()
+    print(title)
+    print('  '.join(h.ljust(w) for h, w in zip(headers, widths)))
+    print('  '.join('-' * w for w in widths))
+    for row in str_rows:
+        print('  '.join(v.rjust(w) for v, w in zip(row, widths)))
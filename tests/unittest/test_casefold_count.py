@@ -0,0 +1,339 @@
+"""
+Test the number of casefold calls made by NocaseDict operations.
+
+Each logical operation must casefold each key at most once. The tests count
+the calls to the __casefold__() method of a NocaseDict subclass.
+"""
+
+
+import os
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, HashableMixin  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not casefold", allow_module_level=True)
+
+
+class CountingNocaseDict(HashableMixin, NocaseDict):
+    """
+    Test class whose casefold method counts its calls.
+    """
+
+    casefold_count = 0
+
+    @staticmethod
+    def __casefold__(key):
+        CountingNocaseDict.casefold_count += 1
+        return NocaseDict.__casefold__(key)
+
+
+def ncd3():
+    """Return a CountingNocaseDict with three items"""
+    return CountingNocaseDict([('Dog', 1), ('Cat', 2), ('Bird', 3)])
+
+
+def ncd3_upper():
+    """Return a CountingNocaseDict with three items, with upper case keys"""
+    return CountingNocaseDict([('DOG', 1), ('CAT', 2), ('BIRD', 3)])
+
+
+def dict3():
+    """Return a dict with three items"""
+    return dict([('Dog', 1), ('Cat', 2), ('Bird', 3)])
+
+
+TESTCASES_CASEFOLD_COUNT = [
+
+    # Testcases for the number of casefold calls of NocaseDict operations
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: CountingNocaseDict object to use.
+    #   * other: Other object passed to the operation, or None.
+    #   * operation: Function performing the operation, with parameters
+    #     obj and other.
+    #   * exp_count: Expected number of casefold calls for the operation.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "__getitem__()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj['dog'],
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "__setitem__() for new key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.__setitem__('Fish', 4),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "__setitem__() for existing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.__setitem__('DOG', 4),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "__delitem__()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.__delitem__('dog'),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "__contains__()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: 'dog' in obj,
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "get() for existing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.get('dog'),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "get() for missing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.get('fish'),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "pop() for existing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.pop('dog'),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "pop() for missing key with default",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.pop('fish', None),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "setdefault() for existing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.setdefault('dog', 4),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "setdefault() for missing key",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.setdefault('fish', 4),
+             exp_count=1),
+        None, None, True
+    ),
+    (
+        "get_folded()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.get_folded('dog'),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "set_folded()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.set_folded('fish', 'Fish', 4),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "del_folded()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.del_folded('dog'),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "contains_folded()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.contains_folded('dog'),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "popitem()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.popitem(),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "Iteration through items",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: list(obj.items()),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "repr()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: repr(obj),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "copy()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: obj.copy(),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "hash()",
+        dict(obj=ncd3(), other=None,
+             operation=lambda obj, other: hash(obj),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "fromkeys()",
+        dict(obj=ncd3(), other=['Dog', 'Cat'],
+             operation=lambda obj, other: CountingNocaseDict.fromkeys(other),
+             exp_count=2),
+        None, None, True
+    ),
+    (
+        "Initialization from list of items",
+        dict(obj=ncd3(), other=list(dict3().items()),
+             operation=lambda obj, other: CountingNocaseDict(other),
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "Initialization from dict",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: CountingNocaseDict(other),
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "Initialization from keyword arguments",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: CountingNocaseDict(**other),
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "update() from list of items",
+        dict(obj=ncd3(), other=list(dict3().items()),
+             operation=lambda obj, other: obj.update(other),
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "update() from dict",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: obj.update(other),
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "update() from NocaseDict",
+        dict(obj=ncd3(), other=ncd3_upper(),
+             operation=lambda obj, other: obj.update(other),
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "__eq__() with equal NocaseDict",
+        dict(obj=ncd3(), other=ncd3_upper(),
+             operation=lambda obj, other: obj == other,
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "__eq__() with equal dict",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: obj == other,
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "__ne__() with equal NocaseDict",
+        dict(obj=ncd3(), other=ncd3_upper(),
+             operation=lambda obj, other: obj != other,
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "update() from NocaseDict with different casefold method",
+        dict(obj=ncd3(), other=NocaseDict([('DOG', 1), ('CAT', 2)]),
+             operation=lambda obj, other: obj.update(other),
+             exp_count=2),
+        None, None, True
+    ),
+    (
+        "__or__() with NocaseDict",
+        dict(obj=ncd3(), other=ncd3_upper(),
+             operation=lambda obj, other: obj | other,
+             exp_count=0),
+        None, None, True
+    ),
+    (
+        "__or__() with dict",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: obj | other,
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "__ror__() with dict",
+        dict(obj=ncd3(), other=dict3(),
+             operation=lambda obj, other: other | obj,
+             exp_count=3),
+        None, None, True
+    ),
+    (
+        "__ior__() with NocaseDict",
+        dict(obj=ncd3(), other=ncd3_upper(),
+             operation=lambda obj, other: obj.__ior__(other),
+             exp_count=0),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CASEFOLD_COUNT)
+@simplified_test_function
+def test_casefold_count(testcase, obj, other, operation, exp_count):
+    """
+    Test function for the number of casefold calls of NocaseDict operations.
+    """
+
+    CountingNocaseDict.casefold_count = 0
+
+    # The code to be tested
+    operation(obj, other)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert CountingNocaseDict.casefold_count == exp_count
@@ -0,0 +1,289 @@
+"""
+Test the casefold cache.
+"""
+
+
+import os
+import gc
+import weakref
+import unicodedata
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, enable_casefold_cache, \
+    disable_casefold_cache, casefold_cache_info, \
+    prewarm_casefold_cache, CasefoldCacheInfo  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not have a casefold cache", allow_module_level=True)
+
+
+class NormalizingNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    Test class that overrides the casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return unicodedata.normalize('NFKD', key).casefold()
+
+
+class LowerNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    Test class that overrides the casefold method with an instance method.
+    """
+
+    def __casefold__(self, key):  # pylint: disable=arguments-differ
+        return key.lower()
+
+
+@pytest.fixture(autouse=True)
+def no_casefold_cache():
+    """
+    Fixture that ensures the casefold cache is disabled after each test.
+    """
+    yield
+    disable_casefold_cache()
+
+
+TESTCASES_CASEFOLD_CACHE = [
+
+    # Testcases for the casefold cache with NocaseDict lookups
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * maxsize: maxsize parameter for enable_casefold_cache().
+    #   * policy: policy parameter for enable_casefold_cache().
+    #   * keys: List of keys to look up in sequence.
+    #   * exp_info: Expected CasefoldCacheInfo after the lookups.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "LRU: No keys looked up",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=[],
+            exp_info=CasefoldCacheInfo(0, 0, 0, 2, 0, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Same key looked up twice",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=['Dog', 'Dog'],
+            exp_info=CasefoldCacheInfo(1, 1, 0, 2, 1, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Keys that differ in case are cached separately",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=['Dog', 'DOG'],
+            exp_info=CasefoldCacheInfo(0, 2, 0, 2, 2, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Recently used key survives eviction",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=['Dog', 'Cat', 'Dog', 'Bird', 'Dog'],
+            exp_info=CasefoldCacheInfo(2, 3, 1, 2, 2, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "FIFO: Recently used key does not survive eviction",
+        dict(
+            maxsize=2,
+            policy='fifo',
+            keys=['Dog', 'Cat', 'Dog', 'Bird', 'Dog'],
+            exp_info=CasefoldCacheInfo(1, 4, 2, 2, 2, 'fifo'),
+        ),
+        None, None, True
+    ),
+    (
+        "Bytes keys are cached",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=[b'Dog', b'Dog'],
+            exp_info=CasefoldCacheInfo(1, 1, 0, 2, 1, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "None keys are not cached",
+        dict(
+            maxsize=2,
+            policy='lru',
+            keys=[None, None],
+            exp_info=CasefoldCacheInfo(0, 0, 0, 2, 0, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "Invalid maxsize",
+        dict(
+            maxsize=0,
+            policy='lru',
+            keys=[],
+            exp_info=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Invalid policy",
+        dict(
+            maxsize=2,
+            policy='random',
+            keys=[],
+            exp_info=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CASEFOLD_CACHE)
+@simplified_test_function
+def test_casefold_cache(testcase, maxsize, policy, keys, exp_info):
+    """
+    Test function for the casefold cache used by NocaseDict lookups.
+    """
+
+    # The code to be tested
+    enable_casefold_cache(maxsize=maxsize, policy=policy)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    ncd = NocaseDict()
+    for key in keys:
+        assert key not in ncd
+
+    info = casefold_cache_info()
+    assert info == exp_info
+
+
+def test_casefold_cache_disabled():
+    """
+    Test function for the casefold cache info when the cache is disabled.
+    """
+    ncd = NocaseDict(Dog='Cat')
+    assert ncd['dog'] == 'Cat'
+    assert casefold_cache_info() is None
+
+    enable_casefold_cache()
+    assert ncd['dog'] == 'Cat'
+    assert casefold_cache_info().misses == 1
+
+    disable_casefold_cache()
+    assert ncd['DOG'] == 'Cat'
+    assert casefold_cache_info() is None
+
+
+def test_casefold_cache_override():
+    """
+    Test function for the casefold cache with a class that overrides the
+    casefold method.
+    """
+    enable_casefold_cache()
+
+    ncd = NocaseDict()
+    ncd["\u00C7"] = 'value'
+
+    myncd = NormalizingNocaseDict()
+    myncd["\u00C7"] = 'value'
+
+    # The combination sequence is found only with the overriding casefold
+    # method, so the overriding casefold method needs its own cache.
+    assert "c\u0327" not in ncd
+    assert "c\u0327" in myncd
+    assert "\u00C7" in myncd
+
+    info = casefold_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 2)
+    myinfo = casefold_cache_info(NormalizingNocaseDict)
+    assert (myinfo.hits, myinfo.misses, myinfo.currsize) == (1, 2, 2)
+
+
+def test_casefold_cache_instance_method():
+    """
+    Test function for the casefold cache with a class that overrides the
+    casefold method with an instance method.
+    """
+    enable_casefold_cache()
+
+    dicts = [LowerNocaseDict() for _ in range(100)]
+    assert not any('Dog' in ncd for ncd in dicts)
+
+    # The dictionaries of the class share one cache.
+    info = casefold_cache_info(LowerNocaseDict)
+    assert (info.hits, info.misses, info.currsize) == (99, 1, 1)
+
+    # The cache does not keep the dictionaries alive.
+    refs = [weakref.ref(ncd) for ncd in dicts]
+    del dicts
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
+def test_casefold_cache_prewarm(tmp_path):
+    """
+    Test function for pre-warming the casefold cache from a vocabulary file.
+    """
+    vocab_file = tmp_path / 'vocab.txt'
+    vocab_file.write_text(
+        "# Vocabulary\n"
+        "InstanceID\n"
+        "\n"
+        "  ElementName  \n",
+        encoding='utf-8')
+
+    with pytest.raises(RuntimeError):
+        prewarm_casefold_cache(str(vocab_file))
+
+    enable_casefold_cache()
+
+    # The code to be tested
+    count = prewarm_casefold_cache(str(vocab_file))
+
+    assert count == 2
+    info = casefold_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 2)
+
+    ncd = NocaseDict(InstanceID=1, ElementName=2, Caption=3)
+    info = casefold_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 3)
+    assert ncd['instanceid'] == 1
+
+    count = prewarm_casefold_cache(['\u00C7'], NormalizingNocaseDict)
+
+    assert count == 1
+    myinfo = casefold_cache_info(NormalizingNocaseDict)
+    assert myinfo.currsize == 1
@@ -4,6 +4,8 @@ Test the HashableMixin mixin class.
 
 
 import os
+import copy
+import pickle
 import pytest
 
 from ..utils.simplified_test_function import simplified_test_function
@@ -28,7 +30,21 @@ if TEST_AGAINST_DICT:
 NocaseDict = dict if TEST_AGAINST_DICT else _NocaseDict
 
 
-class MyNocaseDict(HashableMixin, NocaseDict):  # type: ignore
+class DummyMixin:
+    # pylint: disable=too-few-public-methods
+    """
+    Mixin class used instead of HashableMixin when testing against dict,
+    because the instance layouts of NocaseDict (with __slots__) and dict
+    conflict. The tests are skipped in that case, anyway.
+    """
+    pass
+
+
+# The hashable mixin class being tested.
+Hashable = DummyMixin if TEST_AGAINST_DICT else HashableMixin
+
+
+class MyNocaseDict(Hashable, NocaseDict):  # type: ignore
     # pylint: disable=too-few-public-methods
     """
     The hashable NocaseDict class being tested.
@@ -307,3 +323,168 @@ def test_HashableMixin_hash(testcase, obj1, obj2, exp_obj_equal):
         assert hash1 == hash2
     else:
         assert hash1 != hash2
+
+
+TESTCASES_HASHABLEMIXIN_HASH_CACHE = [
+
+    # Testcases for invalidation of the cached hash value by modifications
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * modify: Function modifying the MyNocaseDict object passed to it.
+    #   * exp_items: Expected items after the modification.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No modification",
+        dict(
+            modify=lambda obj: None,
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Cat')],
+        ),
+        None, None, True
+    ),
+    (
+        "__setitem__() for existing key",
+        dict(
+            modify=lambda obj: obj.__setitem__('dog', 'Kitten'),
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Kitten')],
+        ),
+        None, None, True
+    ),
+    (
+        "__setitem__() for new key",
+        dict(
+            modify=lambda obj: obj.__setitem__('Cow', 'Calf'),
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Cat'), ('Cow', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "__delitem__()",
+        dict(
+            modify=lambda obj: obj.__delitem__('dog'),
+            exp_items=[('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "update()",
+        dict(
+            modify=lambda obj: obj.update([('dog', 'Kitten')]),
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Kitten')],
+        ),
+        None, None, True
+    ),
+    (
+        "|= operator",
+        dict(
+            modify=lambda obj: obj.__ior__({'dog': 'Kitten'}),
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Kitten')],
+        ),
+        None, None, True
+    ),
+    (
+        "pop()",
+        dict(
+            modify=lambda obj: obj.pop('dog'),
+            exp_items=[('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "popitem()",
+        dict(
+            modify=lambda obj: obj.popitem(),
+            exp_items=[('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "clear()",
+        dict(
+            modify=lambda obj: obj.clear(),
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "setdefault() for new key",
+        dict(
+            modify=lambda obj: obj.setdefault('Cow', 'Calf'),
+            exp_items=[('Budgie', 'Fish'), ('Dog', 'Cat'), ('Cow', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "set_folded() for existing key",
+        dict(
+            modify=lambda obj: obj.set_folded('dog', 'DOG', 'Kitten'),
+            exp_items=[('Budgie', 'Fish'), ('DOG', 'Kitten')],
+        ),
+        None, None, True
+    ),
+    (
+        "del_folded()",
+        dict(
+            modify=lambda obj: obj.del_folded('dog'),
+            exp_items=[('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_HASHABLEMIXIN_HASH_CACHE)
+@simplified_test_function
+def test_HashableMixin_hash_cache(testcase, modify, exp_items):
+    """
+    Test function for invalidation of the cached HashableMixin.__hash__()
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict is not hashable")
+
+    obj = MyNocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')])
+    hash1 = hash(obj)  # Caches the hash value
+    assert hash(obj) == hash1
+
+    # The code to be tested
+    modify(obj)
+    hash2 = hash(obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert hash2 == hash(MyNocaseDict(exp_items))
+
+
+def test_HashableMixin_pickle():
+    """
+    Test function for pickling and copying a HashableMixin object with a
+    cached hash value.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict is not hashable")
+
+    obj = MyNocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')])
+    hash1 = hash(obj)  # Caches the hash value
+    obj.foo = 'bar'  # The derived class has a __dict__
+
+    for obj2 in (pickle.loads(pickle.dumps(obj)), copy.copy(obj),
+                 copy.deepcopy(obj)):
+
+        # The cached hash value must not be restored, because hash values
+        # differ between Python processes
+        with pytest.raises(AttributeError):
+            _ = obj2._hash_value  # pylint: disable=protected-access
+
+        assert obj2 == obj
+        assert obj2.foo == 'bar'
+        assert hash(obj2) == hash1
@@ -67,6 +67,7 @@ def test_KeyableByMixin():
     mixin = KeyableByMixin('my_key')
 
     assert issubclass(mixin, object)
+    assert not mixin.__slots__
     assert mixin.nocasedict_KeyableByMixin_key_attr == \
         MyKey_KeyableByMixin.nocasedict_KeyableByMixin_key_attr
 
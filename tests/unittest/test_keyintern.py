@@ -0,0 +1,250 @@
+"""
+Test the interning of keys.
+"""
+
+
+import os
+import sys
+import json
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, enable_key_interning, \
+    disable_key_interning, key_interning_info, KeyInterningInfo, \
+    enable_casefold_cache, disable_casefold_cache  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not intern keys", allow_module_level=True)
+
+
+@pytest.fixture(autouse=True)
+def no_key_interning():
+    """
+    Fixture that ensures key interning is disabled after each test.
+    """
+    yield
+    disable_key_interning()
+    disable_casefold_cache()
+
+
+def new_key(key):
+    """
+    Return a new object that is equal to a str or bytes key, like the keys
+    created when parsing documents. Literals in the test code are already
+    interned by Python.
+    """
+    if isinstance(key, str):
+        return key.encode('utf-8').decode('utf-8')
+    if isinstance(key, bytes):
+        return bytes(bytearray(key))
+    return key
+
+
+TESTCASES_KEY_INTERNING = [
+
+    # Testcases for key interning when setting items in new NocaseDicts
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * maxsize: maxsize parameter for enable_key_interning().
+    #   * keys: List of keys to set in sequence, each in a new NocaseDict.
+    #   * exp_info: Expected KeyInterningInfo after setting the items.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No keys set",
+        dict(
+            maxsize=4,
+            keys=[],
+            exp_info=KeyInterningInfo(0, 0, 0, 4, 0, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "Same lower case key set twice",
+        dict(
+            maxsize=4,
+            keys=['dog', 'dog'],
+            exp_info=KeyInterningInfo(1, 1, 0, 4, 1, sys.getsizeof('dog')),
+        ),
+        None, None, True
+    ),
+    (
+        "Same mixed case key set twice",
+        dict(
+            maxsize=4,
+            keys=['Dog', 'Dog'],
+            exp_info=KeyInterningInfo(
+                2, 2, 0, 4, 2, sys.getsizeof('Dog') + sys.getsizeof('dog')),
+        ),
+        None, None, True
+    ),
+    (
+        "Keys that differ in case share the casefolded key",
+        dict(
+            maxsize=4,
+            keys=['Dog', 'DOG'],
+            exp_info=KeyInterningInfo(1, 3, 0, 4, 3, sys.getsizeof('dog')),
+        ),
+        None, None, True
+    ),
+    (
+        "Oldest keys are evicted",
+        dict(
+            maxsize=2,
+            keys=['Dog', 'Cat', 'Dog'],
+            exp_info=KeyInterningInfo(0, 6, 4, 2, 2, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "Bytes keys are interned",
+        dict(
+            maxsize=4,
+            keys=[b'Dog', b'Dog'],
+            exp_info=KeyInterningInfo(
+                2, 2, 0, 4, 2, sys.getsizeof(b'Dog') + sys.getsizeof(b'dog')),
+        ),
+        None, None, True
+    ),
+    (
+        "None keys are not interned",
+        dict(
+            maxsize=4,
+            keys=[None, None],
+            exp_info=KeyInterningInfo(0, 0, 0, 4, 0, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "Invalid maxsize",
+        dict(
+            maxsize=0,
+            keys=[],
+            exp_info=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_KEY_INTERNING)
+@simplified_test_function
+def test_key_interning(testcase, maxsize, keys, exp_info):
+    """
+    Test function for key interning when setting items in NocaseDicts.
+    """
+
+    # The code to be tested
+    enable_key_interning(maxsize=maxsize)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    dicts = []
+    for key in keys:
+        ncd = NocaseDict()
+        ncd[new_key(key)] = 'value'
+        dicts.append(ncd)
+
+    info = key_interning_info()
+    assert info == exp_info
+
+    if exp_info.evictions == 0:
+        # Equal original keys and casefolded keys are the same objects
+        for ncd1, ncd2 in zip(dicts, dicts[1:]):
+            # pylint: disable=protected-access
+            key1, k1 = list(ncd1)[0], list(ncd1._data)[0]
+            key2, k2 = list(ncd2)[0], list(ncd2._data)[0]
+            assert (key1 is key2) == (key1 == key2)
+            assert (k1 is k2) == (k1 == k2)
+
+
+def test_key_interning_update():
+    """
+    Test function for key interning when initializing, updating and
+    setting defaults in NocaseDicts.
+    """
+    enable_key_interning()
+
+    doc = '[{"InstanceID": 1, "name": "a"}, {"InstanceID": 2, "name": "b"}]'
+    ncd1, ncd2 = [NocaseDict(obj) for obj in json.loads(doc)]
+    ncd3 = NocaseDict()
+    ncd3.setdefault(new_key('InstanceID'), 3)
+    ncd3.setdefault(new_key('Name'), 'c')
+
+    for ncd in (ncd2, ncd3):
+        for key1, key2 in zip(ncd1, ncd):
+            assert (key1 is key2) == (key1 == key2)
+        # pylint: disable=protected-access
+        for k1, k2 in zip(ncd1._data, ncd._data):
+            assert k1 is k2
+
+    info = key_interning_info()
+    assert (info.hits, info.misses, info.currsize) == (6, 4, 4)
+
+    assert ncd1 == NocaseDict(InstanceID=1, name='a')
+    assert ncd3 == NocaseDict(INSTANCEID=3, NAME='c')
+
+
+def test_key_interning_disabled():
+    """
+    Test function for enabling and disabling key interning, also in
+    combination with the casefold cache.
+    """
+    # pylint: disable=protected-access
+    assert key_interning_info() is None
+    assert NocaseDict._inline_str_casefold is True
+    assert NocaseDict._inline_str_casefold_setitem is True
+
+    enable_key_interning()
+    enable_casefold_cache()
+    assert NocaseDict._inline_str_casefold is False
+    assert NocaseDict._inline_str_casefold_setitem is False
+
+    # Key interning does not affect lookups
+    disable_casefold_cache()
+    assert NocaseDict._inline_str_casefold is True
+    assert NocaseDict._inline_str_casefold_setitem is False
+    ncd1 = NocaseDict([(new_key('Dog'), 1)])
+    ncd2 = NocaseDict([(new_key('Dog'), 2)])
+    assert list(ncd1)[0] is list(ncd2)[0]
+    assert key_interning_info().hits == 2
+
+    disable_key_interning()
+    assert key_interning_info() is None
+    assert NocaseDict._inline_str_casefold_setitem is True
+    ncd3 = NocaseDict([(new_key('Dog'), 3)])
+    assert list(ncd3)[0] is not list(ncd1)[0]
+    assert ncd3.keys() == ncd1.keys() == ncd2.keys()
+
+
+def test_key_interning_from_pairs():
+    """
+    Test function for key interning when creating NocaseDicts in bulk.
+    """
+    enable_key_interning()
+
+    ncd1 = NocaseDict.from_pairs([(new_key('Dog'), 1), (new_key('cow'), 2)])
+    ncd2 = NocaseDict.from_mapping({new_key('Dog'): 3, new_key('cow'): 4})
+    for key1, key2 in zip(ncd1, ncd2):
+        assert key1 is key2
+
+    with pytest.raises(ValueError):
+        NocaseDict.from_pairs([(new_key('Dog'), 1), (new_key('DOG'), 2)])
@@ -0,0 +1,559 @@
+"""
+Test the NocaseCounter class.
+"""
+
+
+import os
+import pickle
+from collections import Counter
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseCounter, NocaseKey  # noqa: E402
+from nocasedict import HashableMixin  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict is not a counter", allow_module_level=True)
+
+
+class UpperNocaseCounter(NocaseCounter):
+    # pylint: disable=abstract-method
+    """
+    NocaseCounter subclass that overrides the casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.upper()
+
+
+class HashableNocaseCounter(HashableMixin, NocaseCounter):
+    # pylint: disable=abstract-method
+    """
+    Hashable NocaseCounter subclass.
+    """
+
+
+TESTCASES_NOCASECOUNTER_UPDATE = [
+
+    # Testcases for NocaseCounter.update() and NocaseCounter.subtract()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseCounter object to be used for the test.
+    #   * method: Name of the method to be tested.
+    #   * args: Positional arguments for the method.
+    #   * kwargs: Keyword arguments for the method.
+    #   * exp_items: Expected items of the counter after the method.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Update empty counter from iterable keeps first key",
+        dict(
+            obj=NocaseCounter(),
+            method='update',
+            args=(['Dog', 'cat', 'DOG', 'dog'],),
+            kwargs=dict(),
+            exp_items=[('Dog', 3), ('cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from iterable keeps existing key",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='update',
+            args=(['Dog', 'CAT'],),
+            kwargs=dict(),
+            exp_items=[('dog', 2), ('CAT', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from iterable with other key types",
+        dict(
+            obj=NocaseCounter(),
+            method='update',
+            args=([None, b'Dog', NocaseKey('Cat'), b'DOG', 'CAT', None],),
+            kwargs=dict(),
+            exp_items=[(None, 2), (b'Dog', 2), ('Cat', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from iterable, overridden casefold",
+        dict(
+            obj=UpperNocaseCounter(dog=1),
+            method='update',
+            args=(['DOG', 'cat', 'Cat'],),
+            kwargs=dict(),
+            exp_items=[('dog', 2), ('cat', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from dict",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='update',
+            args=(dict(DOG=2, Cat=3),),
+            kwargs=dict(),
+            exp_items=[('dog', 3), ('Cat', 3)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from collections.Counter and keyword arguments",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='update',
+            args=(Counter(['Cat', 'Cat']),),
+            kwargs=dict(DOG=1, cat=-1),
+            exp_items=[('dog', 2), ('Cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from NocaseCounter",
+        dict(
+            obj=NocaseCounter(dog=1, Bird=1),
+            method='update',
+            args=(NocaseCounter(['DOG', 'Cat', 'bird']),),
+            kwargs=dict(),
+            exp_items=[('dog', 2), ('Bird', 2), ('Cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update empty counter from NocaseDict",
+        dict(
+            obj=NocaseCounter(),
+            method='update',
+            args=(NocaseDict(Dog=2, cat=1),),
+            kwargs=dict(),
+            exp_items=[('Dog', 2), ('cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from NocaseCounter with other casefold method",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='update',
+            args=(UpperNocaseCounter(['DOG', 'Cat']),),
+            kwargs=dict(),
+            exp_items=[('dog', 2), ('Cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from iterable with unsupported key type",
+        dict(
+            obj=NocaseCounter(),
+            method='update',
+            args=([1],),
+            kwargs=dict(),
+            exp_items=None,
+        ),
+        AttributeError, None, True
+    ),
+    (
+        "Subtract from iterable",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='subtract',
+            args=(['Dog', 'CAT'],),
+            kwargs=dict(),
+            exp_items=[('dog', 0), ('CAT', -1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Subtract from NocaseCounter and keyword arguments",
+        dict(
+            obj=NocaseCounter(dog=1),
+            method='subtract',
+            args=(NocaseCounter(DOG=3, Cat=1),),
+            kwargs=dict(CAT=1),
+            exp_items=[('dog', -2), ('Cat', -2)],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASECOUNTER_UPDATE)
+@simplified_test_function
+def test_NocaseCounter_update(testcase, obj, method, args, kwargs, exp_items):
+    # pylint: disable=too-many-positional-arguments
+    """
+    Test function for NocaseCounter.update() and NocaseCounter.subtract()
+    """
+
+    # The code to be tested
+    getattr(obj, method)(*args, **kwargs)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert list(obj.items()) == exp_items
+
+
+TESTCASES_NOCASECOUNTER_OPERATORS = [
+
+    # Testcases for the arithmetic operators of NocaseCounter
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseCounter object to be used for the test.
+    #   * other: Other object to be used for the test.
+    #   * op: Name of the operator function, e.g. '__add__'.
+    #   * exp_items: Expected items of the result.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Add",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=-1, Fish=1, Ant=-1),
+            op='__add__',
+            exp_items=[('Dog', 3), ('Fish', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Subtract",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=1, Fish=1, Ant=-1),
+            op='__sub__',
+            exp_items=[('Dog', 1), ('Ant', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Maximum",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=3, Fish=1, Ant=-1),
+            op='__or__',
+            exp_items=[('Dog', 2), ('cat', 3), ('Fish', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Minimum",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=1),
+            other=NocaseCounter(DOG=1, CAT=3, Fish=1),
+            op='__and__',
+            exp_items=[('Dog', 1), ('cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Add counter with other casefold method",
+        dict(
+            obj=NocaseCounter(Dog=2),
+            other=UpperNocaseCounter(DOG=1, Cat=1),
+            op='__add__',
+            exp_items=[('Dog', 3), ('Cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "In-place add",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=-1, Fish=1, Ant=-1),
+            op='__iadd__',
+            exp_items=[('Dog', 3), ('Fish', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "In-place subtract",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=1, Fish=1, Ant=-1),
+            op='__isub__',
+            exp_items=[('Dog', 1), ('Ant', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "In-place maximum",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=-1),
+            other=NocaseCounter(DOG=1, CAT=3, Fish=1, Ant=-1),
+            op='__ior__',
+            exp_items=[('Dog', 2), ('cat', 3), ('Fish', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "In-place minimum",
+        dict(
+            obj=NocaseCounter(Dog=2, cat=1, Bird=1),
+            other=NocaseCounter(DOG=1, CAT=3, Fish=1),
+            op='__iand__',
+            exp_items=[('Dog', 1), ('cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Add dict is not supported",
+        dict(
+            obj=NocaseCounter(Dog=2),
+            other=dict(Dog=1),
+            op='__add__',
+            exp_items=NotImplemented,
+        ),
+        None, None, True
+    ),
+    (
+        "Maximum with NocaseDict is not supported",
+        dict(
+            obj=NocaseCounter(Dog=2),
+            other=NocaseDict(Dog=1),
+            op='__or__',
+            exp_items=NotImplemented,
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASECOUNTER_OPERATORS)
+@simplified_test_function
+def test_NocaseCounter_operators(testcase, obj, other, op, exp_items):
+    """
+    Test function for the arithmetic operators of NocaseCounter
+    """
+    org_items = list(obj.items())
+    org_other = other.copy()
+
+    # The code to be tested
+    result = getattr(obj, op)(other)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    if exp_items is NotImplemented:
+        assert result is NotImplemented
+        return
+
+    assert isinstance(result, obj.__class__)
+    assert list(result.items()) == exp_items
+    assert other == org_other
+    if op.startswith('__i'):
+        assert result is obj
+    else:
+        assert list(obj.items()) == org_items
+
+
+def test_NocaseCounter_getitem():
+    """
+    Test function for NocaseCounter.__getitem__(), __setitem__() and
+    __delitem__()
+    """
+    obj = NocaseCounter(['Dog'])
+    assert obj['DOG'] == 1
+    assert obj['Cat'] == 0
+    assert 'Cat' not in obj
+
+    obj['cat'] += 1
+    obj['dog'] += 1
+    assert list(obj.items()) == [('dog', 2), ('cat', 1)]
+
+    del obj['CAT']
+    del obj['Bird']
+    assert list(obj.items()) == [('dog', 2)]
+
+
+def test_NocaseCounter_most_common():
+    """
+    Test function for NocaseCounter.most_common(), total() and elements()
+    """
+    obj = NocaseCounter(['Dog', 'Cat', 'DOG', 'Bird', 'cat', 'dog', 'Fish'])
+
+    assert obj.most_common() == \
+        [('Dog', 3), ('Cat', 2), ('Bird', 1), ('Fish', 1)]
+    assert obj.most_common(3) == [('Dog', 3), ('Cat', 2), ('Bird', 1)]
+    assert obj.most_common(0) == []
+    assert obj.most_common(10) == obj.most_common()
+    assert obj.total() == 7
+    assert list(obj.elements()) == \
+        ['Dog', 'Dog', 'Dog', 'Cat', 'Cat', 'Bird', 'Fish']
+
+    assert NocaseCounter().most_common(1) == []
+    assert not list(NocaseCounter(Dog=0, Cat=-1).elements())
+
+
+def test_NocaseCounter_unary():
+    """
+    Test function for the unary operators of NocaseCounter
+    """
+    obj = NocaseCounter(Dog=2, cat=0, Bird=-1)
+
+    assert list((+obj).items()) == [('Dog', 2)]
+    assert list((-obj).items()) == [('Bird', 1)]
+    assert list(obj.items()) == [('Dog', 2), ('cat', 0), ('Bird', -1)]
+
+
+def test_NocaseCounter_misc():
+    """
+    Test function for the construction, copying, pickling, comparison and
+    representation of NocaseCounter objects.
+    """
+    obj = NocaseCounter(['Dog', 'Cat', 'DOG'])
+
+    for obj2 in (obj.copy(), pickle.loads(pickle.dumps(obj)),
+                 NocaseCounter(obj)):
+        assert type(obj2) is NocaseCounter  # pylint: disable=C0123
+        assert obj2 == obj
+        assert list(obj2.items()) == list(obj.items())
+
+    assert obj == dict(dog=2, cat=1)
+    assert obj == NocaseCounter('Cat Dog DOG'.split())
+    assert obj != NocaseCounter(['Dog', 'Cat'])
+    assert repr(NocaseCounter(['Cat', 'Dog', 'DOG'])) == \
+        "NocaseCounter({'Dog': 2, 'Cat': 1})"
+
+    with pytest.raises(TypeError):
+        NocaseCounter([], [])  # pylint: disable=too-many-function-args
+    with pytest.raises(NotImplementedError):
+        NocaseCounter.fromkeys(['Dog'])
+    with pytest.raises(TypeError):
+        dict(Dog=1) | obj  # pylint: disable=expression-not-assigned
+
+
+TESTCASES_NOCASECOUNTER_HASH_CACHE = [
+
+    # Testcases for invalidating the cached hash value of a hashable
+    # NocaseCounter
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * modify: Function that modifies the counter.
+    #   * exp_items: Expected items of the counter after the modification.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "update() from iterable",
+        dict(
+            modify=lambda obj: obj.update(['dog', 'Cat']),
+            exp_items=[('Dog', 3), ('Bird', 1), ('Cat', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "subtract() from iterable",
+        dict(
+            modify=lambda obj: obj.subtract(['dog']),
+            exp_items=[('Dog', 1), ('Bird', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "subtract() from mapping",
+        dict(
+            modify=lambda obj: obj.subtract({'DOG': 1, 'Cat': 1}),
+            exp_items=[('Dog', 1), ('Bird', 1), ('Cat', -1)],
+        ),
+        None, None, True
+    ),
+    (
+        "subtract() from counter",
+        dict(
+            modify=lambda obj: obj.subtract(NocaseCounter(['BIRD'])),
+            exp_items=[('Dog', 2), ('Bird', 0)],
+        ),
+        None, None, True
+    ),
+    (
+        "+= operator",
+        dict(
+            modify=lambda obj: obj.__iadd__(HashableNocaseCounter(['bird'])),
+            exp_items=[('Dog', 2), ('Bird', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "-= operator",
+        dict(
+            modify=lambda obj: obj.__isub__(HashableNocaseCounter(['dog'])),
+            exp_items=[('Dog', 1), ('Bird', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "|= operator",
+        dict(
+            modify=lambda obj: obj.__ior__(
+                HashableNocaseCounter(['Bird', 'bird'])),
+            exp_items=[('Dog', 2), ('Bird', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "&= operator",
+        dict(
+            modify=lambda obj: obj.__iand__(
+                HashableNocaseCounter(['dog', 'Bird'])),
+            exp_items=[('Dog', 1), ('Bird', 1)],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASECOUNTER_HASH_CACHE)
+@simplified_test_function
+def test_NocaseCounter_hash_cache(testcase, modify, exp_items):
+    """
+    Test function for invalidation of the cached hash value of a
+    NocaseCounter subclass with HashableMixin.
+    """
+
+    obj = HashableNocaseCounter(['Dog', 'Bird', 'dog'])
+    hash1 = hash(obj)  # Caches the hash value
+    assert hash(obj) == hash1
+
+    # The code to be tested
+    modify(obj)
+    hash2 = hash(obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert list(obj.items()) == exp_items
+    assert hash2 == hash(HashableNocaseCounter(dict(exp_items)))
@@ -0,0 +1,241 @@
+"""
+Test the NocaseDefaultDict class.
+"""
+
+
+import os
+import pickle
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseDefaultDict, NocaseKey  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict is not a defaultdict", allow_module_level=True)
+
+
+class UpperNocaseDefaultDict(NocaseDefaultDict):
+    """
+    NocaseDefaultDict subclass that overrides the casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.upper()
+
+
+TESTCASES_NOCASEDEFAULTDICT_GETITEM = [
+
+    # Testcases for NocaseDefaultDict.__getitem__()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseDefaultDict object to be used for the test.
+    #   * key: Key to be looked up.
+    #   * exp_value: Expected value for the key.
+    #   * exp_items: Expected items of the dictionary after the lookup.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Existing key in other case",
+        dict(
+            obj=NocaseDefaultDict(list, Dog=[1]),
+            key='DOG',
+            exp_value=[1],
+            exp_items=[('Dog', [1])],
+        ),
+        None, None, True
+    ),
+    (
+        "Missing key is added with default value",
+        dict(
+            obj=NocaseDefaultDict(list, Dog=[1]),
+            key='Cat',
+            exp_value=[],
+            exp_items=[('Dog', [1]), ('Cat', [])],
+        ),
+        None, None, True
+    ),
+    (
+        "Missing lower case key is added with default value",
+        dict(
+            obj=NocaseDefaultDict(int),
+            key='cat',
+            exp_value=0,
+            exp_items=[('cat', 0)],
+        ),
+        None, None, True
+    ),
+    (
+        "Missing NocaseKey is added with its original key",
+        dict(
+            obj=NocaseDefaultDict(int),
+            key=NocaseKey('Cat'),
+            exp_value=0,
+            exp_items=[('Cat', 0)],
+        ),
+        None, None, True
+    ),
+    (
+        "Missing key is added with default value, overridden casefold",
+        dict(
+            obj=UpperNocaseDefaultDict(int, Dog=1),
+            key='cat',
+            exp_value=0,
+            exp_items=[('Dog', 1), ('cat', 0)],
+        ),
+        None, None, True
+    ),
+    (
+        "Missing key without default factory",
+        dict(
+            obj=NocaseDefaultDict(Dog=1),
+            key='Cat',
+            exp_value=None,
+            exp_items=None,
+        ),
+        KeyError, None, True
+    ),
+    (
+        "Missing key None",
+        dict(
+            obj=NocaseDefaultDict(int),
+            key=None,
+            exp_value=0,
+            exp_items=[(None, 0)],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDEFAULTDICT_GETITEM)
+@simplified_test_function
+def test_NocaseDefaultDict_getitem(testcase, obj, key, exp_value, exp_items):
+    """
+    Test function for NocaseDefaultDict.__getitem__()
+    """
+
+    # The code to be tested
+    act_value = obj[key]
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert act_value == exp_value
+    assert list(obj.items()) == exp_items
+    assert obj[key] is act_value
+
+
+def test_NocaseDefaultDict_init():
+    """
+    Test function for NocaseDefaultDict.__init__()
+    """
+    obj = NocaseDefaultDict()
+    assert obj.default_factory is None
+    assert not obj
+
+    obj = NocaseDefaultDict(list, [('Dog', [1])], Cat=[2])
+    assert obj.default_factory is list
+    assert list(obj.items()) == [('Dog', [1]), ('Cat', [2])]
+
+    with pytest.raises(TypeError):
+        NocaseDefaultDict([('Dog', 1)])
+
+    assert not hasattr(obj, '__dict__')
+
+
+def test_NocaseDefaultDict_no_add():
+    """
+    Test function for the methods of NocaseDefaultDict that do not add items.
+    """
+    obj = NocaseDefaultDict(list, Dog=[1])
+
+    assert obj.get('Cat') is None
+    assert 'Cat' not in obj
+    assert obj.setdefault('Cat', [2]) == [2]
+    assert obj.pop('Budgie', None) is None
+    assert obj == NocaseDict(dog=[1], cat=[2])
+    assert obj != NocaseDict(dog=[1], cat=[2], budgie=[])
+    assert list(obj) == ['Dog', 'Cat']
+
+
+def test_NocaseDefaultDict_missing():
+    """
+    Test function for NocaseDefaultDict.__missing__() and subclasses that
+    override it.
+    """
+    obj = NocaseDefaultDict(list)
+    assert obj.__missing__('Dog') == []
+    assert list(obj.items()) == [('Dog', [])]
+
+    class CountingNocaseDefaultDict(NocaseDefaultDict):
+        # pylint: disable=too-few-public-methods
+        "Test class that counts the calls of __missing__()"
+
+        calls = 0
+
+        def __missing__(self, key):
+            CountingNocaseDefaultDict.calls += 1
+            return super().__missing__(key)
+
+    obj = CountingNocaseDefaultDict(int)
+    obj['Dog'] += 1
+    obj['dog'] += 1
+    assert list(obj.items()) == [('dog', 2)]
+    assert CountingNocaseDefaultDict.calls == 1
+
+
+def test_NocaseDefaultDict_copy():
+    """
+    Test function for copying, pickling and the representation of
+    NocaseDefaultDict objects.
+    """
+    obj = NocaseDefaultDict(list, Dog=[1])
+
+    for obj2 in (obj.copy(), pickle.loads(pickle.dumps(obj)), obj | {},
+                 {} | obj):
+        assert type(obj2) is NocaseDefaultDict  # pylint: disable=C0123
+        assert obj2.default_factory is list
+        assert obj2 == obj
+        assert obj2['Cat'] == []
+
+    assert repr(obj) == "NocaseDefaultDict(<class 'list'>, {'Dog': [1]})"
+
+
+def test_NocaseDefaultDict_fromkeys():
+    """
+    Test function for the class methods that create NocaseDefaultDict
+    objects, which have no default factory, like for
+    collections.defaultdict.fromkeys().
+    """
+    obj = NocaseDefaultDict.fromkeys(['Dog', 'Cat'], 0)
+    assert type(obj) is NocaseDefaultDict  # pylint: disable=C0123
+    assert obj.default_factory is None
+    assert list(obj.items()) == [('Dog', 0), ('Cat', 0)]
+
+    obj = NocaseDefaultDict.fromkeys(['Dog'])
+    assert list(obj.items()) == [('Dog', None)]
+
+    # Adding the items one by one, because the keys are casefolded again
+    template = NocaseDict.fromkeys(['Dog', 'Cat'])
+    obj = UpperNocaseDefaultDict.fromvalues(template, [1, 2])
+    assert type(obj) is UpperNocaseDefaultDict  # pylint: disable=C0123
+    assert obj.default_factory is None
+    assert list(obj.items()) == [('Dog', 1), ('Cat', 2)]
@@ -9,6 +9,8 @@ import re
 from collections import OrderedDict
 from collections.abc import KeysView, ValuesView, ItemsView, Iterator
 import unicodedata
+import pickle
+import weakref
 import pytest
 
 from ..utils.simplified_test_function import simplified_test_function
@@ -16,7 +18,7 @@ from ..utils.simplified_test_function import simplified_test_function
 # pylint: disable=wrong-import-position, wrong-import-order, invalid-name
 from ..utils.import_installed import import_installed
 nocasedict = import_installed('nocasedict')
-from nocasedict import NocaseDict as _NocaseDict  # noqa: E402
+from nocasedict import NocaseDict as _NocaseDict, NocaseKey  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
 # pylint: disable=use-dict-literal
@@ -560,6 +562,36 @@ def test_NocaseDict_getitem(testcase,
     assert act_value == exp_value, f"Unexpected value at key {key!r}"
 
 
+def test_NocaseDict_missing():
+    """
+    Test function for NocaseDict.__getitem__() on a subclass that defines
+    __missing__().
+    """
+
+    class MissingNocaseDict(NocaseDict):
+        # pylint: disable=too-few-public-methods
+        "Test class derived from NocaseDict that defines __missing__()"
+
+        def __missing__(self, key):
+            if key == 'error':
+                raise ValueError(key)
+            return f'missing {key}'
+
+    obj = MissingNocaseDict([('Dog', 'Cat')])
+
+    # The code to be tested
+    assert obj['Dog'] == 'Cat'
+    assert obj['Budgie'] == 'missing Budgie'
+    with pytest.raises(ValueError) as exc_info:
+        obj['error']  # pylint: disable=pointless-statement
+    assert exc_info.value.__context__ is None
+
+    # __missing__() is only called by __getitem__()
+    assert 'Budgie' not in obj
+    assert obj.get('Budgie') is None
+    assert obj == NocaseDict(Dog='Cat')
+
+
 TESTCASES_NOCASEDICT_SETITEM = [
 
     # Testcases for NocaseDict.__setitem__() / ncd[key]=value
@@ -703,6 +735,189 @@ def test_NocaseDict_setitem(testcase, obj, key, value):
     assert act_value == value, f"Unexpected value at key {key!r}"
 
 
+class MyStr(str):
+    # pylint: disable=too-few-public-methods
+    """
+    String class that inherits all methods.
+    """
+    pass
+
+
+class CasefoldOverrideDict(NocaseDict):  # type: ignore
+    # pylint: disable=too-few-public-methods
+    """
+    Subclass of the dictionary class being tested, that overrides the
+    casefold method.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.casefold()
+
+
+TESTCASES_NOCASEDICT_KEY_CASE = [
+
+    # Testcases for the lexical case of the keys after modifying a NocaseDict
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseDict object to be used for the test.
+    #   * modify: Function modifying the object, with parameter obj.
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Set lower case key that was mixed case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.__setitem__('dog', 'Kitten'),
+            exp_items=[('dog', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Set mixed case key that was lower case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.__setitem__('Budgie', 'Bird'),
+            exp_items=[('Dog', 'Cat'), ('Budgie', 'Bird')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Set mixed case key that was lower case, then delete and add it",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: (obj.__setitem__('Budgie', 'Bird'),
+                                obj.__delitem__('budgie'),
+                                obj.__setitem__('budgie', 'Fish')),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Set string subclass key that is equal to its casefolded key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.__setitem__(MyStr('budgie'), 'Bird'),
+            exp_items=[('Dog', 'Cat'), (MyStr('budgie'), 'Bird')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Pop mixed case key, then add it in lower case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: (obj.pop('DOG'),
+                                obj.__setitem__('dog', 'Cat')),
+            exp_items=[('budgie', 'Fish'), ('dog', 'Cat')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Setdefault for existing key does not change its lexical case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.setdefault('BUDGIE', 'Bird'),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Update from NocaseDict changes lexical case of existing keys",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.update(
+                NocaseDict([('dog', 'Kitten'), ('BUDGIE', 'Bird')])),
+            exp_items=[('dog', 'Kitten'), ('BUDGIE', 'Bird')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Delete the only mixed case key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.__delitem__('dog'),
+            exp_items=[('budgie', 'Fish')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Set the only mixed case key in lower case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            modify=lambda obj: obj.__setitem__('dog', 'Kitten'),
+            exp_items=[('dog', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Popitem for the only mixed case key, then set it in mixed case",
+        dict(
+            obj=NocaseDict([('budgie', 'Fish'), ('Dog', 'Cat')]),
+            modify=lambda obj: (obj.popitem(), obj.__setitem__('DOG', 'Cat')),
+            exp_items=[('budgie', 'Fish'), ('DOG', 'Cat')],
+        ),
+        None, None, True
+    ),
+    (
+        "Clear dict with mixed case keys, then add lower case key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            modify=lambda obj: (obj.clear(), obj.__setitem__('dog', 'Cat')),
+            exp_items=[('dog', 'Cat')],
+        ),
+        None, None, True
+    ),
+    (
+        "Popitem returns the original key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            modify=lambda obj: obj.__setitem__('Fish', obj.popitem()),
+            exp_items=[('Dog', 'Cat'), ('Fish', ('Budgie', 'Fish'))],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_KEY_CASE)
+@simplified_test_function
+def test_NocaseDict_key_case(testcase, obj, modify, exp_items):
+    """
+    Test function for the lexical case of the keys after modifying a
+    NocaseDict
+    """
+
+    # The code to be tested
+    modify(obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    act_items = list(obj.items())
+    assert act_items == exp_items
+    for (act_key, _), (exp_key, _) in zip(act_items, exp_items):
+        assert type(act_key) is type(exp_key)  # pylint: disable=C0123
+    assert list(reversed(obj.items())) == list(reversed(exp_items))
+
+    if not TEST_AGAINST_DICT:
+        # Original keys are stored only for keys that differ from their
+        # casefolded key, and dicts without them share an empty table.
+        # pylint: disable=protected-access,unidiomatic-typecheck
+        exp_keys = {k for k, _ in exp_items
+                    if type(k.casefold()) is not type(k) or k.casefold() != k}
+        assert set(obj._keys.values()) == exp_keys
+        if not exp_keys:
+            assert obj._keys is NocaseDict()._keys
+
+
 TESTCASES_NOCASEDICT_DELITEM = [
 
     # Testcases for NocaseDict.__delitem__() / del ncd[key]
@@ -2048,29 +2263,118 @@ def test_NocaseDict_iter(testcase, obj, exp_items):
     assert act_keys == exp_keys
 
 
-TESTCASES_NOCASEDICT_REPR = [
+TESTCASES_NOCASEDICT_VIEWS_CONTAINS = [
 
-    # Testcases for NocaseDict.__repr__() / repr(ncd)
+    # Testcases for membership tests on NocaseDict views
 
     # Each list item is a testcase tuple with these items:
     # * desc: Short testcase description.
     # * kwargs: Keyword arguments for the test function:
     #   * obj: NocaseDict object to be used for the test.
+    #   * view: Name of the view method ('keys', 'values', 'items').
+    #   * item: Item to test for membership in the view.
+    #   * exp_result: Expected result of the membership test.
     # * exp_exc_types: Expected exception type(s), or None.
     # * exp_warn_types: Expected warning type(s), or None.
     # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
 
     (
-        "Empty dict",
+        "Keys view, key in original case",
         dict(
-            obj=NocaseDict(),
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='keys',
+            item='Dog',
+            exp_result=True,
         ),
         None, None, True
     ),
     (
-        "Dict with two items",
+        "Keys view, key in other case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='keys',
+            item='DOG',
+            exp_result=True,
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Keys view, missing key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='keys',
+            item='Cat',
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Keys view, integer key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='keys',
+            item=1234,
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Items view, item with key in other case",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='items',
+            item=('budgie', 'Fish'),
+            exp_result=True,
+        ),
+        None, None, not TEST_AGAINST_DICT
+    ),
+    (
+        "Items view, item with different value",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='items',
+            item=('Budgie', 'fish'),
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Items view, item with missing key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='items',
+            item=('Cat', 'Fish'),
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Items view, item with integer key",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='items',
+            item=(1234, 'Cat'),
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Items view, object that is not a 2-tuple",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='items',
+            item='Dog',
+            exp_result=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Values view, value in other case",
         dict(
             obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            view='values',
+            item='cat',
+            exp_result=False,
         ),
         None, None, True
     ),
@@ -2079,144 +2383,470 @@ TESTCASES_NOCASEDICT_REPR = [
 
 @pytest.mark.parametrize(
     "desc, kwargs, exp_exc_types, exp_warn_types, condition",
-    TESTCASES_NOCASEDICT_REPR)
+    TESTCASES_NOCASEDICT_VIEWS_CONTAINS)
 @simplified_test_function
-def test_NocaseDict_repr(testcase, obj):
+def test_NocaseDict_views_contains(testcase, obj, view, item, exp_result):
     """
-    Test function for NocaseDict.__repr__() / repr(ncd)
+    Test function for membership tests on NocaseDict.keys(), values(),
+    items()
     """
 
+    view_obj = getattr(obj, view)()
+
     # The code to be tested
-    result = repr(obj)
+    result = item in view_obj
 
     # Ensure that exceptions raised in the remainder of this function
     # are not mistaken as expected exceptions
     assert testcase.exp_exc_types is None
 
-    if not TEST_AGAINST_DICT:
-        assert re.match(r'^NocaseDict\(.*\)$', result)
-
-    # Note: This only tests for existence of each item, not for excess items
-    # or representing the correct order.
-    for key, value in obj.items():
-        exp_item_result = f"{key!r}: {value!r}"
-        assert exp_item_result in result
+    assert result == exp_result
 
 
-TESTCASES_NOCASEDICT_UPDATE = [
+TESTCASES_NOCASEDICT_KEYS_SETOPS = [
 
-    # Testcases for NocaseDict.update()
+    # Testcases for set operations on NocaseDict.keys()
 
     # Each list item is a testcase tuple with these items:
     # * desc: Short testcase description.
     # * kwargs: Keyword arguments for the test function:
     #   * obj: NocaseDict object to be used for the test.
-    #   * args: List of positional args for update().
-    #   * kwargs: Dict of keyword args for update().
-    #   * exp_obj: Expected NocaseDict after being updated.
+    #   * other: Other operand (an iterable of keys).
+    #   * exp_and: Expected result of keys() & other.
+    #   * exp_or: Expected result of keys() | other.
+    #   * exp_sub: Expected result of keys() - other.
+    #   * exp_rsub: Expected result of other - keys().
+    #   * exp_xor: Expected result of keys() ^ other.
     # * exp_exc_types: Expected exception type(s), or None.
     # * exp_warn_types: Expected warning type(s), or None.
     # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
 
-    # Empty NocaseDict
-    (
-        "Empty dict, with empty update args + kwargs",
-        dict(
-            obj=NocaseDict(),
-            args=[],
-            kwargs={},
-            exp_obj=NocaseDict(),
-        ),
-        None, None, True
-    ),
-    (
-        "Empty dict, with two positional arguments (too many args)",
-        dict(
-            obj=NocaseDict(),
-            args=[dict(a=1), dict(b=2)],
-            kwargs={},
-            exp_obj=None,
-        ),
-        TypeError, None, True
-    ),
-    (
-        "Empty dict, with integer key in update args (no casefold / success)",
-        dict(
-            obj=NocaseDict(),
-            args=[[(1234, 'Invalid')]],
-            kwargs={},
-            exp_obj={1234: 'Invalid'} if TEST_AGAINST_DICT else None,
-        ),
-        None if TEST_AGAINST_DICT else AttributeError, None, True
-    ),
     (
-        "Empty dict, with empty string key in update args+items",
+        "Empty dict and empty set",
         dict(
             obj=NocaseDict(),
-            args=[OrderedDict([('', 'Cat')])],
-            kwargs={},
-            exp_obj=NocaseDict([('', 'Cat')]),
+            other=set(),
+            exp_and=set(),
+            exp_or=set(),
+            exp_sub=set(),
+            exp_rsub=set(),
+            exp_xor=set(),
         ),
         None, None, True
     ),
     (
-        "Empty dict, with empty string key in update args+iter",
+        "Keys in same case",
         dict(
-            obj=NocaseDict(),
-            args=[[('', 'Cat')]],
-            kwargs={},
-            exp_obj=NocaseDict([('', 'Cat')]),
+            obj=NocaseDict([('Dog', 1), ('Cat', 2)]),
+            other={'Cat', 'Bird'},
+            exp_and={'Cat'},
+            exp_or={'Dog', 'Cat', 'Bird'},
+            exp_sub={'Dog'},
+            exp_rsub={'Bird'},
+            exp_xor={'Dog', 'Bird'},
         ),
         None, None, True
     ),
     (
-        "Empty dict, with empty string key in update kwargs",
+        "Keys in different case, original case of dict keys is kept",
         dict(
-            obj=NocaseDict(),
-            args=[],
-            kwargs={'': 'Cat'},
-            exp_obj=NocaseDict([('', 'Cat')]),
+            obj=NocaseDict([('Dog', 1), ('Cat', 2)]),
+            other={'CAT', 'BIRD'},
+            exp_and={'Cat'},
+            exp_or={'Dog', 'Cat', 'BIRD'},
+            exp_sub={'Dog'},
+            exp_rsub={'BIRD'},
+            exp_xor={'Dog', 'BIRD'},
         ),
-        None, None, True
+        None, None, not TEST_AGAINST_DICT
     ),
     (
-        "Empty dict, with non-empty string key in update args+items",
+        "Other operand is the keys view of another NocaseDict",
         dict(
-            obj=NocaseDict(),
-            args=[OrderedDict([('Dog', 'Cat')])],
-            kwargs={},
-            exp_obj=NocaseDict([('Dog', 'Cat')]),
+            obj=NocaseDict([('Dog', 1), ('Cat', 2)]),
+            other=NocaseDict([('DOG', 1), ('FISH', 2)]).keys(),
+            exp_and={'Dog'},
+            exp_or={'Dog', 'Cat', 'FISH'},
+            exp_sub={'Cat'},
+            exp_rsub={'FISH'},
+            exp_xor={'Cat', 'FISH'},
         ),
-        None, None, True
+        None, None, not TEST_AGAINST_DICT
     ),
     (
-        "Empty dict, with non-empty string key in update args+iter",
+        "Other operand has an integer key",
         dict(
-            obj=NocaseDict(),
-            args=[[('Dog', 'Cat')]],
-            kwargs={},
-            exp_obj=NocaseDict([('Dog', 'Cat')]),
+            obj=NocaseDict([('Dog', 1), ('Cat', 2)]),
+            other={1234, 'CAT'},
+            exp_and={'Cat'},
+            exp_or={'Dog', 'Cat', 1234},
+            exp_sub={'Dog'},
+            exp_rsub={1234},
+            exp_xor={'Dog', 1234},
         ),
-        None, None, True
+        None, None, not TEST_AGAINST_DICT
     ),
     (
-        "Empty dict, with non-empty string key in update kwargs",
+        "Other operand has only an integer key",
         dict(
-            obj=NocaseDict(),
-            args=[],
-            kwargs={'Dog': 'Cat'},
-            exp_obj=NocaseDict([('Dog', 'Cat')]),
+            obj=NocaseDict([('Dog', 1), ('Cat', 2)]),
+            other={1234},
+            exp_and=set(),
+            exp_or={'Dog', 'Cat', 1234},
+            exp_sub={'Dog', 'Cat'},
+            exp_rsub={1234},
+            exp_xor={'Dog', 'Cat', 1234},
         ),
         None, None, True
     ),
-    (
-        "Empty dict, with list as positional arg, "
-        "whose item has only one item (cannot be unpacked into k,v)",
-        dict(
-            obj=NocaseDict(),
-            args=[[('Dog',)]],
-            kwargs={},
-            exp_obj=None,
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_KEYS_SETOPS)
+@simplified_test_function
+def test_NocaseDict_keys_setops(
+        testcase, obj, other, exp_and, exp_or, exp_sub, exp_rsub, exp_xor):
+    # pylint: disable=too-many-positional-arguments
+    """
+    Test function for set operations on NocaseDict.keys()
+    """
+
+    keys = obj.keys()
+
+    # The code to be tested
+    act_and = keys & other
+    act_or = keys | other
+    act_sub = keys - other
+    act_xor = keys ^ other
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert act_and == exp_and
+    assert act_or == exp_or
+    assert act_sub == exp_sub
+    assert act_xor == exp_xor
+    assert keys.isdisjoint(other) == (not exp_and)
+
+    if isinstance(other, (set, frozenset)):
+        # Test the reflected operations
+        assert other & keys == exp_and
+        assert other | keys == exp_or
+        assert other - keys == exp_rsub
+        assert other ^ keys == exp_xor
+
+
+def test_NocaseDict_views_reversed():
+    """
+    Test function for reversed() on NocaseDict.keys(), values(), items()
+    """
+    ncd = NocaseDict([('Dog', 1), ('Cat', 2), ('Bird', 3)])
+
+    assert list(reversed(ncd.keys())) == ['Bird', 'Cat', 'Dog']
+    assert list(reversed(ncd.values())) == [3, 2, 1]
+    assert list(reversed(ncd.items())) == \
+        [('Bird', 3), ('Cat', 2), ('Dog', 1)]
+
+
+def test_NocaseDict_keys_setops_iterator():
+    """
+    Test function for set operations on NocaseDict.keys() with an iterator
+    that has keys that cannot be casefolded
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict keys are case-sensitive")
+
+    ncd = NocaseDict([('Dog', 1), ('Cat', 2)])
+
+    assert ncd.keys() & iter(['CAT', 1234]) == {'Cat'}
+    assert ncd.keys() | iter(['CAT', 1234]) == {'Dog', 'Cat', 1234}
+
+
+def test_NocaseDict_iter_modified():
+    """
+    Test function for modifying a NocaseDict while iterating through it
+    """
+    ncd = NocaseDict([('Dog', 1), ('Cat', 2)])
+
+    for iterable in (ncd, ncd.keys(), ncd.values(), ncd.items()):
+        it = iter(iterable)
+        next(it)
+        ncd['Bird'] = 3
+        with pytest.raises(RuntimeError):
+            next(it)
+        del ncd['Bird']
+
+
+def test_NocaseDict_iter_updated():
+    """
+    Test function for updating the lexical case of the key of an existing item
+    of a NocaseDict while iterating through it
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict adds an item with the casefolded key")
+
+    def original():
+        return NocaseDict([('Alpha', 1), ('Beta', 2), ('Gamma', 3)])
+
+    def copied():
+        # The copy shares its original keys with the original dictionary
+        return original().copy()
+
+    def copied_from():
+        # The original dictionary shares its original keys with the copy
+        ncd = original()
+        _ = ncd.copy()
+        return ncd
+
+    def casefolded():
+        # The dictionary has no original keys
+        return NocaseDict([('alpha', 1), ('beta', 2), ('gamma', 3)])
+
+    def one_original():
+        # Updating the only original key removes the original keys
+        return NocaseDict([('alpha', 1), ('beta', 2), ('Gamma', 3)])
+
+    def get_items_keys(ncd):
+        return (k for k, _ in ncd.items())
+
+    def get_reversed_items_keys(ncd):
+        return (k for k, _ in reversed(ncd.items()))
+
+    # Each tuple has these items:
+    # * make_dict: Function that creates the NocaseDict object.
+    # * get_iter: Function that returns the iterator for the keys.
+    # * update_key: Key that is updated in the first iteration step.
+    # * exp_keys: Expected keys returned by the iteration. When the original
+    #   keys were shared or there were none when the iteration started, the
+    #   iteration returns the updated key in its previous lexical case, as
+    #   documented in NocaseDict.__iter__().
+    # * exp_new_keys: Expected keys returned by a new iteration.
+    for make_dict, get_iter, update_key, exp_keys, exp_new_keys in (
+            (original, iter, 'gamma',
+             ['Alpha', 'Beta', 'gamma'], ['Alpha', 'Beta', 'gamma']),
+            (original, reversed, 'alpha',
+             ['Gamma', 'Beta', 'alpha'], ['Gamma', 'Beta', 'alpha']),
+            (original, lambda d: iter(d.keys()), 'gamma',
+             ['Alpha', 'Beta', 'gamma'], ['Alpha', 'Beta', 'gamma']),
+            (original, get_items_keys, 'gamma',
+             ['Alpha', 'Beta', 'gamma'], ['Alpha', 'Beta', 'gamma']),
+            (one_original, iter, 'gamma',
+             ['alpha', 'beta', 'gamma'], ['alpha', 'beta', 'gamma']),
+            (one_original, get_items_keys, 'gamma',
+             ['alpha', 'beta', 'gamma'], ['alpha', 'beta', 'gamma']),
+            (copied, iter, 'gamma',
+             ['Alpha', 'Beta', 'Gamma'], ['Alpha', 'Beta', 'gamma']),
+            (copied, reversed, 'alpha',
+             ['Gamma', 'Beta', 'Alpha'], ['Gamma', 'Beta', 'alpha']),
+            (copied_from, iter, 'gamma',
+             ['Alpha', 'Beta', 'Gamma'], ['Alpha', 'Beta', 'gamma']),
+            (copied_from, get_items_keys, 'gamma',
+             ['Alpha', 'Beta', 'Gamma'], ['Alpha', 'Beta', 'gamma']),
+            (casefolded, iter, 'GAMMA',
+             ['alpha', 'beta', 'gamma'], ['alpha', 'beta', 'GAMMA']),
+            (casefolded, reversed, 'Alpha',
+             ['gamma', 'beta', 'alpha'], ['gamma', 'beta', 'Alpha']),
+            (casefolded, get_items_keys, 'GAMMA',
+             ['alpha', 'beta', 'gamma'], ['alpha', 'beta', 'GAMMA']),
+            (casefolded, get_reversed_items_keys, 'Alpha',
+             ['gamma', 'beta', 'alpha'], ['gamma', 'beta', 'Alpha'])):
+        ncd = make_dict()
+        act_keys = []
+
+        # The code to be tested
+        for key in get_iter(ncd):
+            if not act_keys:
+                ncd[update_key] = 9
+            act_keys.append(key)
+
+        assert act_keys == exp_keys
+        assert list(get_iter(ncd)) == exp_new_keys
+
+
+TESTCASES_NOCASEDICT_REPR = [
+
+    # Testcases for NocaseDict.__repr__() / repr(ncd)
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseDict object to be used for the test.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty dict",
+        dict(
+            obj=NocaseDict(),
+        ),
+        None, None, True
+    ),
+    (
+        "Dict with two items",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_REPR)
+@simplified_test_function
+def test_NocaseDict_repr(testcase, obj):
+    """
+    Test function for NocaseDict.__repr__() / repr(ncd)
+    """
+
+    # The code to be tested
+    result = repr(obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    if not TEST_AGAINST_DICT:
+        assert re.match(r'^NocaseDict\(.*\)$', result)
+
+    # Note: This only tests for existence of each item, not for excess items
+    # or representing the correct order.
+    for key, value in obj.items():
+        exp_item_result = f"{key!r}: {value!r}"
+        assert exp_item_result in result
+
+
+TESTCASES_NOCASEDICT_UPDATE = [
+
+    # Testcases for NocaseDict.update()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: NocaseDict object to be used for the test.
+    #   * args: List of positional args for update().
+    #   * kwargs: Dict of keyword args for update().
+    #   * exp_obj: Expected NocaseDict after being updated.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    # Empty NocaseDict
+    (
+        "Empty dict, with empty update args + kwargs",
+        dict(
+            obj=NocaseDict(),
+            args=[],
+            kwargs={},
+            exp_obj=NocaseDict(),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with two positional arguments (too many args)",
+        dict(
+            obj=NocaseDict(),
+            args=[dict(a=1), dict(b=2)],
+            kwargs={},
+            exp_obj=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Empty dict, with integer key in update args (no casefold / success)",
+        dict(
+            obj=NocaseDict(),
+            args=[[(1234, 'Invalid')]],
+            kwargs={},
+            exp_obj={1234: 'Invalid'} if TEST_AGAINST_DICT else None,
+        ),
+        None if TEST_AGAINST_DICT else AttributeError, None, True
+    ),
+    (
+        "Empty dict, with integer key in update dict (no casefold / success)",
+        dict(
+            obj=NocaseDict(),
+            args=[{1234: 'Invalid'}],
+            kwargs={},
+            exp_obj={1234: 'Invalid'} if TEST_AGAINST_DICT else None,
+        ),
+        None if TEST_AGAINST_DICT else AttributeError, None, True
+    ),
+    (
+        "Empty dict, with empty string key in update args+items",
+        dict(
+            obj=NocaseDict(),
+            args=[OrderedDict([('', 'Cat')])],
+            kwargs={},
+            exp_obj=NocaseDict([('', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with empty string key in update args+iter",
+        dict(
+            obj=NocaseDict(),
+            args=[[('', 'Cat')]],
+            kwargs={},
+            exp_obj=NocaseDict([('', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with empty string key in update kwargs",
+        dict(
+            obj=NocaseDict(),
+            args=[],
+            kwargs={'': 'Cat'},
+            exp_obj=NocaseDict([('', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with non-empty string key in update args+items",
+        dict(
+            obj=NocaseDict(),
+            args=[OrderedDict([('Dog', 'Cat')])],
+            kwargs={},
+            exp_obj=NocaseDict([('Dog', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with non-empty string key in update args+iter",
+        dict(
+            obj=NocaseDict(),
+            args=[[('Dog', 'Cat')]],
+            kwargs={},
+            exp_obj=NocaseDict([('Dog', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with non-empty string key in update kwargs",
+        dict(
+            obj=NocaseDict(),
+            args=[],
+            kwargs={'Dog': 'Cat'},
+            exp_obj=NocaseDict([('Dog', 'Cat')]),
+        ),
+        None, None, True
+    ),
+    (
+        "Empty dict, with list as positional arg, "
+        "whose item has only one item (cannot be unpacked into k,v)",
+        dict(
+            obj=NocaseDict(),
+            args=[[('Dog',)]],
+            kwargs={},
+            exp_obj=None,
         ),
         ValueError, None, True
     ),
@@ -2431,6 +3061,45 @@ def test_NocaseDict_update(testcase,
     assert obj == exp_obj  # Uses NocaseDict equality
 
 
+class IntNocaseDict(NocaseDict):  # type: ignore
+    """
+    NocaseDict subclass that overrides __setitem__() to only accept integer
+    values.
+    """
+
+    def __setitem__(self, key, value):
+        if not isinstance(value, int):
+            raise TypeError(f"Value {value!r} is not an integer")
+        super().__setitem__(key, value)
+
+
+def test_NocaseDict_update_subclass():
+    """
+    Test function for NocaseDict.update() and the methods using it on a
+    subclass that overrides __setitem__().
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict.update() does not use the __setitem__() method of "
+                    "subclasses")
+
+    other = NocaseDict(Dog='Cat')
+
+    # The code to be tested
+    with pytest.raises(TypeError):
+        IntNocaseDict(other)
+    with pytest.raises(TypeError):
+        IntNocaseDict().update(other)
+    with pytest.raises(TypeError):
+        IntNocaseDict(Budgie=1) | other  # pylint: disable=W0106
+    obj = IntNocaseDict(Budgie=1)
+    with pytest.raises(TypeError):
+        obj |= other
+
+    obj = IntNocaseDict(NocaseDict(Dog=1))
+    assert list(obj.items()) == [('Dog', 1)]
+
+
 TESTCASES_NOCASEDICT_CLEAR = [
 
     # Testcases for NocaseDict.clear()
@@ -2498,54 +3167,852 @@ TESTCASES_NOCASEDICT_COPY = [
     # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
 
     (
-        "Empty dict",
+        "Empty dict",
+        dict(
+            obj=NocaseDict(),
+            test_key=None,
+            test_value=None,
+        ),
+        None, None, True
+    ),
+    (
+        "Dict with two items",
+        dict(
+            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            test_key='Dog',
+            test_value='Kitten',
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_COPY)
+@simplified_test_function
+def test_NocaseDict_copy(testcase,
+                         obj, test_key, test_value):
+    """
+    Test function for NocaseDict.copy()
+    """
+
+    # The code to be tested
+    obj_copy = obj.copy()
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    # The verification below also uses some NocaseDict features, but that is
+    # unavoidable if we want to work through the public interface:
+
+    assert obj_copy == obj  # Uses NocaseDict equality
+
+    # Verify that the copy is a copy
+    if test_key is not None:
+        org_value = obj[test_key]  # Uses NocaseDict get
+        obj_copy[test_key] = test_value  # Uses NocaseDict set
+        now_value = obj[test_key]  # Uses NocaseDict get
+        assert now_value == org_value
+
+
+def test_NocaseDict_copy_subclass():
+    """
+    Test function for NocaseDict.copy() on a subclass.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict.copy() does not preserve the subclass")
+
+    class MyNocaseDict(NocaseDict):
+        # pylint: disable=too-few-public-methods
+        "Test class derived from NocaseDict"
+        pass
+
+    obj = MyNocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')])
+
+    # The code to be tested
+    obj_copy = obj.copy()
+
+    assert type(obj_copy) is MyNocaseDict  # pylint: disable=C0123
+    assert obj_copy == obj
+    obj_copy['dog'] = 'Kitten'
+    assert obj['Dog'] == 'Cat'
+
+
+TESTCASES_NOCASEDICT_SHARED_KEYS = [
+
+    # Testcases for modifying a copy of a NocaseDict that shares the keys with
+    # the original
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * modify: Function modifying the copy, with parameter obj.
+    #   * exp_items: List with expected items (key,value) of the copy in
+    #     expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Set existing key in same lexical case",
+        dict(
+            modify=lambda obj: obj.__setitem__('Dog', 'Kitten'),
+            exp_items=[('Dog', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Set existing key in different lexical case",
+        dict(
+            modify=lambda obj: obj.__setitem__('DOG', 'Kitten'),
+            exp_items=[('DOG', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Set existing key in lower case",
+        dict(
+            modify=lambda obj: obj.__setitem__('dog', 'Kitten'),
+            exp_items=[('dog', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Set new key",
+        dict(
+            modify=lambda obj: obj.__setitem__('Cow', 'Calf'),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish'), ('Cow', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "Delete mixed case key",
+        dict(
+            modify=lambda obj: obj.__delitem__('dog'),
+            exp_items=[('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Pop mixed case key",
+        dict(
+            modify=lambda obj: obj.pop('dog'),
+            exp_items=[('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Popitem twice",
+        dict(
+            modify=lambda obj: (obj.popitem(), obj.popitem()),
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Setdefault for new key",
+        dict(
+            modify=lambda obj: obj.setdefault('Cow', 'Calf'),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish'), ('Cow', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "Update from NocaseDict",
+        dict(
+            modify=lambda obj: obj.update(
+                NocaseDict([('dog', 'Kitten'), ('Budgie', 'Bird')])),
+            exp_items=[('dog', 'Kitten'), ('Budgie', 'Bird')],
+        ),
+        None, None, True
+    ),
+    (
+        "Clear",
+        dict(
+            modify=lambda obj: obj.clear(),
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_SHARED_KEYS)
+@simplified_test_function
+def test_NocaseDict_shared_keys(testcase, modify, exp_items):
+    """
+    Test function for modifying copies of a NocaseDict that share the keys
+    with the original.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not share keys")
+
+    org_items = [('Dog', 'Cat'), ('budgie', 'Fish')]
+    org = NocaseDict(org_items)
+    copies = [org.copy(), NocaseDict(org), NocaseDict.fromvalues(org, [1, 2])]
+    for obj in copies:
+        # pylint: disable=protected-access
+        assert obj._keys is org._keys
+
+    # The code to be tested
+    modify(copies[0])
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert list(copies[0].items()) == exp_items
+    assert list(org.items()) == org_items
+    assert list(copies[1].items()) == org_items
+    assert list(copies[2].items()) == [('Dog', 1), ('budgie', 2)]
+
+    # The copies remain independent after pickling
+    org2, copy2 = pickle.loads(pickle.dumps([org, copies[1]]))
+    copy2['DOG'] = 'Kitten'
+    assert list(org2.items()) == org_items
+
+
+TESTCASES_NOCASEDICT_FROMVALUES = [
+
+    # Testcases for NocaseDict.fromvalues()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * template: Template dictionary.
+    #   * values: Iterable of values.
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty template and no values",
+        dict(
+            template=NocaseDict(),
+            values=[],
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Template with two items and values from a generator",
+        dict(
+            template=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            values=(v for v in ('Kitten', 'Bird')),
+            exp_items=[('Dog', 'Kitten'), ('budgie', 'Bird')],
+        ),
+        None, None, True
+    ),
+    (
+        "Template with different casefold method",
+        dict(
+            template=CasefoldOverrideDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            values=['Kitten', 'Bird'],
+            exp_items=[('Dog', 'Kitten'), ('budgie', 'Bird')],
+        ),
+        None, None, True
+    ),
+    (
+        "Too few values",
+        dict(
+            template=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            values=['Kitten'],
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Too many values",
+        dict(
+            template=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            values=['Kitten', 'Bird', 'Calf'],
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Template is a dict",
+        dict(
+            template=dict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            values=['Kitten', 'Bird'],
+            exp_items=None,
+        ),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_FROMVALUES)
+@simplified_test_function
+def test_NocaseDict_fromvalues(testcase, template, values, exp_items):
+    """
+    Test function for NocaseDict.fromvalues()
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have fromvalues()")
+
+    # The code to be tested
+    obj = NocaseDict.fromvalues(template, values)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert type(obj) is NocaseDict  # pylint: disable=unidiomatic-typecheck
+    assert list(obj.items()) == exp_items
+
+
+def test_NocaseDict_fromvalues_subclass():
+    """
+    Test function for NocaseDict.fromvalues() on a subclass that overrides
+    __setitem__().
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have fromvalues()")
+
+    template = NocaseDict([('Dog', None), ('budgie', None)])
+
+    # The code to be tested
+    obj = IntNocaseDict.fromvalues(template, [1, 2])
+
+    assert type(obj) is IntNocaseDict  # pylint: disable=C0123
+    assert list(obj.items()) == [('Dog', 1), ('budgie', 2)]
+    with pytest.raises(TypeError):
+        IntNocaseDict.fromvalues(template, [1, 'Fish'])
+
+
+def pairs_generator():
+    """Return a generator for key, value pairs"""
+    yield 'Dog', 'Cat'
+    yield 'budgie', 'Fish'
+
+
+TESTCASES_NOCASEDICT_FROM_PAIRS = [
+
+    # Testcases for NocaseDict.from_pairs()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * cls: NocaseDict class to be used for the test.
+    #   * pairs: Iterable of key, value pairs.
+    #   * unique: unique parameter for from_pairs().
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty list",
+        dict(
+            cls=NocaseDict,
+            pairs=[],
+            unique=True,
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "List with mixed case and lower case keys",
+        dict(
+            cls=NocaseDict,
+            pairs=[('Dog', 'Cat'), ('budgie', 'Fish'), ('COW', 'Calf')],
+            unique=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish'), ('COW', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "Tuple of pairs",
+        dict(
+            cls=NocaseDict,
+            pairs=(('Dog', 'Cat'), ('budgie', 'Fish')),
+            unique=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Generator of pairs",
+        dict(
+            cls=NocaseDict,
+            pairs=pairs_generator(),
+            unique=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Keys of other types than str",
+        dict(
+            cls=NocaseDict,
+            pairs=[(None, 'Cat'), (b'Budgie', 'Fish'), (MyStr('cow'), 'Calf'),
+                   (MyStr('Pig'), 'Piglet')],
+            unique=True,
+            exp_items=[(None, 'Cat'), (b'Budgie', 'Fish'),
+                       (MyStr('cow'), 'Calf'), (MyStr('Pig'), 'Piglet')],
+        ),
+        None, None, True
+    ),
+    (
+        "NocaseKey keys",
+        dict(
+            cls=NocaseDict,
+            pairs=[(NocaseKey('Dog'), 'Cat'), ('budgie', 'Fish')],
+            unique=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Class that overrides the casefold method",
+        dict(
+            cls=CasefoldOverrideDict,
+            pairs=[('Dog', 'Cat'), ('budgie', 'Fish')],
+            unique=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Duplicate keys with unique=True",
+        dict(
+            cls=NocaseDict,
+            pairs=[('Dog', 'Cat'), ('budgie', 'Fish'), ('DOG', 'Kitten')],
+            unique=True,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Duplicate keys of other types with unique=True",
+        dict(
+            cls=NocaseDict,
+            pairs=[(b'Dog', 'Cat'), (b'DOG', 'Kitten')],
+            unique=True,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Duplicate keys with unique=False",
+        dict(
+            cls=NocaseDict,
+            pairs=[('Dog', 'Cat'), ('budgie', 'Fish'), ('dog', 'Kitten'),
+                   ('Budgie', 'Bird')],
+            unique=False,
+            exp_items=[('dog', 'Kitten'), ('Budgie', 'Bird')],
+        ),
+        None, None, True
+    ),
+    (
+        "Duplicate keys of other types with unique=False",
+        dict(
+            cls=NocaseDict,
+            pairs=[(b'Dog', 'Cat'), (b'dog', 'Kitten'), (MyStr('cow'), 'Calf'),
+                   ('COW', 'Bull')],
+            unique=False,
+            exp_items=[(b'dog', 'Kitten'), ('COW', 'Bull')],
+        ),
+        None, None, True
+    ),
+    (
+        "Item that is not a pair",
+        dict(
+            cls=NocaseDict,
+            pairs=[('Dog', 'Cat', 'Fish')],
+            unique=True,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Item that is not iterable",
+        dict(
+            cls=NocaseDict,
+            pairs=[42],
+            unique=True,
+            exp_items=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Key that cannot be casefolded",
+        dict(
+            cls=NocaseDict,
+            pairs=[(42, 'Cat')],
+            unique=True,
+            exp_items=None,
+        ),
+        AttributeError, None, True
+    ),
+    (
+        "Subclass that overrides __setitem__()",
+        dict(
+            cls=IntNocaseDict,
+            pairs=[('Dog', 1), ('budgie', 2)],
+            unique=True,
+            exp_items=[('Dog', 1), ('budgie', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Subclass that overrides __setitem__(), with keys that are not unique",
+        dict(
+            cls=IntNocaseDict,
+            pairs=[('Dog', 1), ('DOG', 2)],
+            unique=True,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Subclass that overrides __setitem__(), with value it rejects",
+        dict(
+            cls=IntNocaseDict,
+            pairs=[('Dog', 1), ('budgie', 'Fish')],
+            unique=True,
+            exp_items=None,
+        ),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_FROM_PAIRS)
+@simplified_test_function
+def test_NocaseDict_from_pairs(testcase, cls, pairs, unique, exp_items):
+    """
+    Test function for NocaseDict.from_pairs()
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have from_pairs()")
+
+    # The code to be tested
+    obj = cls.from_pairs(pairs, unique=unique)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert type(obj) is cls  # pylint: disable=unidiomatic-typecheck
+    act_items = list(obj.items())
+    assert act_items == exp_items
+    for (act_key, _), (exp_key, _) in zip(act_items, exp_items):
+        assert type(act_key) is type(exp_key)  # pylint: disable=C0123
+
+    # The result is the same as when adding the items one by one
+    exp_obj = cls(exp_items)
+    assert obj == exp_obj
+    # pylint: disable=protected-access
+    assert obj._keys == exp_obj._keys
+
+
+TESTCASES_NOCASEDICT_FROM_MAPPING = [
+
+    # Testcases for NocaseDict.from_mapping()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * mapping: Mapping to be used for the test.
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty dict",
+        dict(
+            mapping={},
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Dict",
+        dict(
+            mapping={'Dog': 'Cat', 'budgie': 'Fish'},
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Dict with keys that are equal case-insensitively",
+        dict(
+            mapping={'Dog': 'Cat', 'budgie': 'Fish', 'DOG': 'Kitten'},
+            exp_items=[('DOG', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "OrderedDict",
+        dict(
+            mapping=OrderedDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "NocaseDict",
+        dict(
+            mapping=NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')]),
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_FROM_MAPPING)
+@simplified_test_function
+def test_NocaseDict_from_mapping(testcase, mapping, exp_items):
+    """
+    Test function for NocaseDict.from_mapping()
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have from_mapping()")
+
+    # The code to be tested
+    obj = NocaseDict.from_mapping(mapping)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert type(obj) is NocaseDict  # pylint: disable=unidiomatic-typecheck
+    assert list(obj.items()) == exp_items
+    assert obj == NocaseDict(mapping)
+
+
+def test_NocaseDict_from_mapping_subclass():
+    """
+    Test function for NocaseDict.from_mapping() on a subclass that overrides
+    __setitem__().
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have from_mapping()")
+
+    # The code to be tested
+    obj = IntNocaseDict.from_mapping({'Dog': 1})
+
+    assert type(obj) is IntNocaseDict  # pylint: disable=C0123
+    assert list(obj.items()) == [('Dog', 1)]
+    with pytest.raises(TypeError):
+        IntNocaseDict.from_mapping({'Dog': 'Cat'})
+
+
+TESTCASES_NOCASEDICT_FOLDED = [
+
+    # Testcases for the NocaseDict methods that take casefolded keys
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * operation: Function performing the operation, with parameter obj.
+    #   * check: Boolean indicating whether the debug mode is enabled.
+    #   * exp_result: Expected result of the operation.
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "get_folded() for existing key",
+        dict(
+            operation=lambda obj: obj.get_folded('dog'),
+            check=True,
+            exp_result='Cat',
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "get_folded() for missing key with default",
+        dict(
+            operation=lambda obj: obj.get_folded('cow', 'Calf'),
+            check=True,
+            exp_result='Calf',
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "get_folded() for key that is not casefolded",
+        dict(
+            operation=lambda obj: obj.get_folded('Dog'),
+            check=False,
+            exp_result=None,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "get_folded() for key that is not casefolded, in debug mode",
+        dict(
+            operation=lambda obj: obj.get_folded('Dog'),
+            check=True,
+            exp_result=None,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "contains_folded() for existing key",
+        dict(
+            operation=lambda obj: obj.contains_folded('budgie'),
+            check=True,
+            exp_result=True,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "contains_folded() for missing key",
         dict(
-            obj=NocaseDict(),
-            test_key=None,
-            test_value=None,
+            operation=lambda obj: obj.contains_folded('cow'),
+            check=True,
+            exp_result=False,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish')],
         ),
         None, None, True
     ),
     (
-        "Dict with two items",
+        "contains_folded() for key that is not casefolded, in debug mode",
         dict(
-            obj=NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')]),
-            test_key='Dog',
-            test_value='Kitten',
+            operation=lambda obj: obj.contains_folded('Budgie'),
+            check=True,
+            exp_result=None,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "set_folded() for new key in mixed case",
+        dict(
+            operation=lambda obj: obj.set_folded('cow', 'Cow', 'Calf'),
+            check=True,
+            exp_result=None,
+            exp_items=[('Dog', 'Cat'), ('budgie', 'Fish'), ('Cow', 'Calf')],
+        ),
+        None, None, True
+    ),
+    (
+        "set_folded() for existing key in lower case",
+        dict(
+            operation=lambda obj: obj.set_folded('dog', 'dog', 'Kitten'),
+            check=True,
+            exp_result=None,
+            exp_items=[('dog', 'Kitten'), ('budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "set_folded() for existing key in upper case",
+        dict(
+            operation=lambda obj: obj.set_folded('budgie', 'BUDGIE', 'Bird'),
+            check=True,
+            exp_result=None,
+            exp_items=[('Dog', 'Cat'), ('BUDGIE', 'Bird')],
+        ),
+        None, None, True
+    ),
+    (
+        "set_folded() for key that does not match, in debug mode",
+        dict(
+            operation=lambda obj: obj.set_folded('dog', 'Cow', 'Calf'),
+            check=True,
+            exp_result=None,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "del_folded() for existing key",
+        dict(
+            operation=lambda obj: obj.del_folded('dog'),
+            check=True,
+            exp_result=None,
+            exp_items=[('budgie', 'Fish')],
         ),
         None, None, True
     ),
+    (
+        "del_folded() for missing key",
+        dict(
+            operation=lambda obj: obj.del_folded('cow'),
+            check=True,
+            exp_result=None,
+            exp_items=None,
+        ),
+        KeyError, None, True
+    ),
+    (
+        "del_folded() for key that is not casefolded, in debug mode",
+        dict(
+            operation=lambda obj: obj.del_folded('DOG'),
+            check=True,
+            exp_result=None,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
 ]
 
 
 @pytest.mark.parametrize(
     "desc, kwargs, exp_exc_types, exp_warn_types, condition",
-    TESTCASES_NOCASEDICT_COPY)
+    TESTCASES_NOCASEDICT_FOLDED)
 @simplified_test_function
-def test_NocaseDict_copy(testcase,
-                         obj, test_key, test_value):
+def test_NocaseDict_folded(testcase, operation, check, exp_result, exp_items):
     """
-    Test function for NocaseDict.copy()
+    Test function for the NocaseDict methods that take casefolded keys.
     """
 
-    # The code to be tested
-    obj_copy = obj.copy()
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have methods for casefolded keys")
+
+    org_items = [('Dog', 'Cat'), ('budgie', 'Fish')]
+    org = NocaseDict(org_items)
+    obj = org.copy()  # Shares the original keys with org
+
+    # pylint: disable=protected-access
+    saved_check = nocasedict._nocasedict.CHECK_FOLDED_KEYS
+    nocasedict._nocasedict.CHECK_FOLDED_KEYS = check
+    try:
+
+        # The code to be tested
+        result = operation(obj)
+
+    finally:
+        nocasedict._nocasedict.CHECK_FOLDED_KEYS = saved_check
 
     # Ensure that exceptions raised in the remainder of this function
     # are not mistaken as expected exceptions
     assert testcase.exp_exc_types is None
 
-    # The verification below also uses some NocaseDict features, but that is
-    # unavoidable if we want to work through the public interface:
-
-    assert obj_copy == obj  # Uses NocaseDict equality
-
-    # Verify that the copy is a copy
-    if test_key is not None:
-        org_value = obj[test_key]  # Uses NocaseDict get
-        obj_copy[test_key] = test_value  # Uses NocaseDict set
-        now_value = obj[test_key]  # Uses NocaseDict get
-        assert now_value == org_value
+    assert result == exp_result
+    assert list(obj.items()) == exp_items
+    assert list(org.items()) == org_items
+    assert obj == NocaseDict(exp_items)
 
 
 TESTCASES_NOCASEDICT_EQUAL = [
@@ -2770,6 +4237,88 @@ TESTCASES_NOCASEDICT_EQUAL = [
         ),
         None, None, True
     ),
+    (
+        "Standard dict, keys and values equal",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=dict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            exp_obj_equal=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Standard dict, keys different lexical case, values equal",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=dict([('budgie', 'Fish'), ('DOG', 'Cat')]),
+            exp_obj_equal=not TEST_AGAINST_DICT,
+        ),
+        None, None, True
+    ),
+    (
+        "Standard dict, keys equal, values different",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=dict([('Budgie', 'Fish'), ('Dog', 'Car')]),
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Standard dict, same size with keys that differ only in lexical case",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=dict([('Budgie', 'Fish'), ('BUDGIE', 'Fish')]),
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Standard dict with a key that cannot be casefolded",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish')]),
+            obj2=dict([(1, 'Fish')]),
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Standard dict with a key that cannot be casefolded and a key that "
+        "is equal",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=dict([('Budgie', 'Fish'), (('Dog',), 'Cat')]),
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "String of the same length",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish')]),
+            obj2='x',
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "List of the same length",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish')]),
+            obj2=['Budgie'],
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Tuple of the same length",
+        dict(
+            obj1=NocaseDict([('Budgie', 'Fish'), ('Dog', 'Cat')]),
+            obj2=('Budgie', 'Dog'),
+            exp_obj_equal=False,
+        ),
+        None, None, True
+    ),
     (
         "A value raises TypeError when compared (and equal still succeeds)",
         dict(
@@ -3045,6 +4594,134 @@ def test_NocaseDict_ordering(testcase,
     assert result == exp_result
 
 
+class SubclassNocaseDict(NocaseDict):  # type: ignore
+    # pylint: disable=too-few-public-methods
+    """
+    Subclass of the dictionary class being tested, without __slots__.
+    """
+    pass
+
+
+class SlotsSubclassNocaseDict(NocaseDict):  # type: ignore
+    # pylint: disable=too-few-public-methods
+    """
+    Subclass of the dictionary class being tested, with __slots__.
+    """
+    __slots__ = ('foo',)
+
+
+def test_NocaseDict_slots():
+    """
+    Test function for the __slots__ of NocaseDict.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have __slots__")
+
+    ncd = NocaseDict(Dog='Cat')
+    assert not hasattr(ncd, '__dict__')
+    with pytest.raises(AttributeError):
+        ncd.foo = 'bar'  # pylint: disable=attribute-defined-outside-init
+    assert weakref.ref(ncd)() is ncd
+    assert pickle.loads(pickle.dumps(ncd)) == ncd
+
+    subncd = SubclassNocaseDict(Dog='Cat')
+    subncd.foo = 'bar'  # pylint: disable=attribute-defined-outside-init
+    assert subncd.__dict__ == {'foo': 'bar'}
+    subncd2 = pickle.loads(pickle.dumps(subncd))
+    assert subncd2 == subncd
+    assert subncd2.foo == 'bar'
+
+    slotsncd = SlotsSubclassNocaseDict(Dog='Cat')
+    slotsncd.foo = 'bar'  # pylint: disable=attribute-defined-outside-init
+    assert not hasattr(slotsncd, '__dict__')
+    slotsncd2 = pickle.loads(pickle.dumps(slotsncd))
+    assert slotsncd2 == slotsncd
+    assert slotsncd2.foo == 'bar'
+
+
+@pytest.mark.parametrize(
+    "protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_NocaseDict_pickle_protocols(protocol):
+    """
+    Test function for pickling NocaseDict objects and objects of subclasses
+    with all pickle protocols.
+    """
+
+    ncd = NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')])
+    ncd2 = pickle.loads(pickle.dumps(ncd, protocol))
+    assert ncd2 == ncd
+    assert list(ncd2) == ['Dog', 'budgie']
+
+    if TEST_AGAINST_DICT:
+        return
+
+    subncd = SubclassNocaseDict(Dog='Cat')
+    subncd.foo = 'bar'  # pylint: disable=attribute-defined-outside-init
+    subncd2 = pickle.loads(pickle.dumps(subncd, protocol))
+    assert subncd2.__class__ is SubclassNocaseDict
+    assert subncd2 == subncd
+    assert subncd2.foo == 'bar'
+
+    slotsncd = SlotsSubclassNocaseDict(Dog='Cat')
+    slotsncd.foo = 'bar'  # pylint: disable=attribute-defined-outside-init
+    slotsncd2 = pickle.loads(pickle.dumps(slotsncd, protocol))
+    assert slotsncd2.__class__ is SlotsSubclassNocaseDict
+    assert slotsncd2 == slotsncd
+    assert slotsncd2.foo == 'bar'
+
+
+class OrderedDataNocaseDict(NocaseDict):  # type: ignore
+    # pylint: disable=too-few-public-methods
+    """
+    Subclass of the dictionary class being tested, whose internal dictionary
+    is an OrderedDict.
+    """
+    __slots__ = ()
+    _data_class = OrderedDict
+
+
+def test_NocaseDict_data_class():
+    """
+    Test function for the class of the internal dictionary of a NocaseDict
+    subclass that sets _data_class.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have an internal dictionary")
+
+    template = NocaseDict([('Dog', 'Cat'), ('budgie', 'Fish')])
+    odncd = OrderedDataNocaseDict()
+    odncd.update(template)
+    odncd.update([('Cow', 'Calf')])
+
+    for obj in (
+            odncd,
+            OrderedDataNocaseDict(template),
+            OrderedDataNocaseDict.fromkeys(['Dog', 'budgie']),
+            OrderedDataNocaseDict.fromvalues(template, [1, 2]),
+            OrderedDataNocaseDict.from_pairs([('Dog', 1), ('budgie', 2)]),
+            OrderedDataNocaseDict.from_pairs(
+                [('dog', 1), ('Dog', 2)], unique=False),
+            odncd.copy(),
+            odncd | template,
+            pickle.loads(pickle.dumps(odncd))):
+        assert obj.__class__ is OrderedDataNocaseDict
+        # pylint: disable=protected-access
+        assert obj._data.__class__ is OrderedDict
+        assert list(obj)[0] == 'Dog'
+
+    data = odncd._data  # pylint: disable=protected-access
+    odncd.clear()
+    odncd.update(template)
+    assert odncd._data is data  # pylint: disable=protected-access
+    assert list(odncd) == ['Dog', 'budgie']
+
+    # The default class of the internal dictionary is dict
+    ncd = NocaseDict.fromvalues(template, [1, 2])
+    assert ncd._data.__class__ is dict  # pylint: disable=protected-access
+
+
 def test_unnamed_keys():
     """
     Test function for unnamed keys (key=None). This can be allowed in the
@@ -3097,6 +4774,150 @@ def test_casefold_override():
     assert act_value == exp_value
 
 
+def test_casefold_override_mixin():
+    """
+    Test function for overriding the casefold method in a mixin class that
+    is not derived from NocaseDict.
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("The override test does not support testing with dict")
+
+    class LowerMixin:
+        # pylint: disable=too-few-public-methods
+        "Mixin class that overrides the casefold method"
+
+        @staticmethod
+        def __casefold__(key):
+            return key.lower()
+
+    class MyNocaseDict(LowerMixin, NocaseDict):
+        # pylint: disable=too-few-public-methods
+        "Test class that gets the casefold method from a mixin class"
+
+    dic = MyNocaseDict()
+
+    # The code to be tested
+    dic['Stra\u00dfe'] = 1
+
+    assert list(dic) == ['Stra\u00dfe']
+    assert 'STRA\u00dfE' in dic
+    assert 'STRASSE' not in dic
+    assert dic.keys_nocase() == {'stra\u00dfe'}
+
+
+class CasefoldStr(str):
+    # pylint: disable=too-few-public-methods
+    """
+    String class with its own casefold method.
+    """
+
+    def casefold(self):
+        return self.upper()
+
+
+class LowerOnly:
+    # pylint: disable=too-few-public-methods
+    """
+    Class that has a lower method but no casefold method.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def lower(self):
+        "Return the lower case value"
+        return self.value.lower()
+
+
+TESTCASES_NOCASEDICT_CASEFOLD = [
+
+    # Testcases for NocaseDict.__casefold__()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * key: Input key.
+    #   * exp_result: Expected casefolded key.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Unicode string",
+        dict(
+            key='Straße',
+            exp_result='strasse',
+        ),
+        None, None, True
+    ),
+    (
+        "Byte string",
+        dict(
+            key=b'Dog',
+            exp_result=b'dog',
+        ),
+        None, None, True
+    ),
+    (
+        "Byte array",
+        dict(
+            key=bytearray(b'Dog'),
+            exp_result=bytearray(b'dog'),
+        ),
+        None, None, True
+    ),
+    (
+        "String subclass with its own casefold method",
+        dict(
+            key=CasefoldStr('Dog'),
+            exp_result='DOG',
+        ),
+        None, None, True
+    ),
+    (
+        "Object with a lower method only",
+        dict(
+            key=LowerOnly('Dog'),
+            exp_result='dog',
+        ),
+        None, None, True
+    ),
+    (
+        "Integer (no casefold or lower method)",
+        dict(
+            key=42,
+            exp_result=None,
+        ),
+        AttributeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_CASEFOLD)
+@simplified_test_function
+def test_NocaseDict_casefold(testcase, key, exp_result):
+    """
+    Test function for NocaseDict.__casefold__()
+    """
+
+    if TEST_AGAINST_DICT:
+        pytest.skip("dict does not have a casefold method")
+
+    # The code to be tested. Twice, to cover the remembered casefold function.
+    result1 = NocaseDict.__casefold__(key)
+    result2 = NocaseDict.__casefold__(key)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert result1 == exp_result
+    assert result2 == exp_result
+
+
 TESTCASES_NOCASEDICT_OR_ROR = [
 
     # Testcases for NocaseDict.__or__(), __ror__()
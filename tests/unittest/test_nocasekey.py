@@ -0,0 +1,170 @@
+"""
+Test the NocaseKey class.
+"""
+
+
+import os
+import pickle
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseKey, NocaseRecord, \
+    enable_casefold_cache, disable_casefold_cache  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not support NocaseKey", allow_module_level=True)
+
+
+class UpperNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    Test class that overrides the casefold method, using upper case as the
+    case-insensitive form of the keys.
+    """
+
+    @staticmethod
+    def __casefold__(key):
+        return key.upper()
+
+
+def test_NocaseKey_attrs():
+    """
+    Test function for the attributes, hashing and equality of NocaseKey.
+    """
+    nkey = NocaseKey('InstanceID')
+
+    assert nkey.key == 'InstanceID'
+    assert nkey.folded == 'instanceid'
+    assert repr(nkey) == "NocaseKey('InstanceID')"
+    assert hash(nkey) == hash('instanceid')
+
+    assert nkey == NocaseKey('INSTANCEID')
+    assert nkey != NocaseKey('ElementName')
+    assert nkey != 'InstanceID'
+    assert nkey != 'instanceid'
+
+    # Usable as case-insensitive key in the standard dict and set
+    dct = {nkey: 'value'}
+    assert dct[NocaseKey('instanceID')] == 'value'
+    assert NocaseKey('INSTANCEID') in {nkey}
+
+    assert NocaseKey(b'Dog').folded == b'dog'
+    assert NocaseKey(None).folded is None
+
+    with pytest.raises(AttributeError):
+        nkey.folded = 'other'
+
+    with pytest.raises(AttributeError):
+        NocaseKey(42)
+
+    nkey2 = pickle.loads(pickle.dumps(nkey))
+    assert nkey2 == nkey
+    assert nkey2.key == 'InstanceID'
+
+
+TESTCASES_NOCASEKEY_DICT = [
+
+    # Testcases for using NocaseKey objects with NocaseDict objects
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * cls: NocaseDict class to be used for the test.
+    #   * cache: Boolean indicating whether the casefold cache is enabled.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "NocaseDict",
+        dict(cls=NocaseDict, cache=False),
+        None, None, True
+    ),
+    (
+        "NocaseDict with casefold cache",
+        dict(cls=NocaseDict, cache=True),
+        None, None, True
+    ),
+    (
+        "Subclass that overrides the casefold method",
+        dict(cls=UpperNocaseDict, cache=False),
+        None, None, True
+    ),
+    (
+        "Subclass that overrides the casefold method, with casefold cache",
+        dict(cls=UpperNocaseDict, cache=True),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEKEY_DICT)
+@simplified_test_function
+def test_NocaseKey_dict(testcase, cls, cache):
+    """
+    Test function for using NocaseKey objects with NocaseDict objects.
+    """
+    if cache:
+        enable_casefold_cache()
+    try:
+        obj = cls(Dog='Cat', budgie='Fish')
+        dog = NocaseKey('DOG')
+        cow = NocaseKey('Cow')
+
+        # The code to be tested
+        assert obj[dog] == 'Cat'
+        assert dog in obj
+        assert cow not in obj
+        assert obj.get(dog) == 'Cat'
+        assert obj.get(cow, 'default') == 'default'
+        with pytest.raises(KeyError):
+            _ = obj[cow]
+
+        obj[cow] = 'Calf'
+        assert list(obj.items()) == \
+            [('Dog', 'Cat'), ('budgie', 'Fish'), ('Cow', 'Calf')]
+        assert type(list(obj)[2]) is str  # pylint: disable=C0123
+
+        assert obj.pop(dog) == 'Cat'
+        assert obj.pop(dog, 'default') == 'default'
+        assert obj.setdefault(NocaseKey('Dog'), 'Kitten') == 'Kitten'
+        del obj[NocaseKey('BUDGIE')]
+        assert list(obj.items()) == [('Cow', 'Calf'), ('Dog', 'Kitten')]
+
+        # The key objects can be reused with other dictionaries
+        assert cls(dog='Cat')[dog] == 'Cat'
+        assert cls(DOG='Cat')[dog] == 'Cat'
+    finally:
+        disable_casefold_cache()
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+
+def test_NocaseKey_record():
+    """
+    Test function for using NocaseKey objects with records.
+    """
+    Row = NocaseRecord(['InstanceID', 'ElementName'], 'Row')
+    row = Row('id1', 'Fan 1')
+    nkey = NocaseKey('instanceid')
+
+    assert row[nkey] == 'id1'
+    assert nkey in row
+    assert row.get(NocaseKey('Caption')) is None
+
+    row[nkey] = 'id2'
+    assert row['InstanceID'] == 'id2'
@@ -0,0 +1,377 @@
+"""
+Test the NocaseLRUCache class.
+"""
+
+
+import os
+from collections import OrderedDict
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseKey, NocaseLRUCache, \
+    NocaseCacheInfo  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not have a cache", allow_module_level=True)
+
+
+TESTCASES_NOCASELRUCACHE_INIT = [
+
+    # Testcases for NocaseLRUCache.__init__()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * init_kwargs: Keyword arguments for NocaseLRUCache().
+    #   * exp_info: Expected NocaseCacheInfo of the new cache.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Default parameters",
+        dict(
+            init_kwargs=dict(),
+            exp_info=NocaseCacheInfo(0, 0, 0, 128, 0, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "LFU policy",
+        dict(
+            init_kwargs=dict(maxsize=2, policy='lfu'),
+            exp_info=NocaseCacheInfo(0, 0, 0, 2, 0, 'lfu'),
+        ),
+        None, None, True
+    ),
+    (
+        "No limit",
+        dict(
+            init_kwargs=dict(maxsize=None),
+            exp_info=NocaseCacheInfo(0, 0, 0, None, 0, 'lru'),
+        ),
+        None, None, True
+    ),
+    (
+        "Invalid maxsize",
+        dict(
+            init_kwargs=dict(maxsize=0),
+            exp_info=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Invalid policy",
+        dict(
+            init_kwargs=dict(policy='fifo'),
+            exp_info=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASELRUCACHE_INIT)
+@simplified_test_function
+def test_NocaseLRUCache_init(testcase, init_kwargs, exp_info):
+    """
+    Test function for NocaseLRUCache.__init__()
+    """
+
+    # The code to be tested
+    cache = NocaseLRUCache(**init_kwargs)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert cache.cache_info() == exp_info
+    assert cache.maxsize == exp_info.maxsize
+    assert cache.policy == exp_info.policy
+    assert not hasattr(cache, '__dict__')
+
+
+TESTCASES_NOCASELRUCACHE_USE = [
+
+    # Testcases for using and evicting the items of a NocaseLRUCache
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * policy: policy parameter for NocaseLRUCache().
+    #   * ops: List of operations on a cache with maxsize=3, each a tuple of
+    #     ('set', key, value), ('get', key) or ('getitem', key).
+    #   * exp_items: Expected items of the cache in iteration order.
+    #   * exp_evicted: Expected evicted items in order of eviction.
+    #   * exp_stats: Expected tuple of hits, misses, evictions.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "LRU: Items are added in order",
+        dict(
+            policy='lru',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3)],
+            exp_items=[('Dog', 1), ('Cat', 2), ('cow', 3)],
+            exp_evicted=[],
+            exp_stats=(0, 0, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Least recently added item is evicted",
+        dict(
+            policy='lru',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('set', 'Budgie', 4)],
+            exp_items=[('Cat', 2), ('cow', 3), ('Budgie', 4)],
+            exp_evicted=[('Dog', 1)],
+            exp_stats=(0, 0, 1),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Lookups in other case use the item",
+        dict(
+            policy='lru',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('getitem', 'DOG'), ('get', 'CAT'), ('set', 'Budgie', 4)],
+            exp_items=[('Dog', 1), ('Cat', 2), ('Budgie', 4)],
+            exp_evicted=[('cow', 3)],
+            exp_stats=(2, 0, 1),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Updating an item uses it and keeps the new key",
+        dict(
+            policy='lru',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('set', 'DOG', 5), ('set', 'Budgie', 4)],
+            exp_items=[('cow', 3), ('DOG', 5), ('Budgie', 4)],
+            exp_evicted=[('Cat', 2)],
+            exp_stats=(0, 0, 1),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: Misses are counted",
+        dict(
+            policy='lru',
+            ops=[('set', 'Dog', 1), ('get', 'Cat'), ('getitem', 'Cat')],
+            exp_items=[('Dog', 1)],
+            exp_evicted=[],
+            exp_stats=(0, 2, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "LRU: NocaseKey objects",
+        dict(
+            policy='lru',
+            ops=[('set', NocaseKey('Dog'), 1), ('getitem', NocaseKey('DOG'))],
+            exp_items=[('Dog', 1)],
+            exp_evicted=[],
+            exp_stats=(1, 0, 0),
+        ),
+        None, None, True
+    ),
+    (
+        "LFU: Least frequently used item is evicted",
+        dict(
+            policy='lfu',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('getitem', 'DOG'), ('getitem', 'COW'), ('getitem', 'dog'),
+                 ('set', 'Budgie', 4)],
+            exp_items=[('Dog', 1), ('cow', 3), ('Budgie', 4)],
+            exp_evicted=[('Cat', 2)],
+            exp_stats=(3, 0, 1),
+        ),
+        None, None, True
+    ),
+    (
+        "LFU: Least recently used item of least frequently used is evicted",
+        dict(
+            policy='lfu',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('getitem', 'COW'), ('getitem', 'CAT'), ('get', 'DOG'),
+                 ('set', 'Budgie', 4), ('set', 'Fish', 5)],
+            exp_items=[('Dog', 1), ('Cat', 2), ('Fish', 5)],
+            exp_evicted=[('cow', 3), ('Budgie', 4)],
+            exp_stats=(3, 0, 2),
+        ),
+        None, None, True
+    ),
+    (
+        "LFU: Updating an item uses it",
+        dict(
+            policy='lfu',
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('set', 'cow', 3),
+                 ('set', 'DOG', 5), ('set', 'cat', 6), ('set', 'Budgie', 4)],
+            exp_items=[('DOG', 5), ('cat', 6), ('Budgie', 4)],
+            exp_evicted=[('cow', 3)],
+            exp_stats=(0, 0, 1),
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASELRUCACHE_USE)
+@simplified_test_function
+def test_NocaseLRUCache_use(testcase, policy, ops, exp_items, exp_evicted,
+                            exp_stats):
+    # pylint: disable=too-many-positional-arguments
+    """
+    Test function for using and evicting the items of a NocaseLRUCache.
+    """
+    evicted = []
+    cache = NocaseLRUCache(
+        maxsize=3, policy=policy,
+        on_evict=lambda key, value: evicted.append((key, value)))
+
+    # The code to be tested
+    for op, key, *value in ops:
+        if op == 'set':
+            cache[key] = value[0]
+        elif op == 'get':
+            cache.get(key)
+        else:
+            try:
+                cache[key]  # pylint: disable=pointless-statement
+            except KeyError:
+                pass
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert list(cache.items()) == exp_items
+    assert evicted == exp_evicted
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == exp_stats
+    assert info.currsize == len(exp_items)
+
+
+@pytest.mark.parametrize("policy", ['lru', 'lfu'])
+def test_NocaseLRUCache_remove(policy):
+    """
+    Test function for removing items from a NocaseLRUCache explicitly.
+    """
+    evicted = []
+    cache = NocaseLRUCache(
+        maxsize=3, policy=policy,
+        on_evict=lambda key, value: evicted.append((key, value)))
+    cache.update([('Dog', 1), ('Cat', 2), ('cow', 3)])
+
+    # Removing items explicitly does not evict and does not count
+    del cache['DOG']
+    assert cache.pop('CAT') == 2
+    assert cache.pop('CAT', 'default') == 'default'
+    with pytest.raises(KeyError):
+        del cache['CAT']
+    with pytest.raises(KeyError):
+        cache.pop('CAT')
+    assert list(cache) == ['cow']
+
+    # The next item to be evicted is popped
+    cache['Budgie'] = 4
+    cache['Fish'] = 5
+    cache['budgie']  # pylint: disable=pointless-statement
+    assert cache.popitem() == ('cow', 3)
+    assert cache.popitem() == ('Fish', 5)
+    assert list(cache) == ['Budgie']
+
+    # The used item is evicted for LRU, the other item for LFU
+    cache['Dog'] = 1
+    cache['Cat'] = 2
+    cache['Fish'] = 5
+    if policy == 'lru':
+        assert list(cache) == ['Dog', 'Cat', 'Fish']
+        assert evicted == [('Budgie', 4)]
+    else:
+        assert list(cache) == ['Budgie', 'Cat', 'Fish']
+        assert evicted == [('Dog', 1)]
+
+    # Testing for keys and iterating do not use items
+    assert 'CAT' in cache
+    assert evicted[0][0].upper() not in cache
+    assert len(list(cache.values())) == 3
+    assert cache.cache_info()[:3] == (1, 0, 1)
+
+    cache.clear()
+    assert not cache
+    with pytest.raises(KeyError):
+        cache.popitem()
+    cache['Dog'] = 1
+    assert list(cache.items()) == [('Dog', 1)]
+    assert cache.cache_info()[:3] == (1, 0, 1)
+
+
+@pytest.mark.parametrize("policy", ['lru', 'lfu'])
+def test_NocaseLRUCache_data(policy):
+    """
+    Test function for the internal dictionary of a NocaseLRUCache, which is
+    also the internal dictionary of its NocaseDict object.
+    """
+    # pylint: disable=protected-access
+    cache = NocaseLRUCache(maxsize=2, policy=policy)
+    data = cache._data
+    assert data.__class__ is OrderedDict
+    assert cache._dict._data is data
+
+    cache.update([('Dog', 1), ('Cat', 2)])
+    assert cache._dict._data is data
+    cache['Cow'] = 3  # Evicts an item
+    assert cache.cache_info().evictions == 1
+    assert cache._dict._data is data
+    cache.popitem()
+    del cache['COW']
+    assert cache._dict._data is data
+    cache.update(dict(Dog=1, Cat=2))
+    cache.clear()
+    assert cache._dict._data is data
+    cache['Dog'] = 1
+    assert list(data) == ['dog']
+
+
+def test_NocaseLRUCache_conversion():
+    """
+    Test function for comparing and converting NocaseLRUCache objects.
+    """
+    cache = NocaseLRUCache(maxsize=None)
+    cache.update(Dog=1, Cat=2)
+
+    assert cache == NocaseDict(DOG=1, cat=2)
+    assert cache == dict(Dog=1, Cat=2)
+    assert cache != NocaseDict(DOG=1)
+    cache2 = NocaseLRUCache(maxsize=2)
+    cache2.update(cat=2, dog=1)
+    assert cache == cache2
+
+    ncd = cache.as_nocasedict()
+    assert isinstance(ncd, NocaseDict)
+    assert list(ncd.items()) == [('Dog', 1), ('Cat', 2)]
+    ncd['Cow'] = 3
+    assert 'Cow' not in cache
+
+    assert repr(cache) == \
+        "NocaseLRUCache({'Dog': 1, 'Cat': 2}, maxsize=None, policy='lru')"
+
+    with pytest.raises(TypeError):
+        hash(cache)
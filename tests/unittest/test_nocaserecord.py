@@ -0,0 +1,428 @@
+"""
+Test the NocaseRecord() record generator function.
+"""
+
+
+import os
+import pickle
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseRecord  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not have records", allow_module_level=True)
+
+# The record class used for the tests
+Row = NocaseRecord(['InstanceID', 'ElementName', 'Caption'], 'Row')
+
+
+TESTCASES_NOCASERECORD_CLASS = [
+
+    # Testcases for NocaseRecord()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * field_names: field_names parameter for NocaseRecord().
+    #   * exp_fields: Expected field names of the class.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No fields",
+        dict(
+            field_names=[],
+            exp_fields=(),
+        ),
+        None, None, True
+    ),
+    (
+        "Fields from a generator",
+        dict(
+            field_names=(name for name in ['Dog', 'budgie']),
+            exp_fields=('Dog', 'budgie'),
+        ),
+        None, None, True
+    ),
+    (
+        "Field names that are not identifiers",
+        dict(
+            field_names=['first name', '_f0', 'class'],
+            exp_fields=('first name', '_f0', 'class'),
+        ),
+        None, None, True
+    ),
+    (
+        "Field names that are duplicates case-insensitively",
+        dict(
+            field_names=['Dog', 'DOG'],
+            exp_fields=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Field name that is not a string",
+        dict(
+            field_names=['Dog', 42],
+            exp_fields=None,
+        ),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASERECORD_CLASS)
+@simplified_test_function
+def test_NocaseRecord_class(testcase, field_names, exp_fields):
+    """
+    Test function for NocaseRecord()
+    """
+
+    # The code to be tested
+    cls = NocaseRecord(field_names)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert cls.__name__ == 'NocaseRecord'
+    assert cls._fields == exp_fields  # pylint: disable=protected-access
+
+    # Initialize all fields, using keyword arguments for the last field
+    values = list(range(len(exp_fields)))
+    kwargs = {}
+    if exp_fields:
+        kwargs[exp_fields[-1].upper()] = values.pop()
+    rec = cls(*values, **kwargs)
+
+    assert list(rec.items()) == list(zip(exp_fields, range(len(exp_fields))))
+    assert not hasattr(rec, '__dict__')
+
+
+TESTCASES_NOCASERECORD_INIT = [
+
+    # Testcases for initializing a record
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * init_args: Tuple of positional arguments.
+    #   * init_kwargs: Dict of keyword arguments.
+    #   * exp_items: List with expected items (key,value) in expected order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No arguments",
+        dict(
+            init_args=(),
+            init_kwargs={},
+            exp_items=[('InstanceID', None), ('ElementName', None),
+                       ('Caption', None)],
+        ),
+        None, None, True
+    ),
+    (
+        "All fields as positional arguments",
+        dict(
+            init_args=('id1', 'Fan', 'A fan'),
+            init_kwargs={},
+            exp_items=[('InstanceID', 'id1'), ('ElementName', 'Fan'),
+                       ('Caption', 'A fan')],
+        ),
+        None, None, True
+    ),
+    (
+        "Keyword arguments in different lexical case",
+        dict(
+            init_args=('id1',),
+            init_kwargs=dict(CAPTION='A fan', elementname='Fan'),
+            exp_items=[('InstanceID', 'id1'), ('ElementName', 'Fan'),
+                       ('Caption', 'A fan')],
+        ),
+        None, None, True
+    ),
+    (
+        "Too many positional arguments",
+        dict(
+            init_args=('id1', 'Fan', 'A fan', 'extra'),
+            init_kwargs={},
+            exp_items=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Keyword argument that is not a field",
+        dict(
+            init_args=(),
+            init_kwargs=dict(Name='Fan'),
+            exp_items=None,
+        ),
+        KeyError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASERECORD_INIT)
+@simplified_test_function
+def test_NocaseRecord_init(testcase, init_args, init_kwargs, exp_items):
+    """
+    Test function for initializing a record
+    """
+
+    # The code to be tested
+    rec = Row(*init_args, **init_kwargs)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert list(rec.items()) == exp_items
+    assert list(rec.keys()) == [item[0] for item in exp_items]
+    assert list(rec.values()) == [item[1] for item in exp_items]
+    assert list(rec) == [item[0] for item in exp_items]
+    assert len(rec) == len(exp_items)
+
+
+TESTCASES_NOCASERECORD_ACCESS = [
+
+    # Testcases for accessing fields of a record
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * key: Key to be used for the test.
+    #   * exp_value: Expected value for the key, or None if it does not exist.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Key in original lexical case",
+        dict(key='ElementName', exp_value='Fan'),
+        None, None, True
+    ),
+    (
+        "Key in upper case",
+        dict(key='ELEMENTNAME', exp_value='Fan'),
+        None, None, True
+    ),
+    (
+        "Key that is not a field",
+        dict(key='Name', exp_value=None),
+        KeyError, None, True
+    ),
+    (
+        "Key that is the name of a slot",
+        dict(key='_f0', exp_value=None),
+        KeyError, None, True
+    ),
+    (
+        "None key",
+        dict(key=None, exp_value=None),
+        KeyError, None, True
+    ),
+    (
+        "Integer key",
+        dict(key=42, exp_value=None),
+        AttributeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASERECORD_ACCESS)
+@simplified_test_function
+def test_NocaseRecord_access(testcase, key, exp_value):
+    """
+    Test function for accessing fields of a record
+    """
+    rec = Row('id1', 'Fan', 'A fan')
+
+    # The code to be tested
+    act_value = rec[key]
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert act_value == exp_value
+    assert rec.get(key) == exp_value
+    assert key in rec
+    assert key in rec.keys()
+    assert (key, exp_value) in rec.items()
+
+    rec[key] = 'Bird'
+    assert rec[key] == 'Bird'
+
+
+def test_NocaseRecord_missing():
+    """
+    Test function for accessing keys that are not fields of a record
+    """
+    rec = Row('id1', 'Fan', 'A fan')
+
+    assert 'Name' not in rec
+    assert None not in rec
+    assert rec.get('Name') is None
+    assert rec.get('Name', 'default') == 'default'
+    with pytest.raises(KeyError):
+        rec['Name'] = 'Fan'
+    with pytest.raises(TypeError):
+        del rec['ElementName']  # pylint: disable=unsupported-delete-operation
+
+
+TESTCASES_NOCASERECORD_EQUAL = [
+
+    # Testcases for comparing records for equality
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * other: Object to compare the record Row('id1', 'Fan', None) with.
+    #   * exp_equal: Expected result of the comparison.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Equal record",
+        dict(other=Row('id1', 'Fan'), exp_equal=True),
+        None, None, True
+    ),
+    (
+        "Record with different value",
+        dict(other=Row('id1', 'Fan', 'A fan'), exp_equal=False),
+        None, None, True
+    ),
+    (
+        "Equal NocaseDict with keys in different lexical case",
+        dict(
+            other=NocaseDict(
+                [('instanceid', 'id1'), ('ELEMENTNAME', 'Fan'),
+                 ('Caption', None)]),
+            exp_equal=True),
+        None, None, True
+    ),
+    (
+        "NocaseDict with fewer items",
+        dict(
+            other=NocaseDict([('InstanceID', 'id1'), ('ElementName', 'Fan')]),
+            exp_equal=False),
+        None, None, True
+    ),
+    (
+        "Equal dict with keys in different lexical case",
+        dict(
+            other=dict(
+                [('instanceid', 'id1'), ('ELEMENTNAME', 'Fan'),
+                 ('Caption', None)]),
+            exp_equal=True),
+        None, None, True
+    ),
+    (
+        "Record of a different class with the same items",
+        dict(
+            other=NocaseRecord(['instanceid', 'elementname', 'caption'])(
+                'id1', 'Fan'),
+            exp_equal=True),
+        None, None, True
+    ),
+    (
+        "List",
+        dict(other=['id1', 'Fan', None], exp_equal=False),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASERECORD_EQUAL)
+@simplified_test_function
+def test_NocaseRecord_eq(testcase, other, exp_equal):
+    """
+    Test function for comparing records for equality
+    """
+    rec = Row('id1', 'Fan')
+
+    # The code to be tested
+    equal = rec == other
+    reflected_equal = other == rec
+    not_equal = rec != other
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert equal == exp_equal
+    assert reflected_equal == exp_equal
+    assert not_equal != exp_equal
+
+
+def test_NocaseRecord_conversion():
+    """
+    Test function for converting between records and NocaseDict objects
+    """
+    rec = Row('id1', 'Fan', 'A fan')
+    exp_items = [('InstanceID', 'id1'), ('ElementName', 'Fan'),
+                 ('Caption', 'A fan')]
+
+    ncd = rec.as_nocasedict()
+    assert type(ncd) is NocaseDict  # pylint: disable=unidiomatic-typecheck
+    assert list(ncd.items()) == exp_items
+
+    ncd2 = NocaseDict(rec)
+    assert list(ncd2.items()) == exp_items
+
+    ncd2.update(Row('id2'))
+    assert ncd2['instanceid'] == 'id2'
+    assert ncd2['caption'] is None
+
+    rec2 = Row()
+    rec2.update(NocaseDict([('CAPTION', 'Big fan'), ('instanceid', 'id3')]))
+    assert list(rec2.values()) == ['id3', None, 'Big fan']
+
+    rec2.update(rec)
+    assert rec2 == rec
+    assert rec2 is not rec
+
+    rec3 = rec.copy()
+    rec3['Caption'] = 'Big fan'
+    assert rec['Caption'] == 'A fan'
+
+    rec3.update([('ElementName', 'Fan 2')], caption='Fan 2')
+    assert list(rec3.values()) == ['id1', 'Fan 2', 'Fan 2']
+
+
+def test_NocaseRecord_pickle():
+    """
+    Test function for pickling records
+    """
+    rec = Row('id1', 'Fan', 'A fan')
+    assert repr(rec) == \
+        "Row({'InstanceID': 'id1', 'ElementName': 'Fan', 'Caption': 'A fan'})"
+
+    # The code to be tested
+    rec2 = pickle.loads(pickle.dumps(rec))
+
+    assert type(rec2) is Row  # pylint: disable=unidiomatic-typecheck
+    assert rec2 == rec
@@ -0,0 +1,302 @@
+"""
+Test the NocaseTTLDict class.
+"""
+
+
+import os
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseKey, NocaseTTLDict  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not expire items", allow_module_level=True)
+
+
+class FakeClock:
+    """
+    Clock for the tests, that only advances when told so.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Advance the clock"""
+        self.now += seconds
+
+
+TESTCASES_NOCASETTLDICT_EXPIRY = [
+
+    # Testcases for the expiry of items of a NocaseTTLDict
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * ttl: ttl parameter for NocaseTTLDict().
+    #   * ops: List of operations, each a tuple of ('set', key, value),
+    #     ('set', key, value, ttl) for set() with a TTL, or
+    #     ('advance', seconds) for advancing the clock.
+    #   * exp_items: Expected items of the dictionary in iteration order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No default TTL, items do not expire",
+        dict(
+            ttl=None,
+            ops=[('set', 'Dog', 1), ('advance', 1e9)],
+            exp_items=[('Dog', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Default TTL, item has not expired yet",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('advance', 9.9)],
+            exp_items=[('Dog', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Default TTL, item has expired",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('advance', 10)],
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Default TTL, setting again in other case restarts TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2), ('advance', 5),
+                 ('set', 'DOG', 3), ('advance', 5)],
+            exp_items=[('DOG', 3)],
+        ),
+        None, None, True
+    ),
+    (
+        "Per-item TTL shorter than default TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2, 5), ('advance', 5)],
+            exp_items=[('Dog', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Per-item TTL longer than default TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('set', 'Cat', 2, 20), ('advance', 10)],
+            exp_items=[('Cat', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Per-item TTL without default TTL",
+        dict(
+            ttl=None,
+            ops=[('set', 'Dog', 1, 5), ('set', 'Cat', 2, 20),
+                 ('set', 'cow', 3), ('advance', 10)],
+            exp_items=[('Cat', 2), ('cow', 3)],
+        ),
+        None, None, True
+    ),
+    (
+        "Per-item TTL None, item does not expire",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1, None), ('advance', 1e9)],
+            exp_items=[('Dog', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Item with per-item TTL set again with default TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1, 5), ('set', 'dog', 2), ('advance', 5)],
+            exp_items=[('dog', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Item with default TTL set again with per-item TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1), ('set', 'dog', 2, 20), ('advance', 10)],
+            exp_items=[('dog', 2)],
+        ),
+        None, None, True
+    ),
+    (
+        "NocaseKey object",
+        dict(
+            ttl=10,
+            ops=[('set', NocaseKey('Dog'), 1), ('advance', 5)],
+            exp_items=[('Dog', 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "Invalid default TTL",
+        dict(
+            ttl=0,
+            ops=[],
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Invalid per-item TTL",
+        dict(
+            ttl=10,
+            ops=[('set', 'Dog', 1, -1)],
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASETTLDICT_EXPIRY)
+@simplified_test_function
+def test_NocaseTTLDict_expiry(testcase, ttl, ops, exp_items):
+    """
+    Test function for the expiry of items of a NocaseTTLDict.
+    """
+    clock = FakeClock()
+
+    # The code to be tested
+    ttld = NocaseTTLDict(ttl=ttl, clock=clock)
+    for op, *args in ops:
+        if op == 'advance':
+            clock.advance(*args)
+        else:
+            ttld.set(*args)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    # Lazy expiry on access, before purging
+    for key in ['Dog', 'Cat', 'Cow']:
+        exp_value = NocaseDict(exp_items).get(key)
+        assert ttld.get(key.upper()) == exp_value
+        assert (key in ttld) == (exp_value is not None)
+
+    assert list(ttld.items()) == exp_items
+    assert len(ttld) == len(exp_items)
+    assert ttld.ttl == ttl
+    assert not hasattr(ttld, '__dict__')
+
+
+def test_NocaseTTLDict_purge():
+    """
+    Test function for purging the expired items of a NocaseTTLDict.
+    """
+    clock = FakeClock()
+    ttld = NocaseTTLDict(ttl=10, clock=clock)
+    ttld['Dog'] = 1
+    ttld.set('Cat', 2, ttl=5)
+    ttld.set('Cow', 3, ttl=None)
+    assert ttld.purge() == 0
+
+    clock.advance(5)
+    assert ttld.purge() == 1
+    clock.advance(5)
+    # Setting an item purges the expired items
+    ttld['Budgie'] = 4
+    assert list(ttld._data) == ['cow', 'budgie']  # pylint: disable=W0212
+
+    # Expired items cannot be deleted or retrieved
+    clock.advance(10)
+    with pytest.raises(KeyError):
+        del ttld['BUDGIE']
+    with pytest.raises(KeyError):
+        ttld['BUDGIE']  # pylint: disable=pointless-statement
+    assert ttld.pop('BUDGIE', None) is None
+    assert ttld.setdefault('Budgie', 5) == 5
+    assert ttld.pop('COW') == 3
+    assert list(ttld) == ['Budgie']
+
+    ttld.clear()
+    assert not ttld
+    assert ttld.purge() == 0
+
+    # The internal dictionary is the one of the NocaseDict object
+    # pylint: disable=protected-access
+    assert ttld._dict._data is ttld._data
+    ttld.update(Dog=1)
+    assert list(ttld._data) == ['dog']
+
+
+def test_NocaseTTLDict_heap():
+    """
+    Test function for the heap of the items with a per-item TTL of a
+    NocaseTTLDict, when the items are set again many times.
+    """
+    clock = FakeClock()
+    ttld = NocaseTTLDict(clock=clock)
+    for i in range(1000):
+        ttld.set('Dog', i, ttl=100)
+        ttld.set('Cat', i, ttl=40 + 10 * (i % 2))
+        clock.advance(0.01)
+
+    # Entries for items that were set again are removed from the heap
+    assert len(ttld._heap) <= 2 * 2 + 64  # pylint: disable=protected-access
+    assert list(ttld.items()) == [('Dog', 999), ('Cat', 999)]
+
+    clock.advance(50)
+    assert list(ttld.items()) == [('Dog', 999)]
+    clock.advance(50)
+    assert not ttld
+
+
+def test_NocaseTTLDict_conversion():
+    """
+    Test function for comparing and converting NocaseTTLDict objects.
+    """
+    clock = FakeClock()
+    ttld = NocaseTTLDict(ttl=10, clock=clock)
+    ttld.update(Dog=1, Cat=2)
+    ttld.set('Cow', 3, ttl=20)
+
+    assert ttld == NocaseDict(DOG=1, cat=2, cow=3)
+    ttld2 = NocaseTTLDict(clock=clock)
+    ttld2.update(cow=3, cat=2, dog=1)
+    assert ttld == ttld2
+
+    clock.advance(10)
+    assert ttld == dict(Cow=3)
+    assert ttld != ttld2
+
+    ncd = ttld.as_nocasedict()
+    assert isinstance(ncd, NocaseDict)
+    ncd['Dog'] = 1
+    assert 'Dog' not in ttld
+
+    assert repr(ttld) == "NocaseTTLDict({'Cow': 3}, ttl=10)"
+
+    with pytest.raises(TypeError):
+        hash(ttld)
@@ -0,0 +1,266 @@
+"""
+Test the WeakValueNocaseDict class.
+"""
+
+
+import os
+import gc
+import pytest
+
+from ..utils.simplified_test_function import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils.import_installed import import_installed
+nocasedict = import_installed('nocasedict')
+from nocasedict import NocaseDict, NocaseKey, WeakValueNocaseDict  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# pylint: disable=use-dict-literal
+
+# Controls whether the tests are run against a standard dict instead.
+TEST_AGAINST_DICT = os.getenv('TEST_DICT')
+
+if TEST_AGAINST_DICT:
+    pytest.skip("dict does not reference values weakly",
+                allow_module_level=True)
+
+
+class Obj:
+    # pylint: disable=too-few-public-methods
+    """
+    Value that supports weak references.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Obj({self.name!r})"
+
+
+TESTCASES_WEAKVALUENOCASEDICT_COLLECT = [
+
+    # Testcases for the removal of items whose values are garbage collected
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * keys: Keys of the initial items, each with a new value.
+    #   * collect: Keys of the items whose values are garbage collected.
+    #   * exp_keys: Expected keys of the dictionary in iteration order.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No values collected",
+        dict(
+            keys=['Dog', 'Cat'],
+            collect=[],
+            exp_keys=['Dog', 'Cat'],
+        ),
+        None, None, True
+    ),
+    (
+        "One value collected",
+        dict(
+            keys=['Dog', 'Cat', 'cow'],
+            collect=['Cat'],
+            exp_keys=['Dog', 'cow'],
+        ),
+        None, None, True
+    ),
+    (
+        "All values collected",
+        dict(
+            keys=['Dog', 'Cat'],
+            collect=['Dog', 'Cat'],
+            exp_keys=[],
+        ),
+        None, None, True
+    ),
+    (
+        "NocaseKey objects",
+        dict(
+            keys=[NocaseKey('Dog'), NocaseKey('Cat')],
+            collect=[NocaseKey('DOG')],
+            exp_keys=['Cat'],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_WEAKVALUENOCASEDICT_COLLECT)
+@simplified_test_function
+def test_WeakValueNocaseDict_collect(testcase, keys, collect, exp_keys):
+    """
+    Test function for the removal of items of a WeakValueNocaseDict whose
+    values are garbage collected.
+    """
+    values = NocaseDict((key, Obj(key)) for key in keys)
+    wvd = WeakValueNocaseDict(values)
+
+    # The code to be tested
+    for key in collect:
+        del values[key]
+    gc.collect()
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    # The items are not removed before the dictionary is modified, but are
+    # not found.
+    # pylint: disable=protected-access
+    assert len(wvd._pending_removals) == len(collect)
+    for key in collect:
+        assert key not in wvd
+        assert wvd.get(key) is None
+        with pytest.raises(KeyError):
+            wvd[key]  # pylint: disable=pointless-statement
+    assert list(wvd) == exp_keys
+    assert list(wvd.values()) == [values[key] for key in exp_keys]
+
+    # The items are removed together
+    assert len(wvd) == len(exp_keys)
+    assert not wvd._pending_removals
+    assert len(wvd._data) == len(exp_keys)
+    assert not hasattr(wvd, '__dict__')
+
+
+def test_WeakValueNocaseDict_iteration():
+    """
+    Test function for garbage collecting values while iterating through a
+    WeakValueNocaseDict.
+    """
+    values = [Obj('Dog'), Obj('Cat'), Obj('Cow')]
+    wvd = WeakValueNocaseDict((value.name, value) for value in values)
+
+    keys = []
+    for key, value in wvd.items():
+        keys.append(key)
+        if key == 'Dog':
+            del values[1:]  # Cat and Cow
+            gc.collect()
+            # The items are not removed during the iteration
+            assert len(wvd) == 1
+            wvd['DOG'] = value
+            assert len(wvd._data) == 3  # pylint: disable=protected-access
+    assert keys == ['Dog']
+    assert list(wvd) == ['DOG']
+
+    # After the iteration, the items are removed
+    assert len(wvd) == 1
+    assert len(wvd._data) == 1  # pylint: disable=protected-access
+
+    # An unfinished iteration does not prevent the removal of items after
+    # the iterator has been discarded
+    wvd['Cat'] = cat = Obj('Cat')
+    it = iter(wvd)
+    next(it)
+    del cat
+    gc.collect()
+    del it
+    assert len(wvd) == 1
+    assert list(wvd._data) == ['dog']  # pylint: disable=protected-access
+
+
+def test_WeakValueNocaseDict_batch():
+    """
+    Test function for removing the items whose values have been garbage
+    collected in batches when modifying a WeakValueNocaseDict.
+    """
+    # pylint: disable=protected-access
+    batch_size = nocasedict._weakvaluenocasedict.REMOVAL_BATCH_SIZE
+    wvd = WeakValueNocaseDict()
+    for i in range(batch_size):
+        wvd[f'Key{i}'] = Obj(i)  # Is garbage collected right away
+    gc.collect()
+
+    # pylint: disable=protected-access
+    assert len(wvd._pending_removals) == batch_size
+    assert len(wvd._data) == batch_size
+    assert not list(wvd)
+
+    wvd['Dog'] = dog = Obj('Dog')
+    assert not wvd._pending_removals
+    assert list(wvd._data) == ['dog']
+    assert list(wvd.values()) == [dog]
+
+
+def test_WeakValueNocaseDict_methods():
+    """
+    Test function for the methods of WeakValueNocaseDict.
+    """
+    dog, cat, cow = Obj('Dog'), Obj('Cat'), Obj('Cow')
+    wvd = WeakValueNocaseDict([('Dog', dog)], Cat=cat)
+    wvd.setdefault('Cow', cow)
+    assert wvd.setdefault('COW', dog) is cow
+
+    # Setting an item again whose value has been collected
+    del cow
+    gc.collect()
+    wvd['cow'] = cow = Obj('cow')
+    assert list(wvd.items()) == [('Dog', dog), ('Cat', cat), ('cow', cow)]
+
+    assert wvd.pop('CAT') is cat
+    assert wvd.pop('CAT', None) is None
+    with pytest.raises(KeyError):
+        wvd.pop('CAT')
+    with pytest.raises(KeyError):
+        del wvd['CAT']
+    del wvd['COW']
+    assert list(wvd) == ['Dog']
+
+    # popitem() skips the items whose values have been collected
+    wvd['Cat'] = Obj('Cat')
+    gc.collect()
+    assert wvd.popitem() == ('Dog', dog)
+    with pytest.raises(KeyError):
+        wvd.popitem()
+
+    wvd['Dog'] = dog
+    wvd.clear()
+    assert not wvd
+
+    # The internal dictionary is the one of the NocaseDict object
+    # pylint: disable=protected-access
+    assert wvd._dict._data is wvd._data
+    wvd.update(Dog=dog)
+    assert list(wvd._data) == ['dog']
+    del wvd['Dog']
+
+    with pytest.raises(TypeError):
+        wvd['Dog'] = 'string values do not support weak references'
+
+    # The dictionary can be garbage collected before its values
+    wvd['Dog'] = dog
+    del wvd
+    gc.collect()
+    del dog
+    gc.collect()
+
+
+def test_WeakValueNocaseDict_conversion():
+    """
+    Test function for comparing and converting WeakValueNocaseDict objects.
+    """
+    dog, cat = Obj('Dog'), Obj('Cat')
+    wvd = WeakValueNocaseDict(Dog=dog, Cat=cat)
+
+    assert wvd == NocaseDict(DOG=dog, cat=cat)
+    assert wvd == WeakValueNocaseDict(cat=cat, dog=dog)
+    assert wvd != dict(Dog=dog)
+
+    ncd = wvd.as_nocasedict()
+    assert isinstance(ncd, NocaseDict)
+    assert list(ncd.items()) == [('Dog', dog), ('Cat', cat)]
+
+    assert repr(wvd) == \
+        "WeakValueNocaseDict({'Dog': Obj('Dog'), 'Cat': Obj('Cat')})"
+
+    with pytest.raises(TypeError):
+        hash(wvd)